@@ -10,15 +10,93 @@ SPDX-License-Identifier: EPL-2.0
 Copyright Contributors to the Zowe Project.
 """
 
-from .config_file import ConfigFile
-from .connection import ApiConnection
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from . import exceptions, session_constants
 from .constants import constants
-from .credential_manager import CredentialManager
 from .exceptions import *
-from .logger import Log
-from .profile_manager import ProfileManager
-from .request_handler import RequestHandler
-from .sdk_api import SdkApi
-from .session import Session
 from .session_constants import *
-from .zosmf_profile import ZosmfProfile
+
+# Public classes are resolved on first access (PEP 562) so that importing the package
+# does not pull in requests, jsonschema, json5, deepmerge or the keyring extension.
+_LAZY_ATTRIBUTES = {
+    "ApiConnection": ".connection",
+    "ConfigFile": ".config_file",
+    "CredentialManager": ".credential_manager",
+    "FanOutExecutor": ".fan_out",
+    "HostResult": ".fan_out",
+    "Log": ".logger",
+    "ProfileManager": ".profile_manager",
+    "RequestHandler": ".request_handler",
+    "SdkApi": ".sdk_api",
+    "Session": ".session",
+    "TokenCache": ".token_cache",
+    "TokenManager": ".token_manager",
+    "ZosmfProfile": ".zosmf_profile",
+}
+
+# The exported exceptions and session constants are read from their modules, so that new ones are exported too
+__all__ = [
+    "constants",
+    *(
+        name
+        for name, value in vars(exceptions).items()
+        if isinstance(value, type) and issubclass(value, Exception) and value.__module__ == exceptions.__name__
+    ),
+    *(name for name in vars(session_constants) if name.isupper()),
+    *_LAZY_ATTRIBUTES,
+]
+
+if TYPE_CHECKING:
+    from .config_file import ConfigFile
+    from .connection import ApiConnection
+    from .credential_manager import CredentialManager
+    from .fan_out import FanOutExecutor, HostResult
+    from .logger import Log
+    from .profile_manager import ProfileManager
+    from .request_handler import RequestHandler
+    from .sdk_api import SdkApi
+    from .session import Session
+    from .token_cache import TokenCache
+    from .token_manager import TokenManager
+    from .zosmf_profile import ZosmfProfile
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a public class from its submodule the first time it is accessed.
+
+    Parameters
+    ----------
+    name: str
+        The name of the attribute being accessed
+
+    Returns
+    -------
+    Any
+        The requested class
+
+    Raises
+    ------
+    AttributeError
+        If the attribute is not a public member of the package
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    List the package attributes, including the lazily imported ones.
+
+    Returns
+    -------
+    list[str]
+        The sorted attribute names
+    """
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
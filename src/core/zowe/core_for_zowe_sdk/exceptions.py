@@ -61,6 +61,8 @@ class RequestFailed(Exception):
 
     def __init__(self, status_code: int, request_output: str):
         super().__init__("HTTP Request has failed with status code {}. \n {}".format(status_code, request_output))
+        self.status_code = status_code
+        self.request_output = request_output
 
 
 class FileNotFound(Exception):
@@ -146,3 +148,17 @@ class UnsupportedAuthType(Exception):
 
     def __init__(self, auth_type: str):
         super().__init__("Unsupported authentication type: {}".format(auth_type))
+
+
+class TokenLoginFailed(Exception):
+    """
+    Class used to represent a failure to obtain a token from the z/OSMF authentication service.
+
+    Parameters
+    ----------
+    token_type: str
+        The type of token that was requested
+    """
+
+    def __init__(self, token_type: str):
+        super().__init__("The z/OSMF authentication service did not return a {} token".format(token_type))
@@ -0,0 +1,274 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Union
+
+from .logger import Log
+
+if TYPE_CHECKING:
+    from .profile_manager import ProfileManager
+
+
+@dataclass
+class HostResult:
+    """Result of an SDK call on a single host."""
+
+    host: str
+    result: Any = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the call completed without an error."""
+        return self.error is None
+
+
+class FanOutExecutor:
+    """
+    Class used to run the same SDK call against many hosts concurrently.
+
+    Each host gets its own API object (e.g. `Jobs`, `Console` or `Datasets`), created from its profile
+    inside a worker thread, so the total time is bound by the slowest host instead of the sum of all hosts.
+
+    Parameters
+    ----------
+    profiles: Union[dict[str, dict[str, Any]], list[dict[str, Any]]]
+        Connection profiles keyed by a label (e.g. the profile name), or a list of profiles keyed by their host
+    max_workers: Optional[int]
+        Maximum number of hosts to query at the same time (default is one thread per host).
+        A host that timed out no longer counts, so it does not delay the hosts still queued
+    timeout: Optional[float]
+        Time limit, in seconds, for the call on each host, from the time it starts (default is None, i.e. no limit)
+
+    Raises
+    ------
+    ValueError
+        If a list of profiles contains a profile without a host or the same host twice
+    """
+
+    def __init__(
+        self,
+        profiles: Union[dict[str, dict[str, Any]], list[dict[str, Any]]],
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.__logger = Log.register_logger(__name__)
+        if isinstance(profiles, dict):
+            self.profiles = dict(profiles)
+        else:
+            self.profiles = {}
+            for profile in profiles:
+                host = profile.get("host")
+                if not isinstance(host, str) or host in self.profiles:
+                    self.__logger.error(f"Invalid or duplicate host in profile list: {host}")
+                    raise ValueError(f"Each profile must have a unique host, got: {host}")
+                self.profiles[host] = profile
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    @staticmethod
+    def from_profile_names(
+        profile_manager: "ProfileManager",
+        profile_names: list[str],
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        **load_options: Any,
+    ) -> "FanOutExecutor":
+        """
+        Create an executor from team config profiles.
+
+        Parameters
+        ----------
+        profile_manager: ProfileManager
+            The profile manager used to load the profiles
+        profile_names: list[str]
+            The names of the profiles to load, one per host
+        max_workers: Optional[int]
+            Maximum number of hosts to query at the same time (default is one thread per host)
+        timeout: Optional[float]
+            Time limit, in seconds, for the call on each host (default is None, i.e. no limit)
+        **load_options: Any
+            Additional arguments passed to `ProfileManager.load`
+
+        Returns
+        -------
+        FanOutExecutor
+            An executor whose results are keyed by profile name
+        """
+        profiles = {name: profile_manager.load(profile_name=name, **load_options) for name in profile_names}
+        return FanOutExecutor(profiles, max_workers=max_workers, timeout=timeout)
+
+    def as_completed(
+        self,
+        api_class: Callable[[dict[str, Any]], Any],
+        call: Callable[[Any], Any],
+        timeout: Optional[float] = None,
+    ) -> Iterator[HostResult]:
+        """
+        Run a call on every host and yield the results as they complete.
+
+        Parameters
+        ----------
+        api_class: Callable[[dict[str, Any]], Any]
+            The SDK API class (or any factory taking a profile) to create for each host, e.g. `Jobs`
+        call: Callable[[Any], Any]
+            The operation to run with the API object, e.g. `lambda jobs: jobs.list_jobs(owner="IBMUSER")`
+        timeout: Optional[float]
+            Time limit, in seconds, for the call on each host (default is the executor timeout)
+
+        Yields
+        ------
+        HostResult
+            The result or error of each host, in completion order.
+            Hosts exceeding the time limit are reported with a `TimeoutError`
+        """
+        timeout = self.timeout if timeout is None else timeout
+        max_workers = self.max_workers or max(len(self.profiles), 1)
+        queued = deque(self.profiles.items())
+        # Calls in progress, with their host and the time at which they started
+        running: dict["Future[HostResult]", tuple[str, float]] = {}
+        while queued or running:
+            while queued and len(running) < max_workers:
+                host, profile = queued.popleft()
+                running[self.__start(host, profile, api_class, call)] = (host, time.monotonic())
+            wait_time = None
+            if timeout is not None:
+                wait_time = max(0.0, min(start for _, start in running.values()) + timeout - time.monotonic())
+            done, _ = wait(running, timeout=wait_time, return_when=FIRST_COMPLETED)
+            for future in done:
+                del running[future]
+                yield future.result()
+            if timeout is None:
+                continue
+            now = time.monotonic()
+            for future, (host, start) in list(running.items()):
+                if now - start >= timeout:
+                    # The thread cannot be interrupted; it no longer counts towards max_workers
+                    # and its late result is discarded
+                    del running[future]
+                    self.__logger.error(f"Call on host {host} timed out after {timeout} seconds")
+                    yield HostResult(
+                        host,
+                        error=TimeoutError(f"Call on host {host} timed out after {timeout} seconds"),
+                        elapsed=now - start,
+                    )
+
+    def run(
+        self,
+        api_class: Callable[[dict[str, Any]], Any],
+        call: Callable[[Any], Any],
+        timeout: Optional[float] = None,
+    ) -> dict[str, HostResult]:
+        """
+        Run a call on every host and wait for all of them to complete or time out.
+
+        Parameters
+        ----------
+        api_class: Callable[[dict[str, Any]], Any]
+            The SDK API class (or any factory taking a profile) to create for each host, e.g. `Jobs`
+        call: Callable[[Any], Any]
+            The operation to run with the API object, e.g. `lambda jobs: jobs.list_jobs(owner="IBMUSER")`
+        timeout: Optional[float]
+            Time limit, in seconds, for the call on each host (default is the executor timeout)
+
+        Returns
+        -------
+        dict[str, HostResult]
+            The result or error of each host, keyed by host
+        """
+        return {result.host: result for result in self.as_completed(api_class, call, timeout)}
+
+    def __start(
+        self,
+        host: str,
+        profile: dict[str, Any],
+        api_class: Callable[[dict[str, Any]], Any],
+        call: Callable[[Any], Any],
+    ) -> "Future[HostResult]":
+        """
+        Start the call on a host in its own daemon thread.
+
+        A dedicated thread is used instead of a pool, so that a host that never answers does not hold a worker
+        needed by the hosts still queued, nor prevent the interpreter from exiting.
+
+        Parameters
+        ----------
+        host: str
+            The label of the host
+        profile: dict[str, Any]
+            The connection profile of the host
+        api_class: Callable[[dict[str, Any]], Any]
+            The SDK API class to create
+        call: Callable[[Any], Any]
+            The operation to run with the API object
+
+        Returns
+        -------
+        Future[HostResult]
+            The future resolving to the result of the call
+        """
+        future: "Future[HostResult]" = Future()
+        future.set_running_or_notify_cancel()
+
+        def target() -> None:
+            try:
+                future.set_result(self.__run_on_host(host, profile, api_class, call))
+            except BaseException as exc:
+                # Exceptions that are not errors of the call, e.g. SystemExit, are re-raised to the caller
+                future.set_exception(exc)
+
+        threading.Thread(target=target, name=f"zowe-fan-out-{host}", daemon=True).start()
+        return future
+
+    @staticmethod
+    def __run_on_host(
+        host: str,
+        profile: dict[str, Any],
+        api_class: Callable[[dict[str, Any]], Any],
+        call: Callable[[Any], Any],
+    ) -> HostResult:
+        """
+        Create the API object for a host and run the call with it.
+
+        Parameters
+        ----------
+        host: str
+            The label of the host
+        profile: dict[str, Any]
+            The connection profile of the host
+        api_class: Callable[[dict[str, Any]], Any]
+            The SDK API class to create
+        call: Callable[[Any], Any]
+            The operation to run with the API object
+
+        Returns
+        -------
+        HostResult
+            The result or error of the call
+        """
+        started = time.monotonic()
+        try:
+            api = api_class(profile)
+            if hasattr(api, "__exit__"):
+                with api:
+                    result = call(api)
+            else:
+                result = call(api)
+            return HostResult(host, result=result, elapsed=time.monotonic() - started)
+        except Exception as exc:
+            return HostResult(host, error=exc, elapsed=time.monotonic() - started)
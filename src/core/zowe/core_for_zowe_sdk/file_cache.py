@@ -0,0 +1,199 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Any, Iterable, Iterator, Optional
+
+from .logger import restrict_to_owner
+
+
+@contextmanager
+def atomic_write(
+    path: str, mode: str = "wb", encoding: Optional[str] = None, prefix: str = "", owner_only: bool = False
+) -> Iterator[IO[Any]]:
+    """
+    Open a temporary file that replaces a file once it is written, so that readers never see a partial file.
+
+    A reader that opened the previous version keeps reading it. The temporary file is removed if writing fails.
+
+    Parameters
+    ----------
+    path: str
+        Path of the file to replace
+    mode: str
+        Mode in which the temporary file is opened, "wb" or "w" (default is "wb")
+    encoding: Optional[str]
+        Encoding of the file in text mode (default is None)
+    prefix: str
+        Prefix of the name of the temporary file (default is "")
+    owner_only: bool
+        Restrict the file to owner-only access before it replaces the previous one (default is False)
+
+    Yields
+    ------
+    IO[Any]
+        The temporary file
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=prefix, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+        if owner_only:
+            restrict_to_owner(temp_path, 0o600)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+class FileCache:
+    """
+    Base class of the caches keeping files in a local directory shared between processes.
+
+    Files are replaced with `atomic_write`, so several processes can use the same directory without locking.
+    When the files grow over the maximum size, the least recently used entries, by the latest modification time
+    of their files, are removed with all their files.
+
+    Parameters
+    ----------
+    directory: str
+        The cache directory, created if needed
+    max_size: int
+        Maximum total size of the cached files, in bytes
+    suffixes: tuple[str, ...]
+        Name suffixes of the cached files, which are counted in the size and evicted, including index files
+
+    Raises
+    ------
+    ValueError
+        If `max_size` is lower than 1
+    """
+
+    def __init__(self, directory: str, max_size: int, suffixes: tuple[str, ...]):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.directory = directory
+        self.max_size = max_size
+        self._suffixes = suffixes
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """
+        Remove the least recently used files until the cache fits in its maximum size.
+
+        Parameters
+        ----------
+        keep: Optional[str]
+            Name of a file whose entry must not be removed, e.g. the one just stored
+        """
+        entries: dict[str, list[tuple[float, int, str]]] = {}
+        for name in os.listdir(self.directory):
+            if not name.endswith(self._suffixes):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.setdefault(self._entry(name), []).append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for files in entries.values() for _, size, _ in files)
+        keep_entry = None if keep is None else self._entry(keep)
+        for entry, files in sorted(entries.items(), key=lambda item: max(item[1])):
+            if total <= self.max_size:
+                break
+            if entry == keep_entry:
+                continue
+            for _, size, name in files:
+                if self._remove(os.path.join(self.directory, name)):
+                    total -= size
+
+    def clear(self) -> None:
+        """Remove all cached files."""
+        for name in os.listdir(self.directory):
+            if name.endswith(self._suffixes):
+                self._remove(os.path.join(self.directory, name))
+
+    def _entry(self, name: str) -> str:
+        """
+        Return the cache entry a file belongs to; the files of an entry are evicted together.
+
+        Parameters
+        ----------
+        name: str
+            Name of the file
+
+        Returns
+        -------
+        str
+            The entry, by default the file itself
+        """
+        return name
+
+    def _write(self, path: str, chunks: Iterable[bytes]) -> int:
+        """
+        Atomically write a file of the cache.
+
+        Parameters
+        ----------
+        path: str
+            Path of the file
+        chunks: Iterable[bytes]
+            The data
+
+        Returns
+        -------
+        int
+            The size of the file, in bytes
+        """
+        size = 0
+        with atomic_write(path) as f:
+            for chunk in chunks:
+                f.write(chunk)
+                size += len(chunk)
+        return size
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        """
+        Mark a file of the cache as used, so that it is evicted last.
+
+        Parameters
+        ----------
+        path: str
+            Path of the file
+        """
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        """
+        Remove a file of the cache if possible.
+
+        Parameters
+        ----------
+        path: str
+            Path of the file
+
+        Returns
+        -------
+        bool
+            True if the file was removed, False if it was already removed or is in use (on Windows)
+        """
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
@@ -10,12 +10,18 @@ SPDX-License-Identifier: EPL-2.0
 Copyright Contributors to the Zowe Project.
 """
 
+import atexit
 import logging
 import os
+import queue
 import subprocess
 import sys
+import threading
 import getpass
-from typing import Any
+import weakref
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
 
 
 def restrict_to_owner(path: str, mode: int) -> None:
@@ -42,6 +48,158 @@ def restrict_to_owner(path: str, mode: int) -> None:
         os.chmod(path, mode)
 
 
+class OwnerOnlyFileHandler(logging.FileHandler):
+    """
+    Class used to represent a log file handler that defers all file system access until the first record.
+
+    The log directory and file are created and restricted to owner-only access right before the file is opened.
+
+    Parameters
+    ----------
+    filename: str
+        Path of the log file
+    """
+
+    def __init__(self, filename: str):
+        super().__init__(filename, delay=True)
+
+    def _open(self) -> Any:
+        """
+        Create the log directory and file with owner-only access, then open the file.
+
+        Returns
+        -------
+        Any
+            The opened log file stream
+        """
+        dirname = os.path.dirname(self.baseFilename)
+        os.makedirs(dirname, mode=0o700, exist_ok=True)
+        restrict_to_owner(dirname, 0o700)
+        os.close(os.open(self.baseFilename, os.O_CREAT | os.O_APPEND, 0o600))
+        restrict_to_owner(self.baseFilename, 0o600)
+        return super()._open()
+
+
+class BackgroundQueueHandler(QueueHandler):
+    """
+    Class used to represent a log handler that hands records over to a background writer thread.
+
+    Records are put on an in-memory queue and written by the target handler from a `QueueListener`
+    thread, so callers never block on file I/O. The thread is started with the first record.
+    A forked child process starts its own writer thread with an empty queue, because the parent's
+    thread does not exist in the child.
+
+    Parameters
+    ----------
+    target: logging.Handler
+        The handler that writes the queued records
+    """
+
+    def __init__(self, target: logging.Handler):
+        super().__init__(queue.Queue())
+        self.target = target
+        self.__listener: Optional[QueueListener] = None
+        self.__lock = threading.Lock()
+        if hasattr(os, "register_at_fork"):
+            handler = weakref.ref(self)
+            os.register_at_fork(after_in_child=lambda: handler() and handler().__reset_after_fork())
+
+    def __reset_after_fork(self) -> None:
+        """Drop the writer thread, queue and lock inherited from the parent process."""
+        self.queue = queue.Queue()
+        self.__listener = None
+        self.__lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Queue a record, starting the background writer if it is not running yet.
+
+        Parameters
+        ----------
+        record: logging.LogRecord
+            The record to be written
+        """
+        if self.__listener is None:
+            with self.__lock:
+                if self.__listener is None:
+                    self.__listener = QueueListener(self.queue, self.target)
+                    self.__listener.start()
+                    atexit.register(self.stop)
+        super().enqueue(record)
+
+    def flush(self) -> None:
+        """Wait until every queued record has been written."""
+        if self.__listener is not None:
+            self.queue.join()
+            self.target.flush()
+
+    def stop(self) -> None:
+        """Write the remaining records and stop the background writer."""
+        with self.__lock:
+            if self.__listener is not None:
+                self.__listener.stop()
+                self.__listener = None
+                self.target.flush()
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Class used to represent a filter that lets through one in every `rate` records of each call site.
+
+    Records are counted per logging call site, so each high-frequency message is sampled independently
+    even when its text changes. Only the `max_sites` most recently seen call sites are counted.
+    Records above `level` are never dropped.
+
+    Parameters
+    ----------
+    rate: int
+        Keep one record out of every `rate` records of the same message
+    level: int
+        The highest level that is sampled
+    max_sites: int
+        The number of call sites whose counts are kept
+
+    Raises
+    ------
+    ValueError
+        If the sampling rate is lower than 1
+    """
+
+    def __init__(self, rate: int, level: int = logging.DEBUG, max_sites: int = 1024):
+        super().__init__()
+        if rate < 1:
+            raise ValueError("Sampling rate must be a positive integer")
+        self.rate = rate
+        self.level = level
+        self.max_sites = max_sites
+        self.__counts: OrderedDict[Any, int] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Decide whether the record should be logged.
+
+        Parameters
+        ----------
+        record: logging.LogRecord
+            The record to be checked
+
+        Returns
+        -------
+        bool
+            True if the record should be logged
+        """
+        if record.levelno > self.level:
+            return True
+        key = (record.pathname, record.lineno, record.levelno)
+        with self.__lock:
+            count = self.__counts.pop(key, 0)
+            self.__counts[key] = count + 1
+            if len(self.__counts) > self.max_sites:
+                self.__counts.popitem(last=False)
+        return count % self.rate == 0
+
+
 class Log:
     """
     Class used to represent a logger.
@@ -50,8 +208,10 @@ class Log:
     ----------
     dirname: str
         Path where the log file is saved
-    file_handler: logging.FileHandler
-        Shared FileHandler object for managing log file output
+    file_writer: logging.FileHandler
+        Shared FileHandler object that writes the log file, which is created on the first record
+    file_handler: logging.Handler
+        Shared QueueHandler object for managing log file output, which writes through `file_writer` in the background
     console_handler: logging.StreamHandler
         Shared StreamHandler object for managing log console output
     file_output: bool
@@ -63,18 +223,15 @@ class Log:
     """
 
     dirname: str = os.path.join(os.path.expanduser("~"), ".zowe/logs")
-    os.makedirs(dirname, mode=0o700, exist_ok=True)
-    restrict_to_owner(dirname, 0o700)
     __log_filename: str = os.path.join(dirname, "python_sdk_logs.log")
 
-    __log_fd = os.open(__log_filename, os.O_CREAT | os.O_APPEND, 0o600)
-    os.close(__log_fd)
-    restrict_to_owner(__log_filename, 0o600)
-    file_handler: logging.FileHandler = logging.FileHandler(__log_filename)
-    file_handler.setLevel(logging.INFO)
-    file_handler.setFormatter(
+    # The log directory and file are only created once the first record is written
+    file_writer: logging.FileHandler = OwnerOnlyFileHandler(__log_filename)
+    file_writer.setFormatter(
         logging.Formatter("[%(asctime)s] [%(levelname)s] [%(name)s] - %(message)s", "%m/%d/%Y %I:%M:%S %p")
     )
+    file_handler: logging.Handler = BackgroundQueueHandler(file_writer)
+    file_handler.setLevel(logging.INFO)
     console_handler: logging.StreamHandler = logging.StreamHandler()  # pylint: disable=unsubscriptable-object
 
     file_output: bool = True
@@ -121,6 +278,30 @@ class Log:
             for handler in logger.handlers:
                 handler.setLevel(level)
 
+    @staticmethod
+    def set_sampling(logger: logging.Logger, rate: int, level: int = logging.DEBUG) -> None:
+        """
+        Only log one in every `rate` records of each high-frequency message of a logger.
+
+        Parameters
+        ----------
+        logger: logging.Logger
+            The logger to be sampled
+        rate: int
+            Keep one record out of every `rate` records of the same message; 1 turns sampling off
+        level: int
+            The highest level that is sampled (default is DEBUG)
+        """
+        for log_filter in [f for f in logger.filters if isinstance(f, SamplingFilter)]:
+            logger.removeFilter(log_filter)
+        if rate > 1:
+            logger.addFilter(SamplingFilter(rate, level))
+
+    @staticmethod
+    def flush() -> None:
+        """Wait until every pending record has been written to the log file."""
+        Log.file_handler.flush()
+
     @staticmethod
     def close(logger: logging.Logger) -> None:
         """
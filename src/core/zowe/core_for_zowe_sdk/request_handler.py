@@ -11,7 +11,8 @@ Copyright Contributors to the Zowe Project.
 """
 
 import copy
-from typing import Union, Any
+import threading
+from typing import Any, Callable, Optional, Union
 from requests import Response
 
 import requests
@@ -45,10 +46,36 @@ def _redact_request_arguments(request_arguments: dict[str, Any]) -> dict[str, An
     return safe_arguments
 
 
+def _is_replayable(request_arguments: dict[str, Any]) -> bool:
+    """Return whether the body of a request can be sent again, i.e. it is not a stream, file or generator."""
+    if request_arguments.get("files"):
+        return False
+    data = request_arguments.get("data")
+    return data is None or isinstance(data, (bytes, str, dict))
+
+
+class _RedactedArguments:
+    """Defer redacting request arguments until a log record actually renders them."""
+
+    __slots__ = ("request_arguments",)
+
+    def __init__(self, request_arguments: dict[str, Any]):
+        self.request_arguments = request_arguments
+
+    def __str__(self) -> str:
+        """Return the redacted request arguments as a string."""
+        return str(_redact_request_arguments(self.request_arguments))
+
+
 class RequestHandler:
     """
     Class used to handle HTTP/HTTPS requests.
 
+    When `on_unauthorized` is set, it is called with the request arguments of a request rejected with
+    status code 401. If it returns True, the request is sent once more with the updated arguments.
+    Requests whose body is a stream, file or generator are not sent again, since the first attempt
+    consumed the body.
+
     Parameters
     ----------
     session_arguments: dict[str, Any]
@@ -60,9 +87,32 @@ class RequestHandler:
     def __init__(self, session_arguments: dict[str, Any], logger_name: str = __name__):
         self.session = requests.Session()
         self.session_arguments = session_arguments
+        self.on_unauthorized: Optional[Callable[[dict[str, Any]], bool]] = None
         self.__valid_methods = ["GET", "POST", "PUT", "DELETE"]
         self.__handle_ssl_warnings()
+        self.__logger_name = logger_name
         self.__logger = Log.register_logger(logger_name)
+        self.__threads = threading.local()
+
+    def for_current_thread(self) -> "RequestHandler":
+        """
+        Return a request handler owned by the calling thread, with the same session arguments.
+
+        A request handler keeps the state of the request in progress, so threads sending requests at the
+        same time each need their own. The handler of a thread is created on first use and then reused,
+        together with its connections, and it shares the `on_unauthorized` callback of this handler.
+
+        Returns
+        -------
+        RequestHandler
+            The request handler of the calling thread
+        """
+        request_handler = getattr(self.__threads, "request_handler", None)
+        if request_handler is None:
+            request_handler = RequestHandler(self.session_arguments, logger_name=self.__logger_name)
+            self.__threads.request_handler = request_handler
+        request_handler.on_unauthorized = self.on_unauthorized
+        return request_handler
 
     def __handle_ssl_warnings(self) -> None:
         """Turn off warnings if the SSL verification argument if off."""
@@ -93,13 +143,23 @@ class RequestHandler:
         self.__method = method
         self.__request_arguments = request_arguments
         self.__expected_code = expected_code
+        # Formatted by the logger only when DEBUG records are emitted
         self.__logger.debug(
-            f"Request method: {self.__method}, "
-            f"Request arguments: {_redact_request_arguments(self.__request_arguments)}, "
-            f"Expected code: {expected_code}"
+            "Request method: %s, Request arguments: %s, Expected code: %s",
+            self.__method,
+            _RedactedArguments(self.__request_arguments),
+            expected_code,
         )
         self.__validate_method()
         self.__send_request(stream=stream)
+        if (
+            self.__response.status_code == 401
+            and self.on_unauthorized is not None
+            and _is_replayable(self.__request_arguments)
+            and self.on_unauthorized(self.__request_arguments)
+        ):
+            self.__response.close()
+            self.__send_request(stream=stream)
         self.__validate_response()
         if stream:
             return self.__response
@@ -11,12 +11,14 @@ Copyright Contributors to the Zowe Project.
 """
 
 import copy
+import threading
 import urllib
 
 from . import session_constants
 from .logger import Log
 from .request_handler import RequestHandler
 from .session import ISession, Session
+from .token_manager import TokenManager
 from typing import Any, Optional, Type
 
 
@@ -68,6 +70,19 @@ class SdkApi:
         elif self.session.type == session_constants.AUTH_TYPE_BEARER:
             self._default_headers["Authorization"] = f"Bearer {self.session.token_value}"
         elif self.session.type == session_constants.AUTH_TYPE_TOKEN:
+            if self.session.user is not None and self.session.password is not None:
+                # Reuse the token shared by all API objects of this connection and replace it once rejected
+                self.__host_url = session.host_url
+                self.__token_lock = threading.Lock()
+                if self.session.token_value is None:
+                    self.session.token_value = TokenManager.get_token(
+                        self.__host_url,
+                        self.session.user,
+                        self.session.password,
+                        str(self.session.token_type),
+                        self.__session_arguments,
+                    )
+                self.request_handler.on_unauthorized = self.__refresh_token
             self._default_headers["Cookie"] = f"{self.session.token_type}={self.session.token_value}"
         elif self.session.type == session_constants.AUTH_TYPE_CERT_PEM:
             cert: Optional[tuple[str, str]] = self.session.cert
@@ -83,6 +98,54 @@ class SdkApi:
         """Delete the request handler before exit."""
         del self.request_handler
 
+    def __refresh_token(self, request_arguments: dict[str, Any]) -> bool:
+        """
+        Replace the rejected token of the session and of the failed request.
+
+        Requests sent concurrently may be rejected together: only the first refresh logs in again, and the
+        others reuse its token.
+
+        Parameters
+        ----------
+        request_arguments: dict[str, Any]
+            The arguments of the request that was rejected
+
+        Returns
+        -------
+        bool
+            True, so that the request is sent again with the new token
+        """
+        headers = request_arguments.setdefault("headers", {})
+        with self.__token_lock:
+            cookie = f"{self.session.token_type}={self.session.token_value}"
+            if headers.get("Cookie") in (None, cookie):
+                self.session.token_value = TokenManager.refresh_token(
+                    self.__host_url,
+                    str(self.session.user),
+                    str(self.session.password),
+                    str(self.session.token_type),
+                    self.session.token_value,
+                    self.__session_arguments,
+                )
+                cookie = f"{self.session.token_type}={self.session.token_value}"
+                self._default_headers["Cookie"] = cookie
+        headers["Cookie"] = cookie
+        return True
+
+    def logout(self) -> None:
+        """
+        Log out of z/OSMF if the session logged in with the `autoLogin` property.
+
+        Later requests are sent without a token, so the first one that is rejected logs in again.
+        """
+        if self.session.type == session_constants.AUTH_TYPE_TOKEN and self.session.user is not None:
+            TokenManager.logout(
+                self.__host_url, self.session.user, str(self.session.token_type), self.__session_arguments
+            )
+            with self.__token_lock:
+                self.session.token_value = None
+                self._default_headers.pop("Cookie", None)
+
     def _create_custom_request_arguments(self) -> dict[str, Any]:
         """
         Create a copy of the default request arguments dictionary.
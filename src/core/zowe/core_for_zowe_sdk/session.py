@@ -38,6 +38,10 @@ class Session:
     """
     Class used to set connection details received from a ProfileManager or manually set by passing and ISession object.
 
+    When the `autoLogin` property is set along with `user` and `password`, the session uses token authentication:
+    API objects log in once to obtain a token of type `tokenType` (LtpaToken2 by default) and log in again
+    when the token is rejected.
+
     Parameters
     ----------
     props : dict[str, Any]
@@ -63,7 +67,14 @@ class Session:
             raise ValueError("Host must be supplied")
 
         # determine authentication type
-        if props.get("user") is not None and props.get("password") is not None:
+        if props.get("autoLogin") and props.get("user") is not None and props.get("password") is not None:
+            # Log in once with the credentials and authenticate with the returned token
+            self.session.user = props.get("user")
+            self.session.password = props.get("password")
+            self.session.token_type = props.get("tokenType") or session_constants.DEFAULT_TOKEN_TYPE
+            self.session.token_value = props.get("tokenValue")
+            self.session.type = session_constants.AUTH_TYPE_TOKEN
+        elif props.get("user") is not None and props.get("password") is not None:
             self.session.user = props.get("user")
             self.session.password = props.get("password")
             self.session.reject_unauthorized = bool(props.get("rejectUnauthorized"))
@@ -32,6 +32,12 @@ AUTH_TYPE_TOKEN = "token"
 AUTH_TYPE_CERT_PEM = "cert-pem"
 
 
+# Token type requested when logging in to z/OSMF with the autoLogin profile property
+DEFAULT_TOKEN_TYPE = "LtpaToken2"
+
+# z/OSMF authentication service used to log in and out
+ZOSMF_AUTH_ENDPOINT = "/zosmf/services/authenticate"
+
 # https protocol defaults
 DEFAULT_HTTPS_PORT = 443
 HTTPS_PROTOCOL = "https"
@@ -0,0 +1,34 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+def thread_pool(max_workers: int, tasks: int, thread_name_prefix: str = "") -> ThreadPoolExecutor:
+    """
+    Create a thread pool without more threads than tasks.
+
+    Parameters
+    ----------
+    max_workers: int
+        Maximum number of threads
+    tasks: int
+        Number of tasks known to be run by the pool
+    thread_name_prefix: str
+        Prefix of the names of the threads
+
+    Returns
+    -------
+    ThreadPoolExecutor
+        The thread pool, with at least one thread
+    """
+    return ThreadPoolExecutor(max_workers=min(max_workers, max(tasks, 1)), thread_name_prefix=thread_name_prefix)
@@ -0,0 +1,259 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import base64
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from .file_cache import atomic_write
+from .logger import Log, restrict_to_owner
+
+
+def _lock_file(fd: int) -> None:
+    """
+    Wait for an exclusive lock on an open file.
+
+    Parameters
+    ----------
+    fd: int
+        The file descriptor
+    """
+    if sys.platform == "win32":
+        import msvcrt  # pylint: disable=import-outside-toplevel
+
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                # LK_LOCK gives up after 10 seconds; keep waiting for the other process
+                continue
+    import fcntl  # pylint: disable=import-outside-toplevel
+
+    fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+def _unlock_file(fd: int) -> None:
+    """
+    Release the lock taken by `_lock_file`.
+
+    Parameters
+    ----------
+    fd: int
+        The file descriptor
+    """
+    if sys.platform == "win32":
+        import msvcrt  # pylint: disable=import-outside-toplevel
+
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        return
+    import fcntl  # pylint: disable=import-outside-toplevel
+
+    fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def token_expiry(token_value: str, default_ttl: float) -> float:
+    """
+    Return the time at which a token expires.
+
+    JSON Web Tokens carry their own expiry (the "exp" claim); other tokens such as LTPA tokens are opaque,
+    so they are assumed to expire `default_ttl` seconds from now.
+
+    Parameters
+    ----------
+    token_value: str
+        The token
+    default_ttl: float
+        Lifetime, in seconds, of tokens that do not carry an expiry
+
+    Returns
+    -------
+    float
+        The expiry as seconds since the epoch
+    """
+    default_expiry = time.time() + default_ttl
+    segments = token_value.split(".")
+    if len(segments) != 3:
+        return default_expiry
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(segments[1] + "=" * (-len(segments[1]) % 4)))
+        return min(float(payload["exp"]), default_expiry)
+    except (ValueError, KeyError, TypeError):
+        return default_expiry
+
+
+class TokenCache:
+    """
+    Class used to share z/OSMF tokens between processes through an owner-only file.
+
+    Entries are keyed by host URL, user and token type and expire after `ttl` seconds (or earlier for
+    JSON Web Tokens that expire sooner). Access is serialized with an exclusive file lock, which
+    `TokenManager` holds while logging in so that concurrent processes wait for a single login.
+
+    Parameters
+    ----------
+    path: Optional[str]
+        Path of the cache file (default is "~/.zowe/tokens/python_sdk_tokens.json")
+    ttl: float
+        Lifetime, in seconds, of cached tokens (default is 3600)
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = 3600):
+        self.path = path or os.path.join(os.path.expanduser("~"), ".zowe", "tokens", "python_sdk_tokens.json")
+        self.ttl = ttl
+        self.__logger = Log.register_logger(__name__)
+
+    @staticmethod
+    def __key(host_url: str, user: str, token_type: str) -> str:
+        """
+        Build the cache key of a connection.
+
+        Parameters
+        ----------
+        host_url: str
+            The formatted host URL of the z/OSMF instance
+        user: str
+            The user the token belongs to
+        token_type: str
+            The name of the token cookie
+
+        Returns
+        -------
+        str
+            The cache key
+        """
+        return f"{token_type}|{user}|{host_url}"
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        Hold an exclusive lock on the cache file across processes.
+
+        Yields
+        ------
+        None
+            Control while the lock is held
+        """
+        dirname = os.path.dirname(self.path)
+        os.makedirs(dirname, mode=0o700, exist_ok=True)
+        restrict_to_owner(dirname, 0o700)
+        fd = os.open(self.path + ".lock", os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            _lock_file(fd)
+            yield
+        finally:
+            _unlock_file(fd)
+            os.close(fd)
+
+    def get(self, host_url: str, user: str, token_type: str) -> Optional[str]:
+        """
+        Return a cached token that has not expired yet.
+
+        Call this while holding `lock()` when the result decides whether to log in.
+
+        Parameters
+        ----------
+        host_url: str
+            The formatted host URL of the z/OSMF instance
+        user: str
+            The user the token belongs to
+        token_type: str
+            The name of the token cookie
+
+        Returns
+        -------
+        Optional[str]
+            The token, or None if there is no valid cached token
+        """
+        entry = self.__read().get(self.__key(host_url, user, token_type))
+        if entry is None or entry["expires"] <= time.time():
+            return None
+        return str(entry["tokenValue"])
+
+    def set(self, host_url: str, user: str, token_type: str, token_value: str) -> None:
+        """
+        Store a token, dropping expired entries. Call this while holding `lock()`.
+
+        Parameters
+        ----------
+        host_url: str
+            The formatted host URL of the z/OSMF instance
+        user: str
+            The user the token belongs to
+        token_type: str
+            The name of the token cookie
+        token_value: str
+            The token
+        """
+        entries = self.__read()
+        entries[self.__key(host_url, user, token_type)] = {
+            "tokenValue": token_value,
+            "expires": token_expiry(token_value, self.ttl),
+        }
+        self.__write(entries)
+
+    def delete(self, host_url: str, user: str, token_type: str) -> None:
+        """
+        Remove a token from the cache. Call this while holding `lock()`.
+
+        Parameters
+        ----------
+        host_url: str
+            The formatted host URL of the z/OSMF instance
+        user: str
+            The user the token belongs to
+        token_type: str
+            The name of the token cookie
+        """
+        entries = self.__read()
+        if entries.pop(self.__key(host_url, user, token_type), None) is not None:
+            self.__write(entries)
+
+    def __read(self) -> dict[str, Any]:
+        """
+        Read all cache entries.
+
+        Returns
+        -------
+        dict[str, Any]
+            The cache entries, or an empty dictionary if the file is missing or unreadable
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            self.__logger.warning(f"Ignoring unreadable token cache {self.path}: {exc}")
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def __write(self, entries: dict[str, Any]) -> None:
+        """
+        Atomically replace the cache file with the unexpired entries.
+
+        Parameters
+        ----------
+        entries: dict[str, Any]
+            The cache entries
+        """
+        now = time.time()
+        entries = {key: entry for key, entry in entries.items() if entry.get("expires", 0) > now}
+        with atomic_write(self.path, "w", encoding="utf-8", prefix=".tokens-", owner_only=True) as f:
+            json.dump(entries, f)
+        if sys.platform == "win32":
+            restrict_to_owner(self.path, 0o600)
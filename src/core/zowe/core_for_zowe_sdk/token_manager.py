@@ -0,0 +1,239 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import threading
+from typing import Any, Optional
+
+from requests import Response
+
+from . import session_constants
+from .exceptions import TokenLoginFailed
+from .logger import Log
+from .request_handler import RequestHandler
+from .token_cache import TokenCache
+
+
+class TokenManager:
+    """
+    A class including static functions for logging in to z/OSMF and sharing the resulting tokens.
+
+    Tokens are kept per host, user and token type, so every API object created for the same connection
+    reuses a single login instead of authenticating each request with the user and password.
+    When a `TokenCache` is set with `set_cache`, tokens are also shared with other processes.
+    """
+
+    tokens: dict[tuple[str, str, str], str] = {}
+    cache: Optional[TokenCache] = None
+    __lock = threading.Lock()
+    __connection_locks: dict[tuple[str, str, str], threading.Lock] = {}
+    __logger = Log.register_logger(__name__)
+
+    @staticmethod
+    def __connection_lock(key: tuple[str, str, str]) -> threading.Lock:
+        """
+        Return the lock that serializes logins for one connection, so that different hosts log in concurrently.
+
+        Parameters
+        ----------
+        key: tuple[str, str, str]
+            The host URL, user and token type of the connection
+
+        Returns
+        -------
+        threading.Lock
+            The lock of the connection
+        """
+        with TokenManager.__lock:
+            return TokenManager.__connection_locks.setdefault(key, threading.Lock())
+
+    @staticmethod
+    def set_cache(cache: Optional[TokenCache]) -> None:
+        """
+        Share tokens with other processes through a token cache.
+
+        Parameters
+        ----------
+        cache: Optional[TokenCache]
+            The token cache to use, or None to keep tokens in this process only
+        """
+        TokenManager.cache = cache
+
+    @staticmethod
+    def login(host_url: str, user: str, password: str, token_type: str, session_arguments: dict[str, Any]) -> str:
+        """
+        Log in to the z/OSMF authentication service and return a new token.
+
+        Parameters
+        ----------
+        host_url: str
+            The formatted host URL of the z/OSMF instance
+        user: str
+            The user to log in with
+        password: str
+            The password of the user
+        token_type: str
+            The name of the token cookie to return (e.g. "LtpaToken2" or "jwtToken")
+        session_arguments: dict[str, Any]
+            Zowe SDK session arguments (e.g. "verify" and "timeout")
+
+        Raises
+        ------
+        TokenLoginFailed
+            If the authentication service does not return a token of the given type
+
+        Returns
+        -------
+        str
+            The token value
+        """
+        request_handler = RequestHandler(session_arguments, logger_name=__name__)
+        request_arguments = {
+            "url": host_url + session_constants.ZOSMF_AUTH_ENDPOINT,
+            "auth": (user, password),
+            "headers": {"X-CSRF-ZOSMF-HEADER": ""},
+        }
+        response: Response = request_handler.perform_request(
+            "POST", request_arguments, expected_code=[200, 204], stream=True
+        )
+        token_value = response.cookies.get(token_type)
+        response.close()
+        if not token_value:
+            TokenManager.__logger.error(f"The z/OSMF authentication service did not return a {token_type} token")
+            raise TokenLoginFailed(token_type)
+        TokenManager.tokens[(host_url, user, token_type)] = token_value
+        return token_value
+
+    @staticmethod
+    def get_token(host_url: str, user: str, password: str, token_type: str, session_arguments: dict[str, Any]) -> str:
+        """
+        Return the shared token for a connection, logging in only if there is none yet.
+
+        Parameters
+        ----------
+        host_url: str
+            The formatted host URL of the z/OSMF instance
+        user: str
+            The user to log in with
+        password: str
+            The password of the user
+        token_type: str
+            The name of the token cookie (e.g. "LtpaToken2" or "jwtToken")
+        session_arguments: dict[str, Any]
+            Zowe SDK session arguments (e.g. "verify" and "timeout")
+
+        Returns
+        -------
+        str
+            The token value
+        """
+        with TokenManager.__connection_lock((host_url, user, token_type)):
+            token_value = TokenManager.tokens.get((host_url, user, token_type))
+            if token_value is not None:
+                return token_value
+            cache = TokenManager.cache
+            if cache is None:
+                return TokenManager.login(host_url, user, password, token_type, session_arguments)
+            # Other processes wait on the file lock for this login instead of logging in themselves
+            with cache.lock():
+                token_value = cache.get(host_url, user, token_type)
+                if token_value is None:
+                    token_value = TokenManager.login(host_url, user, password, token_type, session_arguments)
+                    cache.set(host_url, user, token_type, token_value)
+                TokenManager.tokens[(host_url, user, token_type)] = token_value
+            return token_value
+
+    @staticmethod
+    def refresh_token(
+        host_url: str,
+        user: str,
+        password: str,
+        token_type: str,
+        stale_token: Optional[str],
+        session_arguments: dict[str, Any],
+    ) -> str:
+        """
+        Replace a token rejected by z/OSMF, logging in again only if no other API object has done so already.
+
+        Parameters
+        ----------
+        host_url: str
+            The formatted host URL of the z/OSMF instance
+        user: str
+            The user to log in with
+        password: str
+            The password of the user
+        token_type: str
+            The name of the token cookie (e.g. "LtpaToken2" or "jwtToken")
+        stale_token: Optional[str]
+            The token that was rejected
+        session_arguments: dict[str, Any]
+            Zowe SDK session arguments (e.g. "verify" and "timeout")
+
+        Returns
+        -------
+        str
+            The new token value
+        """
+        with TokenManager.__connection_lock((host_url, user, token_type)):
+            token_value = TokenManager.tokens.get((host_url, user, token_type))
+            if token_value is not None and token_value != stale_token:
+                return token_value
+            cache = TokenManager.cache
+            if cache is None:
+                TokenManager.__logger.info(f"Token for {user} on {host_url} was rejected; logging in again")
+                return TokenManager.login(host_url, user, password, token_type, session_arguments)
+            with cache.lock():
+                token_value = cache.get(host_url, user, token_type)
+                if token_value is None or token_value == stale_token:
+                    TokenManager.__logger.info(f"Token for {user} on {host_url} was rejected; logging in again")
+                    token_value = TokenManager.login(host_url, user, password, token_type, session_arguments)
+                    cache.set(host_url, user, token_type, token_value)
+                TokenManager.tokens[(host_url, user, token_type)] = token_value
+            return token_value
+
+    @staticmethod
+    def logout(host_url: str, user: str, token_type: str, session_arguments: dict[str, Any]) -> None:
+        """
+        Log out of the z/OSMF authentication service and forget the shared token.
+
+        Parameters
+        ----------
+        host_url: str
+            The formatted host URL of the z/OSMF instance
+        user: str
+            The user the token belongs to
+        token_type: str
+            The name of the token cookie (e.g. "LtpaToken2" or "jwtToken")
+        session_arguments: dict[str, Any]
+            Zowe SDK session arguments (e.g. "verify" and "timeout")
+        """
+        with TokenManager.__lock:
+            token_value = TokenManager.tokens.pop((host_url, user, token_type), None)
+        cache = TokenManager.cache
+        if cache is not None:
+            with cache.lock():
+                token_value = token_value or cache.get(host_url, user, token_type)
+                cache.delete(host_url, user, token_type)
+        if token_value is None:
+            return
+        request_handler = RequestHandler(session_arguments, logger_name=__name__)
+        request_arguments = {
+            "url": host_url + session_constants.ZOSMF_AUTH_ENDPOINT,
+            "headers": {"X-CSRF-ZOSMF-HEADER": "", "Cookie": f"{token_type}={token_value}"},
+        }
+        request_handler.perform_request("DELETE", request_arguments, expected_code=[200, 204])
+
+    @staticmethod
+    def clear() -> None:
+        """Forget all tokens of this process without logging out. The token cache is left untouched."""
+        with TokenManager.__lock:
+            TokenManager.tokens.clear()
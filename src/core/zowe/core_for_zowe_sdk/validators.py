@@ -13,10 +13,6 @@ Copyright Contributors to the Zowe Project.
 import os
 from typing import Union, Any
 
-import json5
-import requests
-from jsonschema import validate
-
 
 def validate_config_json(path_config_json: Union[str, dict[str, Any]], path_schema_json: str, cwd: str) -> None:
     """
@@ -31,6 +27,11 @@ def validate_config_json(path_config_json: Union[str, dict[str, Any]], path_sche
     cwd: str
         Path of the current working directory
     """
+    # Deferred so that the path helpers below can be imported without these dependencies
+    import json5
+    import requests
+    from jsonschema import validate
+
     # checks if the path_schema_json point to an internet URI and download the schema using the URI
     if path_schema_json.startswith("https://") or path_schema_json.startswith("http://"):
         schema_json = requests.get(path_schema_json).json()
@@ -34,5 +34,6 @@ setup(
         "License :: OSI Approved :: Eclipse Public License 2.0 (EPL-2.0)",
     ],
     install_requires=[resolve_sdk_dep("core", "~=" + __version__)],
+    extras_require={"numpy": ["numpy>=1.23"]},
     packages=find_namespace_packages(include=["zowe.*"]),
 )
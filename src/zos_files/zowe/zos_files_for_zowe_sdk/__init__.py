@@ -12,7 +12,14 @@ Copyright Contributors to the Zowe Project.
 
 from . import constants, exceptions
 from .api import BaseFilesApi
+from .cache import DatasetCache
+from .catalog import CatalogIndex
+from .copybook import Copybook, CopybookDecoder
 from .datasets import DatasetOption, Datasets
+from .ebcdic import EbcdicCodec
 from .file_system import FileSystems
 from .files import Files
+from .hsm import HsmBatch, HsmResult, HsmStatus, PrefetchResult, RecallPrefetch
+from .records import RecordReader
+from .tag_cache import USSTagCache
 from .uss import USSFiles
@@ -0,0 +1,235 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+from dataclasses import asdict, dataclass
+from typing import Iterable, Optional, Union
+
+from zowe.core_for_zowe_sdk.file_cache import FileCache, atomic_write
+
+from .constants import zos_file_constants
+
+
+@dataclass
+class CacheEntry:
+    """Cached copy of a data set, stored in an index file next to the data."""
+
+    dataset: str
+    mode: str
+    etag: str
+    data: str
+    size: int
+
+
+class DatasetCache(FileCache):
+    """
+    Class used to keep downloaded data sets in a local directory shared between processes.
+
+    Each data set is cached with the ETag z/OSMF returned for it, so that a download can ask z/OSMF whether the
+    data set changed instead of retrieving it again. Cached data is read through read-only memory maps, so that
+    processes reading the same data set share the pages of the operating system file cache instead of each holding
+    a copy, and a reader keeps the version it mapped even if another process stores a newer one. When the cache
+    grows over its maximum size, the least recently used data sets are removed together with their index files.
+
+    Parameters
+    ----------
+    directory: str
+        The cache directory, created if needed
+    max_size: int
+        Maximum total size of the cached data and index files, in bytes, at least 1 (default is 10 GiB)
+    """
+
+    def __init__(self, directory: str, max_size: int = zos_file_constants["CacheMaxSize"]):
+        super().__init__(directory, max_size, (".data", ".json"))
+
+    def lookup(self, dataset_name: str, mode: str) -> Optional[CacheEntry]:
+        """
+        Return the cached copy of a data set.
+
+        Parameters
+        ----------
+        dataset_name: str
+            Name of the data set
+        mode: str
+            Content type of the copy, e.g. "binary", or "text;IBM-1047" for text converted on the client
+
+        Returns
+        -------
+        Optional[CacheEntry]
+            The cached copy, or None if the data set is not cached
+        """
+        try:
+            with open(self.__index_path(dataset_name, mode), "r", encoding="utf-8") as f:
+                entry = CacheEntry(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+        if entry.dataset != dataset_name.upper() or entry.mode != mode or not os.path.isfile(self.path(entry)):
+            return None
+        return entry
+
+    def path(self, entry: CacheEntry) -> str:
+        """
+        Return the path of the data of a cached copy.
+
+        Parameters
+        ----------
+        entry: CacheEntry
+            The cached copy
+
+        Returns
+        -------
+        str
+            Path of the data file, which must not be modified
+        """
+        return os.path.join(self.directory, entry.data)
+
+    def touch(self, entry: CacheEntry) -> None:
+        """
+        Mark a cached copy as used, so that it is evicted last.
+
+        Parameters
+        ----------
+        entry: CacheEntry
+            The cached copy
+        """
+        self._touch(self.path(entry))
+
+    def open(self, dataset_name: str, mode: str = "binary") -> Optional[Union[mmap.mmap, bytes]]:
+        """
+        Map the cached copy of a data set into memory.
+
+        The cache is not checked against z/OSMF; use `Datasets.open_cached` to refresh the copy first.
+
+        Parameters
+        ----------
+        dataset_name: str
+            Name of the data set
+        mode: str
+            Content type of the copy, e.g. "binary", "record" or "text" (default is "binary")
+
+        Returns
+        -------
+        Optional[Union[mmap.mmap, bytes]]
+            A read-only memory map of the data (empty bytes for an empty data set), or None if it is not cached
+        """
+        entry = self.lookup(dataset_name, mode)
+        if entry is None:
+            return None
+        try:
+            with open(self.path(entry), "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return b""
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            # Evicted by another process since the lookup
+            return None
+        self.touch(entry)
+        return data
+
+    def store(self, dataset_name: str, mode: str, etag: str, chunks: Iterable[bytes]) -> CacheEntry:
+        """
+        Cache a data set, replacing its previous copy, and evict the least recently used data sets if needed.
+
+        Parameters
+        ----------
+        dataset_name: str
+            Name of the data set
+        mode: str
+            Content type of the copy
+        etag: str
+            ETag of the data set returned by z/OSMF
+        chunks: Iterable[bytes]
+            The data
+
+        Returns
+        -------
+        CacheEntry
+            The cached copy
+        """
+        key = self.__key(dataset_name, mode)
+        data = "{}.{}.data".format(key, hashlib.sha256(etag.encode("utf-8")).hexdigest()[:16])
+        size = self._write(os.path.join(self.directory, data), chunks)
+        previous = self.lookup(dataset_name, mode)
+        entry = CacheEntry(dataset_name.upper(), mode, etag, data, size)
+        self.__write_index(entry)
+        if previous is not None and previous.data != data:
+            self._remove(self.path(previous))
+        self.evict(keep=data)
+        return entry
+
+    def _entry(self, name: str) -> str:
+        """
+        Return the data set copy a file belongs to, so that its data and index files are evicted together.
+
+        Parameters
+        ----------
+        name: str
+            Name of the data or index file
+
+        Returns
+        -------
+        str
+            The key of the copy, which starts the names of its files
+        """
+        return name.split(".", 1)[0]
+
+    @staticmethod
+    def __key(dataset_name: str, mode: str) -> str:
+        """
+        Return the file name prefix of a data set in the cache.
+
+        Parameters
+        ----------
+        dataset_name: str
+            Name of the data set
+        mode: str
+            Content type of the copy
+
+        Returns
+        -------
+        str
+            The prefix
+        """
+        return hashlib.sha256("{}\0{}".format(dataset_name.upper(), mode).encode("utf-8")).hexdigest()[:32]
+
+    def __index_path(self, dataset_name: str, mode: str) -> str:
+        """
+        Return the path of the index file of a data set.
+
+        Parameters
+        ----------
+        dataset_name: str
+            Name of the data set
+        mode: str
+            Content type of the copy
+
+        Returns
+        -------
+        str
+            Path of the index file
+        """
+        return os.path.join(self.directory, self.__key(dataset_name, mode) + ".json")
+
+    def __write_index(self, entry: CacheEntry) -> None:
+        """
+        Atomically write the index file of a cached copy.
+
+        Parameters
+        ----------
+        entry: CacheEntry
+            The cached copy
+        """
+        with atomic_write(self.__index_path(entry.dataset, entry.mode), "w", encoding="utf-8") as f:
+            json.dump(asdict(entry), f)
@@ -0,0 +1,502 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import copy
+import re
+import sqlite3
+import time
+from concurrent.futures import as_completed
+from dataclasses import fields
+from datetime import date
+from functools import lru_cache
+from types import TracebackType
+from typing import Any, Callable, Iterable, Optional, Type, Union
+
+from zowe.core_for_zowe_sdk.thread_pool import thread_pool
+
+from .datasets import Datasets
+from .response import DatasetListResponse, MemberListResponse
+from .response.datasets import DatasetResponse, MemberResponse
+
+_DATASET_FIELDS = [field.name for field in fields(DatasetResponse)]
+_MEMBER_FIELDS = [field.name for field in fields(MemberResponse)]
+# Bytes per track and tracks per cylinder of a 3390 volume, to estimate the allocated size of data sets
+_TRACK_BYTES = 56664
+_CYLINDER_TRACKS = 15
+_UNIT_BYTES = {
+    "TRACKS": _TRACK_BYTES,
+    "CYLINDERS": _CYLINDER_TRACKS * _TRACK_BYTES,
+    "BYTES": 1,
+    "KILOBYTES": 1024,
+    "MEGABYTES": 1024 * 1024,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS datasets (
+    {dataset_columns},
+    hlq TEXT NOT NULL,
+    source TEXT NOT NULL,
+    migrated INTEGER NOT NULL,
+    size_bytes INTEGER,
+    created TEXT,
+    referenced TEXT,
+    expires TEXT,
+    PRIMARY KEY (source, dsname)
+);
+CREATE INDEX IF NOT EXISTS datasets_dsname ON datasets (dsname);
+CREATE INDEX IF NOT EXISTS datasets_hlq ON datasets (hlq);
+CREATE INDEX IF NOT EXISTS datasets_vol ON datasets (vol);
+CREATE TABLE IF NOT EXISTS members (
+    dsname TEXT NOT NULL,
+    {member_columns},
+    PRIMARY KEY (dsname, member)
+);
+CREATE TABLE IF NOT EXISTS refreshes (
+    source TEXT PRIMARY KEY,
+    refreshed REAL NOT NULL,
+    count INTEGER NOT NULL
+);
+""".format(
+    dataset_columns=",\n    ".join(f"{name} TEXT" for name in _DATASET_FIELDS),
+    # Without a type, so that numbers and text are returned as z/OSMF sent them
+    member_columns=",\n    ".join(_MEMBER_FIELDS),
+)
+
+
+@lru_cache(maxsize=256)
+def _pattern_regex(pattern: str) -> "re.Pattern[str]":
+    """
+    Translate a data set name pattern to a regular expression.
+
+    Parameters
+    ----------
+    pattern: str
+        The pattern, where "**" matches any qualifiers, "*" matches within a qualifier and "%" matches one character
+
+    Returns
+    -------
+    re.Pattern[str]
+        The regular expression
+    """
+    translated = ""
+    for token in re.split(r"(\*\*|\*|%)", pattern.upper()):
+        translated += {"**": ".*", "*": "[^.]*", "%": "[^.]"}.get(token, re.escape(token))
+    return re.compile(translated)
+
+
+def _matches(pattern: str, dataset_name: str) -> bool:
+    """
+    Return whether a data set name matches a pattern.
+
+    Parameters
+    ----------
+    pattern: str
+        The pattern
+    dataset_name: str
+        The data set name
+
+    Returns
+    -------
+    bool
+        True if the name matches
+    """
+    return _pattern_regex(pattern).fullmatch(dataset_name) is not None
+
+
+def _iso_date(value: Optional[str]) -> Optional[str]:
+    """
+    Convert a z/OSMF date such as "2024/01/31" to "2024-01-31".
+
+    Parameters
+    ----------
+    value: Optional[str]
+        The z/OSMF date
+
+    Returns
+    -------
+    Optional[str]
+        The ISO date, or None if the value is not a date (e.g. no expiration date)
+    """
+    if value is None or not re.fullmatch(r"\d{4}/\d{2}/\d{2}", value):
+        return None
+    return value.replace("/", "-")
+
+
+def _size_bytes(dataset: DatasetResponse) -> Optional[int]:
+    """
+    Estimate the allocated size of a data set from its size and space unit.
+
+    Parameters
+    ----------
+    dataset: DatasetResponse
+        The data set attributes
+
+    Returns
+    -------
+    Optional[int]
+        The size in bytes, or None if it is unknown (e.g. migrated data sets)
+    """
+    try:
+        size = int(str(dataset.sizex))
+    except ValueError:
+        return None
+    if dataset.spacu == "BLOCKS":
+        try:
+            return size * int(str(dataset.blksz))
+        except ValueError:
+            return None
+    unit = _UNIT_BYTES.get(str(dataset.spacu))
+    return None if unit is None else size * unit
+
+
+class CatalogIndex:
+    """
+    Class used to keep the attributes of data sets in a local SQLite database, to query them without z/OSMF.
+
+    The index is filled by listing data set patterns (typically one per high level qualifier) with their
+    attributes. Each refresh replaces the data sets previously listed by the same pattern, and patterns are listed
+    concurrently. Passing `max_age` refreshes only the patterns listed longer ago, so that the index can be kept
+    current incrementally.
+
+    Patterns may overlap: a data set is stored once per pattern that listed it, and queries use the latest
+    listing of a pattern matching its name, so that a deleted data set disappears once any such pattern is
+    refreshed.
+
+    The database can be shared by several processes; each `CatalogIndex` object must be used by one thread.
+
+    Parameters
+    ----------
+    path: str
+        Path of the database file, created if needed, or ":memory:" for an index in memory
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.__connection = sqlite3.connect(path)
+        self.__connection.row_factory = sqlite3.Row
+        self.__connection.create_function("dsn_match", 2, _matches, deterministic=True)
+        if path != ":memory:":
+            # Lets other processes query the index while it is refreshed
+            self.__connection.execute("PRAGMA journal_mode=WAL")
+        with self.__connection:
+            self.__connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "CatalogIndex":
+        """Return the CatalogIndex instance."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exception: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the database on exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        self.__connection.close()
+
+    def refresh(
+        self,
+        connection: dict[str, Any],
+        patterns: Iterable[str],
+        max_workers: int = 4,
+        max_age: Optional[float] = None,
+    ) -> list[str]:
+        """
+        List data set patterns with their attributes on z/OSMF and store them in the index.
+
+        Parameters
+        ----------
+        connection: dict[str, Any]
+            The z/OSMF connection profile, used to create an API object per worker thread
+        patterns: Iterable[str]
+            The data set patterns to list, e.g. "PROD.**"
+        max_workers: int
+            Number of patterns listed at the same time (default is 4)
+        max_age: Optional[float]
+            Only refresh the patterns listed more than this number of seconds ago, or all of them if None
+            (default is None)
+
+        Returns
+        -------
+        list[str]
+            The patterns that were refreshed
+        """
+        now = time.time()
+        stale = [
+            pattern
+            for pattern in dict.fromkeys(pattern.upper() for pattern in patterns)
+            if max_age is None or (self.refreshed(pattern) or 0) + max_age <= now
+        ]
+
+        def list_datasets(api: Datasets, pattern: str) -> DatasetListResponse:
+            return api.list(pattern, return_attributes=True, max_items=0)
+
+        self.__fetch(connection, stale, list_datasets, self.update_datasets, max_workers)
+        return stale
+
+    def refresh_members(self, connection: dict[str, Any], dataset_names: Iterable[str], max_workers: int = 4) -> None:
+        """
+        List the members of partitioned data sets with their attributes on z/OSMF and store them in the index.
+
+        Parameters
+        ----------
+        connection: dict[str, Any]
+            The z/OSMF connection profile, used to create an API object per worker thread
+        dataset_names: Iterable[str]
+            Names of the partitioned data sets
+        max_workers: int
+            Number of data sets listed at the same time (default is 4)
+        """
+
+        def list_members(api: Datasets, dataset_name: str) -> MemberListResponse:
+            return api.list_members(dataset_name, limit=0, attributes="base")
+
+        names = list(dict.fromkeys(name.upper() for name in dataset_names))
+        self.__fetch(connection, names, list_members, self.update_members, max_workers)
+
+    def update_datasets(self, pattern: str, response: DatasetListResponse) -> None:
+        """
+        Replace the data sets listed by a pattern with the result of a new listing.
+
+        Parameters
+        ----------
+        pattern: str
+            The pattern that was listed
+        response: DatasetListResponse
+            The listing, with attributes (data sets listed without attributes are stored with their name only)
+        """
+        source = pattern.upper()
+        columns = _DATASET_FIELDS + ["hlq", "source", "migrated", "size_bytes", "created", "referenced", "expires"]
+        rows = []
+        for item in response.items or []:
+            if item.dsname is None:
+                continue
+            dataset = item if isinstance(item, DatasetResponse) else DatasetResponse(dsname=item.dsname)
+            values = [None if dataset[name] is None else str(dataset[name]) for name in _DATASET_FIELDS]
+            values += [
+                dataset.dsname.split(".")[0],
+                source,
+                int(dataset.migr == "YES" or dataset.vol == "MIGRAT"),
+                _size_bytes(dataset),
+                _iso_date(dataset.cdate),
+                _iso_date(dataset.rdate),
+                _iso_date(dataset.edate),
+            ]
+            rows.append(values)
+        with self.__connection:
+            self.__connection.execute("DELETE FROM datasets WHERE source = ?", (source,))
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO datasets ({}) VALUES ({})".format(
+                    ", ".join(columns), ", ".join("?" * len(columns))
+                ),
+                rows,
+            )
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO refreshes (source, refreshed, count) VALUES (?, ?, ?)",
+                (source, time.time(), len(rows)),
+            )
+
+    def update_members(self, dataset_name: str, response: MemberListResponse) -> None:
+        """
+        Replace the members of a partitioned data set with the result of a new listing.
+
+        Parameters
+        ----------
+        dataset_name: str
+            Name of the partitioned data set
+        response: MemberListResponse
+            The listing, with or without attributes
+        """
+        name = dataset_name.upper()
+        columns = ["dsname"] + _MEMBER_FIELDS
+        rows = []
+        for member in response.items or []:
+            rows.append([name] + [getattr(member, field, None) for field in _MEMBER_FIELDS])
+        with self.__connection:
+            self.__connection.execute("DELETE FROM members WHERE dsname = ?", (name,))
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO members ({}) VALUES ({})".format(
+                    ", ".join(columns), ", ".join("?" * len(columns))
+                ),
+                rows,
+            )
+
+    def refreshed(self, pattern: str) -> Optional[float]:
+        """
+        Return when a pattern was last listed.
+
+        Parameters
+        ----------
+        pattern: str
+            The pattern
+
+        Returns
+        -------
+        Optional[float]
+            The time of the last refresh, in seconds since the epoch, or None if it was never listed
+        """
+        row = self.__connection.execute(
+            "SELECT refreshed FROM refreshes WHERE source = ?", (pattern.upper(),)
+        ).fetchone()
+        return None if row is None else float(row["refreshed"])
+
+    def query(
+        self,
+        pattern: Optional[str] = None,
+        volume: Optional[str] = None,
+        dsorg: Optional[str] = None,
+        migrated: Optional[bool] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        created_after: Optional[Union[date, str]] = None,
+        created_before: Optional[Union[date, str]] = None,
+        referenced_after: Optional[Union[date, str]] = None,
+        referenced_before: Optional[Union[date, str]] = None,
+    ) -> list[DatasetResponse]:
+        """
+        Find data sets in the index.
+
+        Parameters
+        ----------
+        pattern: Optional[str]
+            Data set name pattern, where "**" matches any qualifiers, "*" matches within a qualifier and
+            "%" matches one character
+        volume: Optional[str]
+            Volume serial of the data sets
+        dsorg: Optional[str]
+            Organization of the data sets, e.g. "PS" or "PO"
+        migrated: Optional[bool]
+            Only return migrated data sets if True, or data sets that are not migrated if False
+        min_size: Optional[int]
+            Minimum allocated size, in bytes (estimated from the space unit with 3390 track sizes)
+        max_size: Optional[int]
+            Maximum allocated size, in bytes
+        created_after: Optional[Union[date, str]]
+            Only return data sets created on or after this date ("YYYY-MM-DD")
+        created_before: Optional[Union[date, str]]
+            Only return data sets created on or before this date
+        referenced_after: Optional[Union[date, str]]
+            Only return data sets referenced on or after this date
+        referenced_before: Optional[Union[date, str]]
+            Only return data sets referenced on or before this date
+
+        Returns
+        -------
+        list[DatasetResponse]
+            The attributes of the matching data sets from their latest listing, by name
+        """
+        conditions = []
+        parameters: list[Any] = []
+        if pattern is not None:
+            high_level_qualifier = pattern.upper().split(".")[0]
+            if not re.search(r"[*%]", high_level_qualifier):
+                conditions.append("hlq = ?")
+                parameters.append(high_level_qualifier)
+            conditions.append("dsn_match(?, dsname)")
+            parameters.append(pattern.upper())
+        for condition, value in [
+            ("vol = ?", None if volume is None else volume.upper()),
+            ("dsorg = ?", None if dsorg is None else dsorg.upper()),
+            ("migrated = ?", None if migrated is None else int(migrated)),
+            ("size_bytes >= ?", min_size),
+            ("size_bytes <= ?", max_size),
+            ("created >= ?", None if created_after is None else str(created_after)),
+            ("created <= ?", None if created_before is None else str(created_before)),
+            ("referenced >= ?", None if referenced_after is None else str(referenced_after)),
+            ("referenced <= ?", None if referenced_before is None else str(referenced_before)),
+        ]:
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+        # Skip the rows of a data set for which a pattern matching its name was listed later, whether or not
+        # that listing returned the data set
+        conditions.append(
+            "NOT EXISTS (SELECT 1 FROM refreshes AS later WHERE dsn_match(later.source, datasets.dsname)"
+            " AND (later.refreshed > refreshes.refreshed"
+            " OR (later.refreshed = refreshes.refreshed AND later.source > datasets.source)))"
+        )
+        sql = "SELECT {} FROM datasets JOIN refreshes ON refreshes.source = datasets.source WHERE {}".format(
+            ", ".join(f"datasets.{name}" for name in _DATASET_FIELDS), " AND ".join(conditions)
+        )
+        rows = self.__connection.execute(sql + " ORDER BY datasets.dsname", parameters).fetchall()
+        return [DatasetResponse(**dict(row)) for row in rows]
+
+    def members(self, dataset_name: str, pattern: Optional[str] = None) -> list[MemberResponse]:
+        """
+        Find the members of a partitioned data set in the index.
+
+        Parameters
+        ----------
+        dataset_name: str
+            Name of the partitioned data set
+        pattern: Optional[str]
+            Member name pattern, where "*" matches any characters and "%" matches one character
+
+        Returns
+        -------
+        list[MemberResponse]
+            The attributes of the matching members, by name
+        """
+        sql = "SELECT {} FROM members WHERE dsname = ?".format(", ".join(_MEMBER_FIELDS))
+        parameters = [dataset_name.upper()]
+        if pattern is not None:
+            sql += " AND dsn_match(?, member)"
+            parameters.append(pattern.upper())
+        rows = self.__connection.execute(sql + " ORDER BY member", parameters).fetchall()
+        return [MemberResponse(**dict(row)) for row in rows]
+
+    def __fetch(
+        self,
+        connection: dict[str, Any],
+        names: list[str],
+        fetch: Callable[[Datasets, str], Any],
+        store: Callable[[str, Any], None],
+        max_workers: int,
+    ) -> None:
+        """
+        Run listings concurrently and store their results as they complete.
+
+        Parameters
+        ----------
+        connection: dict[str, Any]
+            The z/OSMF connection profile
+        names: list[str]
+            The patterns or data set names to list
+        fetch: Callable[[Datasets, str], Any]
+            Lists one pattern or data set with an API object of the worker thread
+        store: Callable[[str, Any], None]
+            Stores one listing, in the calling thread since the database connection belongs to it
+        max_workers: int
+            Number of listings run at the same time
+
+        Raises
+        ------
+        ValueError
+            If `max_workers` is lower than 1
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        datasets = Datasets(connection)
+
+        def run(name: str) -> Any:
+            api = copy.copy(datasets)
+            api.request_handler = datasets.request_handler.for_current_thread()
+            return fetch(api, name)
+
+        with thread_pool(max_workers, len(names)) as executor:
+            futures = {executor.submit(run, name): name for name in names}
+            for future in as_completed(futures):
+                store(futures[future], future.result())
@@ -15,6 +15,11 @@ zos_file_constants = {
     "ZoweFilesDefaultEncoding": "utf-8",
     "min_timeout": 5,
     "max_timeout": 600,
+    "CheckpointSuffix": ".zowe-checkpoint",
+    "ResumeRecordsPerRequest": 100000,
+    "ResumeCheckpointBytes": 8 * 1024 * 1024,
+    "CacheMaxSize": 10 * 1024 * 1024 * 1024,
+    "TagCacheTTL": 300,
 }
 from enum import Enum
 
@@ -0,0 +1,603 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, Optional
+
+from .ebcdic import EbcdicCodec
+
+HAS_NUMPY = True
+try:
+    import numpy as np
+except ImportError:
+    HAS_NUMPY = False
+
+_TOKEN = re.compile(r"'[^']*'|\"[^\"]*\"|\.(?=\s|$)|[^\s'\"]+?(?=\.(?:\s|$)|\s|$)")
+_USAGES = {
+    "DISPLAY": "display",
+    "COMP": "binary",
+    "COMPUTATIONAL": "binary",
+    "COMP-4": "binary",
+    "COMPUTATIONAL-4": "binary",
+    "COMP-5": "binary",
+    "COMPUTATIONAL-5": "binary",
+    "BINARY": "binary",
+    "COMP-3": "packed",
+    "COMPUTATIONAL-3": "packed",
+    "PACKED-DECIMAL": "packed",
+    "COMP-1": "float",
+    "COMPUTATIONAL-1": "float",
+    "COMP-2": "double",
+    "COMPUTATIONAL-2": "double",
+}
+_IGNORED_CLAUSES = {
+    "BLANK",
+    "WHEN",
+    "ZERO",
+    "ZEROS",
+    "ZEROES",
+    "JUST",
+    "JUSTIFIED",
+    "RIGHT",
+    "IS",
+    "GLOBAL",
+    "EXTERNAL",
+}
+_UNSUPPORTED_CLAUSES = {"SIGN", "SEPARATE", "LEADING", "TRAILING", "SYNC", "SYNCHRONIZED", "DEPENDING", "INDEX"}
+
+
+@dataclass
+class CopybookField:
+    """An elementary item of a copybook, at a fixed position in the record."""
+
+    name: str
+    offset: int
+    length: int
+    kind: str
+    digits: int = 0
+    scale: int = 0
+    signed: bool = False
+
+
+@dataclass
+class _Item:
+    """A data description entry of a copybook, before positions are computed."""
+
+    level: int
+    name: str
+    picture: Optional[str] = None
+    usage: Optional[str] = None
+    occurs: int = 1
+    redefines: Optional[str] = None
+    children: list["_Item"] = field(default_factory=list)
+
+
+def _source_lines(source: str) -> Iterator[str]:
+    """
+    Return the code of each line of a copybook, without sequence numbers and comments.
+
+    Parameters
+    ----------
+    source: str
+        The copybook source
+
+    Yields
+    ------
+    str
+        The code of each line
+    """
+    for line in source.splitlines():
+        # Fixed format: sequence number in columns 1-6, indicator in column 7, code in columns 8-72
+        if len(line) > 6 and (line[:6].isdigit() or not line[:6].strip()) and line[6] in " *-/":
+            if line[6] in "*/":
+                continue
+            yield line[7:72]
+        elif not line.lstrip().startswith("*"):
+            yield line
+
+
+def _expand_picture(picture: str) -> str:
+    """
+    Expand the repetitions of a picture string, e.g. "S9(3)V99" to "S999V99".
+
+    Parameters
+    ----------
+    picture: str
+        The picture string
+
+    Returns
+    -------
+    str
+        The expanded picture string
+    """
+    return re.sub(r"(.)\((\d+)\)", lambda match: match.group(1) * int(match.group(2)), picture.upper())
+
+
+class Copybook:
+    """
+    Class used to represent the record layout described by a COBOL copybook.
+
+    Elementary items are flattened to fields at fixed offsets. Items repeated with OCCURS are numbered from 1
+    (e.g. "AMOUNT_1", "AMOUNT_2"), REDEFINES items overlay the item they redefine and FILLER items are skipped.
+    Variable length tables (OCCURS DEPENDING ON), SIGN SEPARATE and SYNCHRONIZED items are not supported.
+
+    Parameters
+    ----------
+    fields: list[CopybookField]
+        The elementary items of the record
+    record_length: int
+        The length of the record, in bytes
+    """
+
+    def __init__(self, fields: list[CopybookField], record_length: int):
+        self.fields = fields
+        self.record_length = record_length
+
+    @staticmethod
+    def parse(source: str) -> "Copybook":
+        """
+        Parse the source of a copybook.
+
+        Parameters
+        ----------
+        source: str
+            The copybook source, in fixed or free format
+
+        Returns
+        -------
+        Copybook
+            The record layout
+
+        Raises
+        ------
+        ValueError
+            If the copybook contains no record or an unsupported clause
+        """
+        tokens = _TOKEN.findall("\n".join(_source_lines(source)))
+        statements: list[list[str]] = [[]]
+        for token in tokens:
+            if token == ".":
+                statements.append([])
+            else:
+                statements[-1].append(token)
+        root = _Item(0, "")
+        stack = [root]
+        for statement in statements:
+            item = Copybook.__parse_statement(statement)
+            if item is None:
+                continue
+            while stack[-1].level >= item.level and len(stack) > 1:
+                stack.pop()
+            stack[-1].children.append(item)
+            stack.append(item)
+        if not root.children:
+            raise ValueError("The copybook does not describe any record")
+        fields: list[CopybookField] = []
+        record_length = Copybook.__layout(root.children[0], 0, None, "", fields)
+        names: set[str] = set()
+        for copybook_field in fields:
+            if copybook_field.name in names:
+                raise ValueError(f"Duplicate field name {copybook_field.name} in copybook")
+            names.add(copybook_field.name)
+        return Copybook(fields, record_length)
+
+    @staticmethod
+    def __parse_statement(tokens: list[str]) -> Optional[_Item]:
+        """
+        Parse a data description entry.
+
+        Parameters
+        ----------
+        tokens: list[str]
+            The tokens of the entry
+
+        Returns
+        -------
+        Optional[_Item]
+            The item, or None for entries that do not describe data (e.g. level 88 condition names)
+
+        Raises
+        ------
+        ValueError
+            If the entry uses an unsupported clause
+        """
+        if not tokens or not tokens[0].isdigit() or int(tokens[0]) in (66, 88):
+            return None
+        level = 1 if int(tokens[0]) == 77 else int(tokens[0])
+        index = 1
+        name = "FILLER"
+        if index < len(tokens) and tokens[index].upper() not in ("PIC", "PICTURE", "USAGE", "OCCURS", "REDEFINES"):
+            name = tokens[index].upper()
+            index += 1
+        item = _Item(level, name)
+        while index < len(tokens):
+            token = tokens[index].upper()
+            if token in ("PIC", "PICTURE"):
+                index += 1
+                if tokens[index].upper() == "IS":
+                    index += 1
+                item.picture = _expand_picture(tokens[index])
+            elif token == "USAGE":
+                pass
+            elif token in _USAGES:
+                item.usage = _USAGES[token]
+            elif token == "OCCURS":
+                item.occurs = int(tokens[index + 1])
+                index += 1
+                if index + 1 < len(tokens) and tokens[index + 1].upper() == "TO":
+                    raise ValueError(f"OCCURS DEPENDING ON is not supported (item {name})")
+            elif token == "REDEFINES":
+                item.redefines = tokens[index + 1].upper()
+                index += 1
+            elif token in ("VALUE", "VALUES"):
+                break
+            elif token in _UNSUPPORTED_CLAUSES:
+                raise ValueError(f"{token} clause is not supported (item {name})")
+            elif token not in _IGNORED_CLAUSES and token != "TIMES":
+                raise ValueError(f"Unexpected token {tokens[index]} in item {name}")
+            index += 1
+        return item
+
+    @staticmethod
+    def __layout(item: _Item, offset: int, usage: Optional[str], suffix: str, fields: list[CopybookField]) -> int:
+        """
+        Compute the position of the elementary items of an item and its occurrences.
+
+        Parameters
+        ----------
+        item: _Item
+            The item
+        offset: int
+            Offset of the item in the record
+        usage: Optional[str]
+            Usage inherited from the enclosing group
+        suffix: str
+            Occurrence numbers of the enclosing groups, appended to field names
+        fields: list[CopybookField]
+            The fields found so far, updated with the fields of the item
+
+        Returns
+        -------
+        int
+            The length of the item, including all occurrences
+        """
+        usage = item.usage or usage
+        length = 0
+        for occurrence in range(item.occurs):
+            occurrence_suffix = suffix + (f"_{occurrence + 1}" if item.occurs > 1 else "")
+            start = offset + occurrence * length
+            if item.children:
+                length = Copybook.__layout_group(item, start, usage, occurrence_suffix, fields)
+            else:
+                copybook_field = Copybook.__elementary_field(item, start, usage, occurrence_suffix)
+                length = copybook_field.length
+                if item.name != "FILLER":
+                    fields.append(copybook_field)
+        return length * item.occurs
+
+    @staticmethod
+    def __layout_group(item: _Item, offset: int, usage: Optional[str], suffix: str, fields: list[CopybookField]) -> int:
+        """
+        Compute the position of the children of a group item.
+
+        Parameters
+        ----------
+        item: _Item
+            The group item
+        offset: int
+            Offset of the group in the record
+        usage: Optional[str]
+            Usage of the group
+        suffix: str
+            Occurrence numbers of the group, appended to field names
+        fields: list[CopybookField]
+            The fields found so far, updated with the fields of the group
+
+        Returns
+        -------
+        int
+            The length of one occurrence of the group
+
+        Raises
+        ------
+        ValueError
+            If an item redefines an item that is not a previous sibling
+        """
+        position = offset
+        end = offset
+        starts: dict[str, int] = {}
+        for child in item.children:
+            if child.redefines is not None:
+                if child.redefines not in starts:
+                    raise ValueError(f"{child.name} redefines unknown item {child.redefines}")
+                child_start = starts[child.redefines]
+                end = max(end, child_start + Copybook.__layout(child, child_start, usage, suffix, fields))
+                continue
+            starts[child.name] = position
+            position += Copybook.__layout(child, position, usage, suffix, fields)
+            end = max(end, position)
+        return end - offset
+
+    @staticmethod
+    def __elementary_field(item: _Item, offset: int, usage: Optional[str], suffix: str) -> CopybookField:
+        """
+        Describe an elementary item.
+
+        Parameters
+        ----------
+        item: _Item
+            The elementary item
+        offset: int
+            Offset of the item in the record
+        usage: Optional[str]
+            Usage of the item
+        suffix: str
+            Occurrence numbers of the item, appended to its name
+
+        Returns
+        -------
+        CopybookField
+            The field
+
+        Raises
+        ------
+        ValueError
+            If the item has no picture string and is not a floating point item
+        """
+        name = item.name + suffix
+        if usage == "float":
+            return CopybookField(name, offset, 4, "float", signed=True)
+        if usage == "double":
+            return CopybookField(name, offset, 8, "float", signed=True)
+        if item.picture is None:
+            raise ValueError(f"Elementary item {item.name} has no PICTURE clause")
+        picture = item.picture
+        if not re.fullmatch(r"S?9*(V9*)?", picture):
+            # Alphanumeric and edited items are text of their display length
+            return CopybookField(name, offset, len(picture), "text")
+        integer_part, _, fraction = picture.lstrip("S").partition("V")
+        digits = len(integer_part) + len(fraction)
+        signed = picture.startswith("S")
+        if usage == "packed":
+            return CopybookField(name, offset, digits // 2 + 1, "packed", digits, len(fraction), signed)
+        if usage == "binary":
+            length = 2 if digits <= 4 else 4 if digits <= 9 else 8
+            return CopybookField(name, offset, length, "binary", digits, len(fraction), signed)
+        return CopybookField(name, offset, digits, "zoned", digits, len(fraction), signed)
+
+
+class CopybookDecoder:
+    """
+    Class used to decode fixed length records described by a copybook into NumPy arrays.
+
+    Every field is decoded for all records at once with vectorized operations: text fields are converted
+    from EBCDIC with a lookup table, zoned and packed decimal fields are converted from their digit nibbles,
+    binary fields are read as big endian integers and COMP-1/COMP-2 fields as hexadecimal floating point numbers.
+    Fields with decimal places and integers of more than 18 digits are returned as `float64`, other numbers as
+    `int64`. Requires NumPy (`pip install zowe_zos_files_for_zowe_sdk[numpy]`).
+
+    Parameters
+    ----------
+    copybook: Copybook
+        The record layout
+    encoding: str
+        EBCDIC code page of the text fields (default is "IBM-037")
+    strip_text: bool
+        Remove trailing blanks from text fields (default is True)
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If NumPy is not installed
+    """
+
+    def __init__(self, copybook: Copybook, encoding: str = "IBM-037", strip_text: bool = True):
+        if not HAS_NUMPY:
+            raise ModuleNotFoundError(
+                "NumPy is required to decode copybook records: pip install zowe_zos_files_for_zowe_sdk[numpy]"
+            )
+        self.copybook = copybook
+        self.strip_text = strip_text
+        self.__lookup = np.array([ord(char) for char in EbcdicCodec.for_encoding(encoding).decoding_table], np.uint32)
+
+    def decode(self, data: Any) -> dict[str, Any]:
+        """
+        Decode consecutive fixed length records into one array per field.
+
+        Parameters
+        ----------
+        data: Any
+            The records, as bytes, a buffer (e.g. a memoryview or mmap) or a NumPy array of bytes
+
+        Returns
+        -------
+        dict[str, Any]
+            A NumPy array per field, with one element per record
+
+        Raises
+        ------
+        ValueError
+            If the data is not a whole number of records or a decimal field contains invalid digits
+        """
+        record_length = self.copybook.record_length
+        raw = np.frombuffer(data, dtype=np.uint8) if not isinstance(data, np.ndarray) else data.reshape(-1)
+        if raw.size % record_length:
+            raise ValueError(f"Data length {raw.size} is not a multiple of the record length {record_length}")
+        records = raw.reshape(-1, record_length)
+        return {
+            copybook_field.name: self.__decode_field(
+                copybook_field, records[:, copybook_field.offset : copybook_field.offset + copybook_field.length]
+            )
+            for copybook_field in self.copybook.fields
+        }
+
+    def to_structured(self, data: Any) -> Any:
+        """
+        Decode consecutive fixed length records into a NumPy structured array.
+
+        Parameters
+        ----------
+        data: Any
+            The records, as bytes, a buffer (e.g. a memoryview or mmap) or a NumPy array of bytes
+
+        Returns
+        -------
+        Any
+            A structured array with one element per record and one named field per copybook field
+        """
+        columns = self.decode(data)
+        length = len(next(iter(columns.values()))) if columns else 0
+        structured = np.empty(length, dtype=[(name, column.dtype) for name, column in columns.items()])
+        for name, column in columns.items():
+            structured[name] = column
+        return structured
+
+    def decode_file(self, local_file_path: str) -> dict[str, Any]:
+        """
+        Decode a downloaded binary data set, mapping the file into memory instead of reading it.
+
+        Parameters
+        ----------
+        local_file_path: str
+            Path of the file, e.g. downloaded with `Datasets.perform_download(content_type=ContentType.BINARY)`
+
+        Returns
+        -------
+        dict[str, Any]
+            A NumPy array per field, with one element per record
+        """
+        return self.decode(np.memmap(local_file_path, dtype=np.uint8, mode="r"))
+
+    def iter_decode(self, chunks: Iterable[bytes], records_per_batch: int = 100000) -> Iterator[dict[str, Any]]:
+        """
+        Decode a stream of fixed length records in batches.
+
+        Parameters
+        ----------
+        chunks: Iterable[bytes]
+            The stream, e.g. `Response.iter_content()` of `Datasets.retrieve_content` with binary content
+        records_per_batch: int
+            Number of records decoded at once (default is 100000)
+
+        Yields
+        ------
+        dict[str, Any]
+            A NumPy array per field for each batch of records
+
+        Raises
+        ------
+        ValueError
+            If the stream ends in the middle of a record
+        """
+        batch_length = records_per_batch * self.copybook.record_length
+        pending = bytearray()
+        for chunk in chunks:
+            pending += chunk
+            if len(pending) >= batch_length:
+                complete = len(pending) - len(pending) % self.copybook.record_length
+                yield self.decode(bytes(pending[:complete]))
+                del pending[:complete]
+        if len(pending) % self.copybook.record_length:
+            raise ValueError("The record stream ended in the middle of a record")
+        if pending:
+            yield self.decode(bytes(pending))
+
+    def __decode_field(self, copybook_field: CopybookField, values: Any) -> Any:
+        """
+        Decode a field of all records.
+
+        Parameters
+        ----------
+        copybook_field: CopybookField
+            The field
+        values: Any
+            The bytes of the field, one row per record
+
+        Returns
+        -------
+        Any
+            The decoded values
+
+        Raises
+        ------
+        ValueError
+            If a decimal field contains invalid digits
+        """
+        count = values.shape[0]
+        if copybook_field.kind == "text":
+            codes = np.ascontiguousarray(self.__lookup[values])
+            text = codes.view(np.dtype((np.str_, copybook_field.length))).reshape(count)
+            return np.char.rstrip(text, " ") if self.strip_text else text
+        if copybook_field.kind == "float":
+            return self.__decode_hex_float(values)
+        if copybook_field.kind == "binary":
+            big_endian = np.dtype(f">{'i' if copybook_field.signed else 'u'}{copybook_field.length}")
+            number = np.ascontiguousarray(values).view(big_endian).reshape(count).astype(np.int64)
+        else:
+            if copybook_field.kind == "packed":
+                nibbles = np.empty((count, 2 * copybook_field.length), np.uint8)
+                nibbles[:, 0::2] = values >> 4
+                nibbles[:, 1::2] = values & 0x0F
+                digits, sign = nibbles[:, -1 - copybook_field.digits : -1], nibbles[:, -1]
+            else:
+                digits, sign = values & 0x0F, values[:, -1] >> 4
+            if (digits > 9).any():
+                raise ValueError(f"Invalid decimal digits in field {copybook_field.name}")
+            number = self.__combine_digits(digits)
+            if copybook_field.signed:
+                number = np.where((sign == 0x0D) | (sign == 0x0B), -number, number)
+        if copybook_field.scale:
+            return number / 10.0**copybook_field.scale
+        return number
+
+    @staticmethod
+    def __combine_digits(digits: Any) -> Any:
+        """
+        Combine rows of decimal digits into numbers.
+
+        Parameters
+        ----------
+        digits: Any
+            The digits, most significant first, one row per record
+
+        Returns
+        -------
+        Any
+            The numbers, as `int64` for up to 18 digits and `float64` otherwise
+        """
+        width = digits.shape[1]
+        if width <= 18:
+            return digits.astype(np.int64) @ 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+        return digits.astype(np.float64) @ 10.0 ** np.arange(width - 1, -1, -1)
+
+    @staticmethod
+    def __decode_hex_float(values: Any) -> Any:
+        """
+        Convert IBM hexadecimal floating point numbers (COMP-1 and COMP-2).
+
+        Parameters
+        ----------
+        values: Any
+            The 4 or 8 bytes of each number, one row per record
+
+        Returns
+        -------
+        Any
+            The numbers as `float64`
+        """
+        bits = 8 * values.shape[1]
+        words = np.ascontiguousarray(values).view(f">u{values.shape[1]}").reshape(values.shape[0]).astype(np.uint64)
+        sign = np.where(words >> np.uint64(bits - 1), -1.0, 1.0)
+        exponent = ((words >> np.uint64(bits - 8)) & np.uint64(0x7F)).astype(np.int64) - 64
+        fraction = (words & np.uint64((1 << (bits - 8)) - 1)).astype(np.float64) / 2.0 ** (bits - 8)
+        return sign * fraction * 16.0**exponent
@@ -10,19 +10,30 @@ SPDX-License-Identifier: EPL-2.0
 Copyright Contributors to the Zowe Project.
 """
 
+import itertools
+import mmap
 import os
-from typing import Any, Optional, Union
+import shutil
+import threading
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
 
 from requests import Response
-from zowe.core_for_zowe_sdk import SdkApi
+from zowe.core_for_zowe_sdk import RequestHandler, SdkApi
 from zowe.core_for_zowe_sdk.exceptions import FileNotFound
 from zowe.zos_files_for_zowe_sdk.api import BaseFilesApi
+from zowe.zos_files_for_zowe_sdk.cache import CacheEntry, DatasetCache
 from zowe.zos_files_for_zowe_sdk.constants import (
     ContentType,
     FileType,
     zos_file_constants,
 )
+from zowe.zos_files_for_zowe_sdk.ebcdic import EbcdicCodec
+from zowe.zos_files_for_zowe_sdk.exceptions import DatasetNotCacheable
+from zowe.zos_files_for_zowe_sdk.hsm import HsmBatch, HsmResult, PrefetchResult, RecallPrefetch
+from zowe.zos_files_for_zowe_sdk.records import RecordReader
 from zowe.zos_files_for_zowe_sdk.response import DatasetListResponse, MemberListResponse
+from zowe.zos_files_for_zowe_sdk.response.datasets import DatasetResponse
+from zowe.zos_files_for_zowe_sdk.transfer import ResumableDownload, SegmentedDownload
 
 _ZOWE_FILES_DEFAULT_ENCODING = zos_file_constants["ZoweFilesDefaultEncoding"]
 
@@ -313,7 +324,9 @@ class Datasets(BaseFilesApi):  # type: ignore[misc]
     def __init__(self, connection: dict[str, Any], log: bool = True) -> None:
         super().__init__(connection, log=log)
 
-    def list(self, name_pattern: str, return_attributes: bool = False) -> DatasetListResponse:
+    def list(
+        self, name_pattern: str, return_attributes: bool = False, max_items: Optional[int] = None
+    ) -> DatasetListResponse:
         """
         Retrieve a list of datasets based on a given pattern.
 
@@ -323,6 +336,8 @@ class Datasets(BaseFilesApi):  # type: ignore[misc]
             The pattern to match dataset names.
         return_attributes : bool
             Whether to return dataset attributes along with the names. Defaults to False.
+        max_items : Optional[int]
+            Maximum number of datasets returned, 0 for no limit (z/OSMF returns 1000 by default).
 
         Returns
         -------
@@ -335,6 +350,8 @@ class Datasets(BaseFilesApi):  # type: ignore[misc]
 
         if return_attributes:
             custom_args["headers"]["X-IBM-Attributes"] = "base"
+        if max_items is not None:
+            custom_args["headers"]["X-IBM-Max-Items"] = str(max_items)
 
         response_json = self.request_handler.perform_request("GET", custom_args)
         return DatasetListResponse(response_json, return_attributes)
@@ -589,13 +606,32 @@ class Datasets(BaseFilesApi):  # type: ignore[misc]
             Contents of a given dataset in string, or None if the dataset is empty,
             or a Response object with content of the file if `as_stream == True`
         """
+        custom_args = self.__content_arguments(dataset_name, content_type)
+        response = self.request_handler.perform_request("GET", custom_args, stream=as_stream)
+        return response
+
+    def __content_arguments(self, dataset_name: str, content_type: ContentType) -> dict[str, Any]:
+        """
+        Build the arguments of a request retrieving the contents of a data set.
+
+        Parameters
+        ----------
+        dataset_name: str
+            The name of the dataset
+        content_type: ContentType
+            The content type to receive
+
+        Returns
+        -------
+        dict[str, Any]
+            The request arguments
+        """
         custom_args = self._create_custom_request_arguments()
         custom_args["url"] = "{}ds/{}".format(self._request_endpoint, self._encode_uri_component(dataset_name))
         custom_args["headers"]["X-IBM-Data-Type"] = content_type.value
         if content_type == ContentType.RECORD or content_type == ContentType.BINARY:
             custom_args["headers"]["Accept"] = "application/octet-stream"
-        response = self.request_handler.perform_request("GET", custom_args, stream=as_stream)
-        return response
+        return custom_args
 
     def get_content(self, dataset_name: str, stream: bool = False) -> Union[str, None, Response]:
         """Use `retrieve_content()` instead of this deprecated function."""
@@ -656,7 +692,14 @@ class Datasets(BaseFilesApi):  # type: ignore[misc]
         self.request_handler.perform_request("PUT", custom_args, expected_code=[204, 201])
 
     def perform_download(
-        self, dataset_name: str, local_file_path: str, content_type: ContentType = ContentType.TEXT
+        self,
+        dataset_name: str,
+        local_file_path: str,
+        content_type: ContentType = ContentType.TEXT,
+        resume: bool = False,
+        convert_locally: bool = False,
+        remote_encoding: str = "IBM-1047",
+        cache: Optional[DatasetCache] = None,
     ) -> None:
         """
         Retrieve the contents of a data set and save it to a local file.
@@ -670,12 +713,58 @@ class Datasets(BaseFilesApi):  # type: ignore[misc]
         content_type: ContentType
             The content type to receive
             ("text", "binary" or "record" (include a 4 byte big endian record len prefix), "text" by default)
+        resume: bool
+            Download in ranges of records, recording the progress in a checkpoint file next to the local file,
+            so that running the download again after a failure only retrieves the remaining records
+            (default is False). Text is then always converted on the client, so that records are counted exactly
+        convert_locally: bool
+            Transfer text as binary records and convert it from `remote_encoding` on the client instead of
+            having z/OSMF convert it (default is False). Ignored for binary and record content
+        remote_encoding: str
+            EBCDIC code page of the data set when converting locally (default is "IBM-1047")
+        cache: Optional[DatasetCache]
+            Local cache to copy the data set from if it did not change since it was cached, and to store it in
+            otherwise (default is None). Data sets for which z/OSMF returns no ETag are saved without being
+            cached. Cannot be combined with `resume`
 
         Raises
         ------
         TypeError
             Thrown when the `retrieve_content` request does not return a valid Response object.
+        ValueError
+            If both `cache` and `resume` are given
         """
+        codec = self.__local_codec(content_type, convert_locally or resume, remote_encoding)
+        if cache is not None:
+            if resume:
+                self.logger.error("A cached download cannot be resumed")
+                raise ValueError("A cached download cannot be resumed")
+            entry = self.__refresh_cache(dataset_name, content_type, codec, cache, local_file_path)
+            if entry is None:
+                # Not cacheable; the data set was written to the local file instead
+                return
+            try:
+                shutil.copyfile(cache.path(entry), local_file_path)
+                return
+            except FileNotFoundError:
+                self.logger.warning(f"{dataset_name} was evicted from the cache while it was being copied")
+        if resume:
+            custom_args = self.__download_arguments(dataset_name, content_type, codec)
+            custom_args["headers"]["X-IBM-Return-Etag"] = "true"
+            mode = content_type.value if codec is None else "{};{}".format(content_type.value, codec.encoding)
+            download = ResumableDownload(self.request_handler, custom_args, local_file_path, dataset_name, mode)
+            download.by_records(content_type, encoding="utf-8", codec=codec)
+            return
+        if codec is not None:
+            response = self.request_handler.perform_request(
+                "GET", self.__download_arguments(dataset_name, content_type, codec), stream=True
+            )
+            decoder = codec.record_decoder()
+            with open(local_file_path, "w", encoding="utf-8") as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(decoder.decode(chunk))
+                decoder.decode(b"", final=True)
+            return
         response = self.retrieve_content(dataset_name, content_type=content_type, as_stream=True)
         if not isinstance(response, Response):
             raise TypeError(f"Expected Response, got {type(response)}")
@@ -689,6 +778,286 @@ class Datasets(BaseFilesApi):  # type: ignore[misc]
                 f.write(chunk)
 
 
+    def open_cached(
+        self,
+        dataset_name: str,
+        cache: DatasetCache,
+        content_type: ContentType = ContentType.BINARY,
+        convert_locally: bool = False,
+        remote_encoding: str = "IBM-1047",
+    ) -> Union[mmap.mmap, bytes]:
+        """
+        Map the contents of a data set into memory through a local cache, downloading it only if it changed.
+
+        Parameters
+        ----------
+        dataset_name: str
+            Name of the dataset
+        cache: DatasetCache
+            The local cache
+        content_type: ContentType
+            The content type to receive ("binary" by default). Text is cached encoded in UTF-8
+        convert_locally: bool
+            Transfer text as binary records and convert it from `remote_encoding` on the client instead of
+            having z/OSMF convert it (default is False). Ignored for binary and record content
+        remote_encoding: str
+            EBCDIC code page of the data set when converting locally (default is "IBM-1047")
+
+        Returns
+        -------
+        Union[mmap.mmap, bytes]
+            A read-only memory map of the contents, or empty bytes for an empty data set
+
+        Raises
+        ------
+        DatasetNotCacheable
+            If z/OSMF did not return an ETag for the data set, or other processes evicted it while it was opened
+        """
+        codec = self.__local_codec(content_type, convert_locally, remote_encoding)
+        for _ in range(2):
+            if self.__refresh_cache(dataset_name, content_type, codec, cache) is None:
+                self.logger.error(f"No ETag was returned for {dataset_name}")
+                raise DatasetNotCacheable(dataset_name, "z/OSMF did not return an ETag")
+            data = cache.open(dataset_name, self.__cache_mode(content_type, codec))
+            if data is not None:
+                return data
+        self.logger.error(f"{dataset_name} was evicted from the cache while it was being opened")
+        raise DatasetNotCacheable(dataset_name, "it was evicted while it was being opened, the cache is too small")
+
+    def iter_records(self, dataset_name: str) -> Iterator[memoryview]:
+        """
+        Stream the records of a data set.
+
+        Records are `memoryview` slices of a reusable buffer that are only valid until the next record is read;
+        call `bytes(record)` to keep a record.
+
+        Parameters
+        ----------
+        dataset_name: str
+            Name of the dataset
+
+        Yields
+        ------
+        memoryview
+            The data of each record
+        """
+        response = self.retrieve_content(dataset_name, content_type=ContentType.RECORD, as_stream=True)
+        try:
+            yield from RecordReader(response.iter_content(chunk_size=65536))
+        finally:
+            response.close()
+
+    def iter_record_batches(self, dataset_name: str, batch_size: int = 1000) -> Iterator[List[memoryview]]:
+        """
+        Stream the records of a data set in batches.
+
+        Records are `memoryview` slices of a reusable buffer that are only valid until the next batch is read;
+        call `bytes(record)` to keep a record.
+
+        Parameters
+        ----------
+        dataset_name: str
+            Name of the dataset
+        batch_size: int
+            Maximum number of records in each batch (default is 1000)
+
+        Yields
+        ------
+        List[memoryview]
+            The data of the records of each batch
+        """
+        response = self.retrieve_content(dataset_name, content_type=ContentType.RECORD, as_stream=True)
+        try:
+            yield from RecordReader(response.iter_content(chunk_size=65536)).batches(batch_size)
+        finally:
+            response.close()
+
+    def perform_segmented_download(
+        self,
+        dataset_name: str,
+        local_file_path: str,
+        content_type: ContentType = ContentType.TEXT,
+        max_workers: int = 4,
+        records_per_segment: int = zos_file_constants["ResumeRecordsPerRequest"],
+        remote_encoding: str = "IBM-1047",
+    ) -> None:
+        """
+        Retrieve the contents of a sequential data set over several connections and save it to a local file.
+
+        The data set is split into ranges of records that are downloaded concurrently and written to the
+        local file in order, so that large data sets are not limited to the throughput of a single connection.
+
+        Parameters
+        ----------
+        dataset_name: str
+            Name of the dataset to be downloaded
+        local_file_path: str
+            Name of the file to be saved locally
+        content_type: ContentType
+            The content type to receive
+            ("text", "binary" or "record" (include a 4 byte big endian record len prefix), "text" by default)
+        max_workers: int
+            Number of ranges downloaded at the same time (default is 4)
+        records_per_segment: int
+            Number of records in each range (default is 100000)
+        remote_encoding: str
+            EBCDIC code page of the data set (default is "IBM-1047"). Text is transferred as binary records
+            and converted on the client, so that ranges are counted in records exactly
+        """
+        codec = self.__local_codec(content_type, True, remote_encoding)
+        download = SegmentedDownload(
+            self.request_handler,
+            self.__download_arguments(dataset_name, content_type, codec),
+            local_file_path,
+            max_workers,
+            records_per_segment,
+        )
+        download.run(content_type, encoding="utf-8", codec=codec)
+
+    @staticmethod
+    def __local_codec(content_type: ContentType, convert_locally: bool, remote_encoding: str) -> Optional[EbcdicCodec]:
+        """
+        Return the codec converting text on the client, if requested.
+
+        Parameters
+        ----------
+        content_type: ContentType
+            The content type to save locally
+        convert_locally: bool
+            Whether text is converted on the client
+        remote_encoding: str
+            EBCDIC code page of the data set
+
+        Returns
+        -------
+        Optional[EbcdicCodec]
+            The codec, or None if z/OSMF converts the content or the content is not text
+        """
+        if not convert_locally or content_type != ContentType.TEXT:
+            return None
+        return EbcdicCodec.for_encoding(remote_encoding)
+
+    @staticmethod
+    def __cache_mode(content_type: ContentType, codec: Optional[EbcdicCodec]) -> str:
+        """
+        Describe the content type and encoding of a downloaded data set.
+
+        Parameters
+        ----------
+        content_type: ContentType
+            The content type to save locally
+        codec: Optional[EbcdicCodec]
+            Codec converting text on the client
+
+        Returns
+        -------
+        str
+            The description, e.g. "binary" or "text;IBM-1047"
+        """
+        return content_type.value if codec is None else "{};{}".format(content_type.value, codec.encoding)
+
+    def __refresh_cache(
+        self,
+        dataset_name: str,
+        content_type: ContentType,
+        codec: Optional[EbcdicCodec],
+        cache: DatasetCache,
+        local_file_path: Optional[str] = None,
+    ) -> Optional[CacheEntry]:
+        """
+        Download a data set into a local cache unless z/OSMF reports that the cached copy is current.
+
+        Parameters
+        ----------
+        dataset_name: str
+            Name of the dataset
+        content_type: ContentType
+            The content type to save locally
+        codec: Optional[EbcdicCodec]
+            Codec converting text on the client
+        cache: DatasetCache
+            The local cache
+        local_file_path: Optional[str]
+            File to save the data set to if z/OSMF does not return an ETag, so that it is not downloaded twice
+
+        Returns
+        -------
+        Optional[CacheEntry]
+            The current cached copy, or None if z/OSMF did not return an ETag, in which case nothing is cached
+        """
+        mode = self.__cache_mode(content_type, codec)
+        entry = cache.lookup(dataset_name, mode)
+        if content_type == ContentType.TEXT and codec is None:
+            custom_args = self.__download_arguments(dataset_name, content_type)
+        else:
+            custom_args = self._create_custom_request_arguments()
+            custom_args["url"] = "{}ds/{}".format(self._request_endpoint, self._encode_uri_component(dataset_name))
+            custom_args["headers"]["X-IBM-Data-Type"] = (content_type if codec is None else ContentType.RECORD).value
+            custom_args["headers"]["Accept"] = "application/octet-stream"
+        custom_args["headers"]["X-IBM-Return-Etag"] = "true"
+        if entry is not None:
+            custom_args["headers"]["If-None-Match"] = entry.etag
+        response = self.request_handler.perform_request("GET", custom_args, expected_code=[200, 304], stream=True)
+        try:
+            if response.status_code == 304 and entry is not None:
+                cache.touch(entry)
+                return entry
+            if codec is not None:
+                decoder = codec.record_decoder()
+                # A final empty chunk checks that the stream does not end in the middle of a record
+                chunks = (
+                    decoder.decode(chunk or b"", final=chunk is None).encode("utf-8")
+                    for chunk in itertools.chain(response.iter_content(chunk_size=65536), [None])
+                )
+            elif content_type == ContentType.TEXT:
+                chunks = (
+                    chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+                    for chunk in response.iter_content(chunk_size=65536, decode_unicode=True)
+                )
+            else:
+                chunks = response.iter_content(chunk_size=65536)
+            etag = response.headers.get("ETag")
+            if not etag:
+                if local_file_path is not None:
+                    with open(local_file_path, "wb") as f:
+                        for chunk in chunks:
+                            f.write(chunk)
+                return None
+            return cache.store(dataset_name, mode, etag, chunks)
+        finally:
+            response.close()
+
+    def __download_arguments(
+        self, dataset_name: str, content_type: ContentType, codec: Optional[EbcdicCodec] = None
+    ) -> dict[str, Any]:
+        """
+        Build the arguments of a request retrieving a data set as text converted by z/OSMF or as records.
+
+        Parameters
+        ----------
+        dataset_name: str
+            Name of the dataset
+        content_type: ContentType
+            The content type to save locally
+        codec: Optional[EbcdicCodec]
+            Codec converting text on the client, in which case text is retrieved as records
+
+        Returns
+        -------
+        dict[str, Any]
+            The request arguments
+        """
+        custom_args = self._create_custom_request_arguments()
+        custom_args["url"] = "{}ds/{}".format(self._request_endpoint, self._encode_uri_component(dataset_name))
+        if content_type == ContentType.TEXT and codec is None:
+            custom_args["headers"]["X-IBM-Data-Type"] = ContentType.TEXT.value
+        else:
+            # Binary content has no record boundaries and text converted locally needs them,
+            # so both are received as records
+            custom_args["headers"]["X-IBM-Data-Type"] = ContentType.RECORD.value
+            custom_args["headers"]["Accept"] = "application/octet-stream"
+        return custom_args
+
     def download(self, dataset_name: str, output_file: str) -> None:
         """Use `perform_download(content_type=ContenType.TEXT)` instead of this deprecated function."""
         response = self.get_content(dataset_name, stream=True)
@@ -816,6 +1185,253 @@ class Datasets(BaseFilesApi):  # type: ignore[misc]
 
         self.request_handler.perform_request("PUT", custom_args, expected_code=[200])
 
+    def recall_migrated_many(
+        self,
+        dataset_names: Iterable[str],
+        wait: bool = True,
+        max_workers: int = 8,
+        poll_interval: float = 15,
+        timeout: Optional[float] = None,
+    ) -> dict[str, HsmResult]:
+        """
+        Recall many migrated data sets, queuing all the recalls before waiting for them.
+
+        Parameters
+        ----------
+        dataset_names: Iterable[str]
+            Names of the data sets
+        wait: bool
+            Poll the data sets until they are recalled (default is True)
+        max_workers: int
+            Number of requests sent to z/OSMF at the same time (default is 8)
+        poll_interval: float
+            Number of seconds between two checks of the data sets being recalled (default is 15)
+        timeout: Optional[float]
+            Number of seconds after which data sets still migrated are reported as timed out, or None to wait
+            indefinitely (default is None)
+
+        Returns
+        -------
+        dict[str, HsmResult]
+            The outcome for each data set, by name
+        """
+
+        def is_recalled(request_handler: RequestHandler, dataset_name: str) -> bool:
+            attributes = self.__attributes(request_handler, dataset_name)
+            return attributes is not None and not self.__is_migrated(attributes)
+
+        batch = HsmBatch(self.request_handler, self.__hsm_submitter({"request": "hrecall"}), is_recalled, max_workers)
+        return batch.run(dataset_names, wait, poll_interval, timeout)
+
+    def migrate_many(
+        self,
+        dataset_names: Iterable[str],
+        wait: bool = True,
+        max_workers: int = 8,
+        poll_interval: float = 15,
+        timeout: Optional[float] = None,
+    ) -> dict[str, HsmResult]:
+        """
+        Migrate many data sets, queuing all the migrations before waiting for them.
+
+        Parameters
+        ----------
+        dataset_names: Iterable[str]
+            Names of the data sets
+        wait: bool
+            Poll the data sets until they are migrated (default is True)
+        max_workers: int
+            Number of requests sent to z/OSMF at the same time (default is 8)
+        poll_interval: float
+            Number of seconds between two checks of the data sets being migrated (default is 15)
+        timeout: Optional[float]
+            Number of seconds after which data sets not yet migrated are reported as timed out, or None to wait
+            indefinitely (default is None)
+
+        Returns
+        -------
+        dict[str, HsmResult]
+            The outcome for each data set, by name
+        """
+
+        def is_migrated(request_handler: RequestHandler, dataset_name: str) -> bool:
+            attributes = self.__attributes(request_handler, dataset_name)
+            return attributes is not None and self.__is_migrated(attributes)
+
+        batch = HsmBatch(self.request_handler, self.__hsm_submitter({"request": "hmigrate"}), is_migrated, max_workers)
+        return batch.run(dataset_names, wait, poll_interval, timeout)
+
+    def delete_migrated_many(
+        self,
+        dataset_names: Iterable[str],
+        purge: bool = False,
+        wait: bool = True,
+        max_workers: int = 8,
+        poll_interval: float = 15,
+        timeout: Optional[float] = None,
+    ) -> dict[str, HsmResult]:
+        """
+        Delete many migrated data sets, queuing all the deletions before waiting for them.
+
+        Parameters
+        ----------
+        dataset_names: Iterable[str]
+            Names of the data sets
+        purge: bool
+            If true, the function uses the PURGE=YES on ARCHDEL request, otherwise it uses the PURGE=NO.
+        wait: bool
+            Poll the data sets until they are deleted (default is True)
+        max_workers: int
+            Number of requests sent to z/OSMF at the same time (default is 8)
+        poll_interval: float
+            Number of seconds between two checks of the data sets being deleted (default is 15)
+        timeout: Optional[float]
+            Number of seconds after which data sets still cataloged are reported as timed out, or None to wait
+            indefinitely (default is None)
+
+        Returns
+        -------
+        dict[str, HsmResult]
+            The outcome for each data set, by name
+        """
+
+        def is_deleted(request_handler: RequestHandler, dataset_name: str) -> bool:
+            return self.__attributes(request_handler, dataset_name) is None
+
+        submit = self.__hsm_submitter({"request": "hdelete", "purge": purge})
+        return HsmBatch(self.request_handler, submit, is_deleted, max_workers).run(
+            dataset_names, wait, poll_interval, timeout
+        )
+
+    def retrieve_many(
+        self,
+        dataset_names: Iterable[str],
+        content_type: ContentType = ContentType.TEXT,
+        max_workers: int = 4,
+        poll_interval: float = 15,
+        timeout: Optional[float] = None,
+    ) -> Iterator[PrefetchResult]:
+        """
+        Retrieve the contents of many data sets or members, recalling the migrated data sets first.
+
+        The migration status of each data set is retrieved, the recalls of all the migrated ones are queued at
+        once, and the other data sets are read while HSM recalls them. Data sets are yielded in the order they
+        are read, which is not the order of `dataset_names`.
+
+        Parameters
+        ----------
+        dataset_names: Iterable[str]
+            Names of the data sets, or of members as "DATA.SET(MEMBER)"
+        content_type: ContentType
+            The content type to receive
+            ("text", "binary" or "record" (include a 4 byte big endian record len prefix), "text" by default)
+        max_workers: int
+            Number of requests sent to z/OSMF at the same time (default is 4)
+        poll_interval: float
+            Number of seconds between two checks of the data sets being recalled (default is 15)
+        timeout: Optional[float]
+            Number of seconds after which data sets still migrated are reported as timed out, or None to wait
+            indefinitely (default is None)
+
+        Returns
+        -------
+        Iterator[PrefetchResult]
+            The content of each data set, or the reason it could not be read
+        """
+
+        def is_migrated(request_handler: RequestHandler, dataset_name: str) -> bool:
+            attributes = self.__attributes(request_handler, dataset_name.split("(")[0])
+            return attributes is not None and self.__is_migrated(attributes)
+
+        submit_recall = self.__hsm_submitter({"request": "hrecall"})
+        queued: set[str] = set()
+        lock = threading.Lock()
+
+        def recall(request_handler: RequestHandler, dataset_name: str) -> None:
+            # Members of the same data set share one recall
+            base_name = dataset_name.split("(")[0].upper()
+            with lock:
+                if base_name in queued:
+                    return
+                queued.add(base_name)
+            submit_recall(request_handler, base_name)
+
+        def read(request_handler: RequestHandler, dataset_name: str) -> Union[str, bytes, None]:
+            custom_args = self.__content_arguments(dataset_name, content_type)
+            return request_handler.perform_request("GET", custom_args)
+
+        prefetch = RecallPrefetch(
+            self.request_handler,
+            is_migrated,
+            recall,
+            read,
+            max_workers,
+        )
+        return prefetch.run(dataset_names, poll_interval, timeout)
+
+    def __hsm_submitter(self, data: dict[str, Any]) -> Callable[[RequestHandler, str], None]:
+        """
+        Return a function queuing an HSM request for one data set, without waiting for it.
+
+        Parameters
+        ----------
+        data: dict[str, Any]
+            The body of the request
+
+        Returns
+        -------
+        Callable[[RequestHandler, str], None]
+            The function, called with the request handler of a worker thread and the data set name
+        """
+
+        def submit(request_handler: RequestHandler, dataset_name: str) -> None:
+            custom_args = self._create_custom_request_arguments()
+            custom_args["json"] = dict(data, wait=False)
+            custom_args["url"] = "{}ds/{}".format(self._request_endpoint, self._encode_uri_component(dataset_name))
+            request_handler.perform_request("PUT", custom_args, expected_code=[200])
+
+        return submit
+
+    def __attributes(self, request_handler: RequestHandler, dataset_name: str) -> Optional[DatasetResponse]:
+        """
+        Retrieve the attributes of one data set.
+
+        Parameters
+        ----------
+        request_handler: RequestHandler
+            The request handler of the calling thread
+        dataset_name: str
+            Name of the data set
+
+        Returns
+        -------
+        Optional[DatasetResponse]
+            The attributes, or None if the data set is not cataloged
+        """
+        custom_args = self._create_custom_request_arguments()
+        custom_args["params"] = {"dslevel": self._encode_uri_component(dataset_name)}
+        custom_args["url"] = "{}ds".format(self._request_endpoint)
+        custom_args["headers"]["X-IBM-Attributes"] = "base"
+        response = DatasetListResponse(request_handler.perform_request("GET", custom_args), True)
+        return next((item for item in response.items or [] if item.dsname == dataset_name.upper()), None)
+
+    @staticmethod
+    def __is_migrated(attributes: DatasetResponse) -> bool:
+        """
+        Return whether a data set is migrated.
+
+        Parameters
+        ----------
+        attributes: DatasetResponse
+            The attributes of the data set
+
+        Returns
+        -------
+        bool
+            True if the data set is migrated
+        """
+        return attributes.migr == "YES" or attributes.vol == "MIGRAT"
+
     def rename(self, before_dataset_name: str, after_dataset_name: str) -> None:
         """
         Rename the data set.
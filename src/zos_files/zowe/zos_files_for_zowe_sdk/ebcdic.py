@@ -0,0 +1,283 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import codecs
+import re
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
+
+_EBCDIC_NL = 0x15
+_EBCDIC_LF = 0x25
+_EBCDIC_SPACE = b"\x40"
+
+# Code points where IBM-1047 (Open Systems Latin 1) differs from IBM-037
+_CP1047_FROM_CP037 = {
+    0x5F: "^",
+    0xAD: "[",
+    0xB0: "\xac",
+    0xBA: "\xdd",
+    0xBB: "\xa8",
+    0xBD: "]",
+}
+
+SUPPORTED_CODEPAGES = (37, 273, 500, 1026, 1047, 1140)
+
+
+def _parse_codepage(encoding: str) -> Optional[int]:
+    """
+    Return the code page number of an encoding name such as "IBM-1047", "ibm037" or "cp500".
+
+    Parameters
+    ----------
+    encoding: str
+        The encoding name
+
+    Returns
+    -------
+    Optional[int]
+        The code page number, or None if the name is not a supported EBCDIC code page
+    """
+    match = re.fullmatch(r"(?:ibm|cp|ccsid)?[-_ ]?0*(\d+)", encoding.strip().lower())
+    if match is None or int(match.group(1)) not in SUPPORTED_CODEPAGES:
+        return None
+    return int(match.group(1))
+
+
+def _decoding_table(codepage: int) -> str:
+    """
+    Build the table mapping each byte of a code page to its Unicode character.
+
+    Parameters
+    ----------
+    codepage: int
+        The code page number
+
+    Returns
+    -------
+    str
+        A string of 256 characters indexed by byte value
+    """
+    if codepage == 1047:
+        table = list(bytes(range(256)).decode("cp037"))
+        for byte, char in _CP1047_FROM_CP037.items():
+            table[byte] = char
+    else:
+        table = list(bytes(range(256)).decode(f"cp{codepage:03d}"))
+    # Like z/OS Unicode Services, map the EBCDIC new line (NL) rather than line feed (LF) to "\n"
+    table[_EBCDIC_NL], table[_EBCDIC_LF] = "\n", "\x85"
+    return "".join(table)
+
+
+class RecordDecoder:
+    """
+    Class used to incrementally convert records prefixed with their 4 byte big endian length to lines of text.
+
+    Records may span chunks, so this decoder can be fed a streamed response chunk by chunk.
+
+    Parameters
+    ----------
+    codec: EbcdicCodec
+        The codec of the records
+    strip_trailing_blanks: bool
+        Remove trailing blanks from each record, as z/OSMF does when converting fixed length records
+    """
+
+    def __init__(self, codec: "EbcdicCodec", strip_trailing_blanks: bool = True):
+        self.codec = codec
+        self.strip_trailing_blanks = strip_trailing_blanks
+        self.records = 0
+        self.__pending = b""
+
+    def decode(self, chunk: bytes, final: bool = False) -> str:
+        """
+        Convert the complete records of the data received so far.
+
+        Parameters
+        ----------
+        chunk: bytes
+            The next bytes of the stream
+        final: bool
+            Whether this is the last chunk of the stream
+
+        Returns
+        -------
+        str
+            The text of the complete records, one line per record
+
+        Raises
+        ------
+        ValueError
+            If the stream ends in the middle of a record
+        """
+        data = self.__pending + chunk if self.__pending else bytes(chunk)
+        records = []
+        offset = 0
+        while offset + 4 <= len(data):
+            end = offset + 4 + int.from_bytes(data[offset : offset + 4], "big")
+            if end > len(data):
+                break
+            record = data[offset + 4 : end]
+            records.append(record.rstrip(_EBCDIC_SPACE) if self.strip_trailing_blanks else record)
+            offset = end
+        self.__pending = data[offset:]
+        if final and self.__pending:
+            raise ValueError("The record stream ended in the middle of a record")
+        self.records += len(records)
+        if not records:
+            return ""
+        # Join in EBCDIC so that the whole chunk is converted with a single translation
+        return self.codec.decode(bytes([_EBCDIC_NL]).join(records) + bytes([_EBCDIC_NL]))
+
+
+class EbcdicCodec:
+    """
+    Class used to convert text between an EBCDIC code page and Unicode on the client.
+
+    Converting locally lets text be transferred as binary data, so that z/OSMF does not spend mainframe CPU
+    on code page conversion. Each code page is a single byte code page, so any chunk of a stream can be
+    converted independently. Code pages whose characters are all in Latin-1 (e.g. IBM-037, IBM-273,
+    IBM-500 and IBM-1047) are converted with `bytes.translate`.
+
+    Parameters
+    ----------
+    encoding: str
+        The EBCDIC code page, e.g. "IBM-1047", "IBM-037", "IBM-273", "IBM-500", "IBM-1026" or "IBM-1140"
+
+    Raises
+    ------
+    ValueError
+        If the code page is not supported
+    """
+
+    def __init__(self, encoding: str):
+        codepage = _parse_codepage(encoding)
+        if codepage is None:
+            raise ValueError(
+                "Unsupported EBCDIC code page {}, expected one of {}".format(
+                    encoding, ", ".join(f"IBM-{number:03d}" for number in SUPPORTED_CODEPAGES)
+                )
+            )
+        self.encoding = f"IBM-{codepage:03d}"
+        self.decoding_table = _decoding_table(codepage)
+        self.__encoding_map = codecs.charmap_build(self.decoding_table)
+        self.__to_latin1: Optional[bytes] = None
+        self.__from_latin1: Optional[bytes] = None
+        if max(self.decoding_table) <= "\xff":
+            latin1 = self.decoding_table.encode("latin-1")
+            self.__to_latin1 = bytes.maketrans(bytes(range(256)), latin1)
+            self.__from_latin1 = bytes.maketrans(latin1, bytes(range(256)))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def for_encoding(encoding: str) -> "EbcdicCodec":
+        """
+        Return the shared codec of a code page.
+
+        Parameters
+        ----------
+        encoding: str
+            The EBCDIC code page, e.g. "IBM-1047"
+
+        Returns
+        -------
+        EbcdicCodec
+            The codec
+        """
+        return EbcdicCodec(encoding)
+
+    @staticmethod
+    def is_supported(encoding: str) -> bool:
+        """
+        Return whether a code page can be converted on the client.
+
+        Parameters
+        ----------
+        encoding: str
+            The encoding name, e.g. "IBM-1047"
+
+        Returns
+        -------
+        bool
+            True if the code page is supported
+        """
+        return _parse_codepage(encoding) is not None
+
+    def decode(self, data: bytes) -> str:
+        """
+        Convert EBCDIC bytes to text.
+
+        Parameters
+        ----------
+        data: bytes
+            The EBCDIC bytes
+
+        Returns
+        -------
+        str
+            The text
+        """
+        if self.__to_latin1 is not None:
+            return bytes(data).translate(self.__to_latin1).decode("latin-1")
+        return codecs.charmap_decode(data, "strict", self.decoding_table)[0]
+
+    def encode(self, text: str, errors: str = "strict") -> bytes:
+        """
+        Convert text to EBCDIC bytes.
+
+        Parameters
+        ----------
+        text: str
+            The text
+        errors: str
+            How characters missing from the code page are handled, as in `str.encode`
+
+        Returns
+        -------
+        bytes
+            The EBCDIC bytes
+        """
+        if self.__from_latin1 is not None and errors == "strict":
+            return text.encode("latin-1").translate(self.__from_latin1)
+        return codecs.charmap_encode(text, errors, self.__encoding_map)[0]
+
+    def iter_decode(self, chunks: Iterable[bytes]) -> Iterator[str]:
+        """
+        Convert a stream of EBCDIC bytes to text.
+
+        Parameters
+        ----------
+        chunks: Iterable[bytes]
+            The EBCDIC bytes, e.g. from `Response.iter_content`
+
+        Yields
+        ------
+        str
+            The text of each chunk
+        """
+        for chunk in chunks:
+            yield self.decode(chunk)
+
+    def record_decoder(self, strip_trailing_blanks: bool = True) -> RecordDecoder:
+        """
+        Create a decoder for records prefixed with their length, as retrieved with the "record" data type.
+
+        Parameters
+        ----------
+        strip_trailing_blanks: bool
+            Remove trailing blanks from each record (default is True)
+
+        Returns
+        -------
+        RecordDecoder
+            The decoder
+        """
+        return RecordDecoder(self, strip_trailing_blanks)
@@ -34,3 +34,19 @@ class MaxAllocationQuantityExceeded(Exception):
         super().__init__(
             "Maximum allocation quantity of {} exceeded".format(zos_file_constants["MaxAllocationQuantity"])
         )
+
+
+class DatasetNotCacheable(Exception):
+    """
+    Class used to represent a data set that cannot be kept in a local cache.
+
+    Parameters
+    ----------
+    dataset_name: str
+        The name of the data set
+    reason: str
+        Why the data set cannot be cached
+    """
+
+    def __init__(self, dataset_name: str, reason: str):
+        super().__init__("Data set {} cannot be cached: {}".format(dataset_name, reason))
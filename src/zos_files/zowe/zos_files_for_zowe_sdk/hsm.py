@@ -0,0 +1,308 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from zowe.core_for_zowe_sdk import RequestHandler
+from zowe.core_for_zowe_sdk.thread_pool import thread_pool
+
+
+class HsmStatus(Enum):
+    """Represents the state of an HSM request for one data set."""
+
+    QUEUED = "queued"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    TIMED_OUT = "timed out"
+
+
+@dataclass
+class HsmResult:
+    """Outcome of an HSM request for one data set."""
+
+    dataset_name: str
+    status: HsmStatus
+    error: Optional[str] = None
+
+
+@dataclass
+class PrefetchResult:
+    """Content of one data set read by `RecallPrefetch`."""
+
+    dataset_name: str
+    status: HsmStatus
+    content: Any = None
+    error: Optional[str] = None
+    recalled: bool = False
+
+
+class HsmBatch:
+    """
+    Class used to send an HSM request (recall, migrate or delete) for many data sets and track them concurrently.
+
+    Requests are queued by HSM without waiting, so that HSM processes them in parallel. Completion is then
+    checked by polling the attributes of the pending data sets, at most `max_workers` requests at a time.
+
+    Parameters
+    ----------
+    request_handler: RequestHandler
+        The request handler of the API object
+    submit: Callable[[RequestHandler, str], None]
+        Queues the request for one data set
+    is_complete: Callable[[RequestHandler, str], bool]
+        Checks whether the request for one data set completed
+    max_workers: int
+        Number of requests sent to z/OSMF at the same time (default is 8)
+
+    Raises
+    ------
+    ValueError
+        If `max_workers` is lower than 1
+    """
+
+    def __init__(
+        self,
+        request_handler: RequestHandler,
+        submit: Callable[[RequestHandler, str], None],
+        is_complete: Callable[[RequestHandler, str], bool],
+        max_workers: int = 8,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.request_handler = request_handler
+        self.submit = submit
+        self.is_complete = is_complete
+        self.max_workers = max_workers
+
+    def run(
+        self,
+        dataset_names: Iterable[str],
+        wait: bool = True,
+        poll_interval: float = 15,
+        timeout: Optional[float] = None,
+    ) -> dict[str, HsmResult]:
+        """
+        Queue the request for each data set and optionally wait for all of them.
+
+        Parameters
+        ----------
+        dataset_names: Iterable[str]
+            Names of the data sets
+        wait: bool
+            Poll the data sets until their requests complete (default is True)
+        poll_interval: float
+            Number of seconds between two checks of the pending data sets (default is 15)
+        timeout: Optional[float]
+            Number of seconds after which pending data sets are reported as timed out, or None to wait
+            indefinitely (default is None)
+
+        Returns
+        -------
+        dict[str, HsmResult]
+            The outcome for each data set, by name. Without `wait`, data sets whose request was accepted are "queued"
+        """
+        names = list(dict.fromkeys(dataset_names))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # The same worker threads, and so the same connections, are used for all the polls
+        with thread_pool(self.max_workers, len(names)) as executor:
+            results = dict(zip(names, executor.map(self.__submit, names)))
+            pending = [name for name, result in results.items() if result.status == HsmStatus.QUEUED]
+            while wait and pending:
+                for result in executor.map(self.__check, pending):
+                    if result.status != HsmStatus.QUEUED:
+                        results[result.dataset_name] = result
+                pending = [name for name in pending if results[name].status == HsmStatus.QUEUED]
+                if not pending:
+                    break
+                if deadline is not None and time.monotonic() + poll_interval > deadline:
+                    for name in pending:
+                        results[name] = HsmResult(name, HsmStatus.TIMED_OUT)
+                    break
+                time.sleep(poll_interval)
+        return results
+
+    def __submit(self, name: str) -> HsmResult:
+        """
+        Queue the request for one data set.
+
+        Parameters
+        ----------
+        name: str
+            Name of the data set
+
+        Returns
+        -------
+        HsmResult
+            "queued", or "failed" with the error if z/OSMF rejected the request
+        """
+        try:
+            self.submit(self.request_handler.for_current_thread(), name)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return HsmResult(name, HsmStatus.FAILED, str(error))
+        return HsmResult(name, HsmStatus.QUEUED)
+
+    def __check(self, name: str) -> HsmResult:
+        """
+        Check whether the request for one data set completed.
+
+        Parameters
+        ----------
+        name: str
+            Name of the data set
+
+        Returns
+        -------
+        HsmResult
+            "completed", "queued", or "failed" with the error if the data set could not be checked
+        """
+        try:
+            complete = self.is_complete(self.request_handler.for_current_thread(), name)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return HsmResult(name, HsmStatus.FAILED, str(error))
+        return HsmResult(name, HsmStatus.COMPLETED if complete else HsmStatus.QUEUED)
+
+
+class RecallPrefetch:
+    """
+    Class used to read many data sets, recalling the migrated ones before reading them.
+
+    The migration status of every data set is checked first. Recalls of all the migrated data sets are queued
+    up front without waiting, and the data sets that are available are read while HSM recalls the others,
+    which are polled and read as soon as they are recalled. Results are therefore returned in the order the
+    data sets become readable rather than in the requested order, and reads never stall on an implicit recall.
+
+    Parameters
+    ----------
+    request_handler: RequestHandler
+        The request handler of the API object
+    is_migrated: Callable[[RequestHandler, str], bool]
+        Checks whether one data set is migrated
+    recall: Callable[[RequestHandler, str], None]
+        Queues the recall of one data set
+    read: Callable[[RequestHandler, str], Any]
+        Reads one data set
+    max_workers: int
+        Number of requests sent to z/OSMF at the same time (default is 4)
+
+    Raises
+    ------
+    ValueError
+        If `max_workers` is lower than 1
+    """
+
+    def __init__(
+        self,
+        request_handler: RequestHandler,
+        is_migrated: Callable[[RequestHandler, str], bool],
+        recall: Callable[[RequestHandler, str], None],
+        read: Callable[[RequestHandler, str], Any],
+        max_workers: int = 4,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.request_handler = request_handler
+        self.is_migrated = is_migrated
+        self.recall = recall
+        self.read = read
+        self.max_workers = max_workers
+
+    def run(
+        self, dataset_names: Iterable[str], poll_interval: float = 15, timeout: Optional[float] = None
+    ) -> Iterator[PrefetchResult]:
+        """
+        Read the data sets, yielding each one as soon as it has been read.
+
+        Parameters
+        ----------
+        dataset_names: Iterable[str]
+            Names of the data sets
+        poll_interval: float
+            Number of seconds between two checks of the data sets being recalled (default is 15)
+        timeout: Optional[float]
+            Number of seconds after which data sets still migrated are reported as timed out, or None to wait
+            indefinitely (default is None)
+
+        Yields
+        ------
+        PrefetchResult
+            The content of a data set ("completed"), or why it could not be read ("failed" or "timed out")
+        """
+        names = list(dict.fromkeys(dataset_names))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        executor = thread_pool(self.max_workers, len(names))
+        futures: dict[Future, tuple[str, str]] = {}
+        # Data sets whose recall is queued, and which are polled until they are recalled
+        recalling: dict[str, None] = {}
+        recalled: set[str] = set()
+        next_poll = 0.0
+        try:
+            for name in names:
+                futures[executor.submit(self.__call, self.is_migrated, name)] = ("status", name)
+            while futures or recalling:
+                polling = any(stage == "check" for stage, _ in futures.values())
+                wait_time = None if polling or not recalling else max(next_poll - time.monotonic(), 0)
+                done, _ = wait(list(futures), timeout=wait_time, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, name = futures.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        recalling.pop(name, None)
+                        yield PrefetchResult(name, HsmStatus.FAILED, error=str(error), recalled=name in recalled)
+                    elif stage == "read":
+                        yield PrefetchResult(name, HsmStatus.COMPLETED, future.result(), recalled=name in recalled)
+                    elif stage == "status" and future.result():
+                        futures[executor.submit(self.__call, self.recall, name)] = ("recall", name)
+                    elif stage == "recall":
+                        if not recalling:
+                            next_poll = time.monotonic() + poll_interval
+                        recalling[name] = None
+                        recalled.add(name)
+                    elif stage == "status" or not future.result():
+                        # Available, or recalled since the last check
+                        recalling.pop(name, None)
+                        futures[executor.submit(self.__call, self.read, name)] = ("read", name)
+                polling = any(stage == "check" for stage, _ in futures.values())
+                if recalling and not polling and time.monotonic() >= next_poll:
+                    if deadline is not None and time.monotonic() >= deadline:
+                        for name in recalling:
+                            yield PrefetchResult(name, HsmStatus.TIMED_OUT, recalled=True)
+                        recalling.clear()
+                    else:
+                        for name in recalling:
+                            futures[executor.submit(self.__call, self.is_migrated, name)] = ("check", name)
+                        next_poll = time.monotonic() + poll_interval
+        finally:
+            # Stop reading the remaining data sets if the caller stopped iterating
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __call(self, function: Callable[[RequestHandler, str], Any], name: str) -> Any:
+        """
+        Call one of the functions with the request handler of the current worker thread.
+
+        Parameters
+        ----------
+        function: Callable[[RequestHandler, str], Any]
+            The function
+        name: str
+            Name of the data set
+
+        Returns
+        -------
+        Any
+            The result of the function
+        """
+        request_handler = self.request_handler.for_current_thread()
+        return function(request_handler, name)
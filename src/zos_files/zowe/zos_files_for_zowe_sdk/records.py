@@ -0,0 +1,124 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import struct
+from typing import Iterable, Iterator, Optional, Union
+
+_LENGTH_PREFIX = struct.Struct(">I")
+
+
+class RecordReader:
+    """
+    Class used to split a stream of records prefixed with their 4 byte big endian length.
+
+    Chunks are copied once into a reusable buffer and records are returned as `memoryview` slices of it,
+    without copying each record. A record is only valid until the next one is read (or, in batch mode, until
+    the next batch is read); call `bytes(record)` to keep it longer.
+
+    Parameters
+    ----------
+    chunks: Iterable[bytes]
+        The stream, e.g. `Response.iter_content()` of a request using the "record" data type
+    buffer_size: int
+        Initial size of the buffer, grown when a record does not fit (default is 1 MiB)
+    """
+
+    def __init__(self, chunks: Iterable[bytes], buffer_size: int = 1024 * 1024):
+        self.chunks = chunks
+        self.buffer_size = buffer_size
+
+    def __iter__(self) -> Iterator[memoryview]:
+        """
+        Read the records one by one.
+
+        Yields
+        ------
+        memoryview
+            The data of each record, without its length prefix
+        """
+        yield from self.__read(None)
+
+    def batches(self, batch_size: int = 1000) -> Iterator[list[memoryview]]:
+        """
+        Read the records in batches.
+
+        Parameters
+        ----------
+        batch_size: int
+            Maximum number of records in each batch (default is 1000)
+
+        Yields
+        ------
+        list[memoryview]
+            The data of the records of each batch, without their length prefixes
+
+        Raises
+        ------
+        ValueError
+            If `batch_size` is lower than 1
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        yield from self.__read(batch_size)
+
+    def __read(self, batch_size: Optional[int]) -> Iterator[Union[memoryview, list[memoryview]]]:
+        """
+        Parse the stream into records.
+
+        Parameters
+        ----------
+        batch_size: Optional[int]
+            Number of records in each batch, or None to yield records one by one
+
+        Yields
+        ------
+        Union[memoryview, list[memoryview]]
+            Each record, or each batch of records
+
+        Raises
+        ------
+        ValueError
+            If the stream ends in the middle of a record
+        """
+        buffer = bytearray(self.buffer_size)
+        view = memoryview(buffer)
+        start = end = 0
+        batch: list[memoryview] = []
+        for chunk in self.chunks:
+            size = len(chunk)
+            if end + size > len(buffer):
+                leftover = bytes(view[start:end])
+                if batch or len(leftover) + size > len(buffer):
+                    # Records of the pending batch still point into the current buffer, so it cannot be reused
+                    buffer = bytearray(max(len(buffer), 2 * (len(leftover) + size)))
+                    view = memoryview(buffer)
+                view[: len(leftover)] = leftover
+                start, end = 0, len(leftover)
+            view[end : end + size] = chunk
+            end += size
+            while end - start >= 4:
+                stop = start + 4 + _LENGTH_PREFIX.unpack_from(buffer, start)[0]
+                if stop > end:
+                    break
+                record = view[start + 4 : stop]
+                start = stop
+                if batch_size is None:
+                    yield record
+                    continue
+                batch.append(record)
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+        if start != end:
+            raise ValueError("The record stream ended in the middle of a record")
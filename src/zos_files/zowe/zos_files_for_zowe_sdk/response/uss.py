@@ -10,6 +10,7 @@ SPDX-License-Identifier: EPL-2.0
 Copyright Contributors to the Zowe Project.
 """
 
+import re
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Optional
@@ -110,3 +111,25 @@ class USSFileTag:
     def __setitem__(self, key: str, value: Any) -> None:
         """Set item by key."""
         self.__dict__[key] = value
+
+    @staticmethod
+    def from_listing(response: dict[str, Any]) -> dict[str, "USSFileTag"]:
+        """
+        Parse the output of 'chtag list' for several files, e.g. of a recursive listing.
+
+        Parameters
+        ----------
+        response: dict[str, Any]
+            The response of the 'chtag list' request
+
+        Returns
+        -------
+        dict[str, USSFileTag]
+            The tag of each file, by path
+        """
+        tags = {}
+        for line in response.get("stdout") or []:
+            match = re.search(r" T=(?:on|off)\s+(\S.*)$", line)
+            if match is not None:
+                tags[match.group(1)] = USSFileTag({"stdout": [line]})
+        return tags
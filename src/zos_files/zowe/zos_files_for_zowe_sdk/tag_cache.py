@@ -0,0 +1,101 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import posixpath
+import threading
+import time
+from typing import Optional
+
+from .constants import zos_file_constants
+from .response import USSFileTag
+
+
+class USSTagCache:
+    """
+    Class used to remember the tags of USS files for a limited time.
+
+    The cache is shared by the threads of an API object. Entries expire after `ttl` seconds and are
+    invalidated when the SDK writes or deletes the file, but changes made by other clients are only
+    seen once the entry expires.
+
+    Parameters
+    ----------
+    ttl: float
+        Number of seconds a tag is kept (default is 300)
+    """
+
+    def __init__(self, ttl: float = zos_file_constants["TagCacheTTL"]):
+        self.ttl = ttl
+        self.__tags: dict[str, tuple[float, USSFileTag]] = {}
+        self.__lock = threading.Lock()
+
+    def get(self, file_path: str) -> Optional[USSFileTag]:
+        """
+        Return the tag of a file if it is cached and has not expired.
+
+        Parameters
+        ----------
+        file_path: str
+            Path of the file
+
+        Returns
+        -------
+        Optional[USSFileTag]
+            The tag, or None if it must be retrieved
+        """
+        path = posixpath.normpath(file_path)
+        with self.__lock:
+            entry = self.__tags.get(path)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self.__tags[path]
+                return None
+            return entry[1]
+
+    def set(self, file_path: str, tag: USSFileTag) -> None:
+        """
+        Remember the tag of a file.
+
+        Parameters
+        ----------
+        file_path: str
+            Path of the file
+        tag: USSFileTag
+            The tag
+        """
+        with self.__lock:
+            self.__tags[posixpath.normpath(file_path)] = (time.monotonic() + self.ttl, tag)
+
+    def invalidate(self, file_path: str, recursive: bool = False) -> None:
+        """
+        Forget the tag of a file, and of the files below it if it is a directory.
+
+        Parameters
+        ----------
+        file_path: str
+            Path of the file or directory
+        recursive: bool
+            Also forget the tags of the files below the directory (default is False)
+        """
+        path = posixpath.normpath(file_path)
+        prefix = path.rstrip("/") + "/"
+        with self.__lock:
+            self.__tags.pop(path, None)
+            if recursive:
+                for cached_path in [cached for cached in self.__tags if cached.startswith(prefix)]:
+                    del self.__tags[cached_path]
+
+    def clear(self) -> None:
+        """Forget all tags."""
+        with self.__lock:
+            self.__tags.clear()
@@ -0,0 +1,648 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import copy
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+from requests import Response
+from zowe.core_for_zowe_sdk import Log, RequestHandler
+from zowe.core_for_zowe_sdk.file_cache import atomic_write
+from zowe.core_for_zowe_sdk.exceptions import RequestFailed
+
+from .constants import ContentType, zos_file_constants
+from .ebcdic import EbcdicCodec
+
+_CHUNK_SIZE = 65536
+_DIGEST_SIZE = 65536
+# Status code for a range starting past the end of the data
+_OUT_OF_RANGE_STATUS = 416
+
+
+def _tail_digest(local_file_path: str, size: int) -> str:
+    """
+    Hash the last bytes of the first `size` bytes of a local file.
+
+    Parameters
+    ----------
+    local_file_path: str
+        Path of the local file
+    size: int
+        Number of bytes of the file that have been downloaded
+
+    Returns
+    -------
+    str
+        The SHA-256 digest, in hexadecimal
+    """
+    length = min(size, _DIGEST_SIZE)
+    with open(local_file_path, "rb") as f:
+        f.seek(size - length)
+        return hashlib.sha256(f.read(length)).hexdigest()
+
+
+@dataclass
+class TransferCheckpoint:
+    """Progress of a resumable download, stored in a sidecar file next to the local file."""
+
+    remote: str
+    mode: str
+    position: int = 0
+    size: int = 0
+    digest: Optional[str] = None
+    etag: Optional[str] = None
+
+    @staticmethod
+    def path_for(local_file_path: str) -> str:
+        """
+        Return the path of the checkpoint file of a download.
+
+        Parameters
+        ----------
+        local_file_path: str
+            Path of the local file being downloaded
+
+        Returns
+        -------
+        str
+            Path of the checkpoint file
+        """
+        return local_file_path + zos_file_constants["CheckpointSuffix"]
+
+    @staticmethod
+    def load(local_file_path: str, remote: str, mode: str) -> "TransferCheckpoint":
+        """
+        Return the checkpoint to resume a download from.
+
+        The checkpoint is only used if it was recorded for the same remote file and transfer mode and the
+        local file still holds the data it describes; the local file is then truncated to the checkpointed
+        size, dropping data received after the last checkpoint. Otherwise the download starts over.
+
+        Parameters
+        ----------
+        local_file_path: str
+            Path of the local file being downloaded
+        remote: str
+            Name of the remote data set or path of the remote USS file
+        mode: str
+            Description of the content type and encodings of the transfer
+
+        Returns
+        -------
+        TransferCheckpoint
+            The verified checkpoint, or an empty checkpoint if the download must start over
+        """
+        try:
+            with open(TransferCheckpoint.path_for(local_file_path), "r", encoding="utf-8") as f:
+                checkpoint = TransferCheckpoint(**json.load(f))
+            valid = (
+                checkpoint.remote == remote
+                and checkpoint.mode == mode
+                and os.path.getsize(local_file_path) >= checkpoint.size
+                and (checkpoint.size == 0 or _tail_digest(local_file_path, checkpoint.size) == checkpoint.digest)
+            )
+        except (OSError, ValueError, TypeError):
+            valid = False
+        if not valid:
+            checkpoint = TransferCheckpoint(remote, mode)
+        with open(local_file_path, "ab") as f:
+            f.truncate(checkpoint.size)
+        return checkpoint
+
+    def save(self, local_file_path: str) -> None:
+        """
+        Atomically record the progress of a download.
+
+        Parameters
+        ----------
+        local_file_path: str
+            Path of the local file being downloaded
+        """
+        self.digest = _tail_digest(local_file_path, self.size) if self.size else None
+        with atomic_write(TransferCheckpoint.path_for(local_file_path), "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f)
+
+    @staticmethod
+    def remove(local_file_path: str) -> None:
+        """
+        Delete the checkpoint file of a completed download.
+
+        Parameters
+        ----------
+        local_file_path: str
+            Path of the local file that was downloaded
+        """
+        checkpoint_path = TransferCheckpoint.path_for(local_file_path)
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+
+class _RecordParser:
+    """Count records prefixed with their 4 byte big endian length, optionally removing the prefixes."""
+
+    def __init__(self, strip_prefixes: bool):
+        self.records = 0
+        self.__strip_prefixes = strip_prefixes
+        self.__prefix = bytearray()
+        self.__remaining = 0
+
+    def feed(self, chunk: bytes) -> bytes:
+        """
+        Parse the next chunk of the stream.
+
+        Parameters
+        ----------
+        chunk: bytes
+            The next bytes of the stream
+
+        Returns
+        -------
+        bytes
+            The bytes to write to the local file
+        """
+        data = bytearray()
+        view = memoryview(chunk)
+        while view:
+            if self.__remaining:
+                length = min(self.__remaining, len(view))
+                if self.__strip_prefixes:
+                    data += view[:length]
+                view = view[length:]
+                self.__remaining -= length
+                if not self.__remaining:
+                    self.records += 1
+                continue
+            length = 4 - len(self.__prefix)
+            self.__prefix += view[:length]
+            view = view[length:]
+            if len(self.__prefix) == 4:
+                self.__remaining = int.from_bytes(self.__prefix, "big")
+                self.__prefix.clear()
+                if not self.__remaining:
+                    self.records += 1
+        return bytes(data) if self.__strip_prefixes else chunk
+
+
+def _write_records(
+    response: Response,
+    local_file_path: str,
+    content_type: ContentType,
+    encoding: Optional[str],
+    codec: Optional[EbcdicCodec] = None,
+) -> int:
+    """
+    Append the records of a streamed response using the "record" data type to a local file.
+
+    Parameters
+    ----------
+    response: Response
+        The streamed response
+    local_file_path: str
+        Path of the local file
+    content_type: ContentType
+        How records are written locally: "text" converts them to lines in `encoding` with `codec`,
+        "record" keeps the 4 byte length prefixes and "binary" removes them
+    encoding: Optional[str]
+        Encoding of the local file for "text" content
+    codec: Optional[EbcdicCodec]
+        Codec converting "text" content on the client
+
+    Returns
+    -------
+    int
+        The number of records received
+    """
+    if content_type == ContentType.TEXT and codec is not None:
+        decoder = codec.record_decoder()
+        with open(local_file_path, "a", encoding=encoding) as f:
+            for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                f.write(decoder.decode(chunk))
+            decoder.decode(b"", final=True)
+        return decoder.records
+    parser = _RecordParser(strip_prefixes=content_type == ContentType.BINARY)
+    with open(local_file_path, "ab") as f:
+        for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+            f.write(parser.feed(chunk))
+    return parser.records
+
+
+def _is_out_of_range(error: RequestFailed) -> bool:
+    """
+    Return whether a failed record range request started past the end of the data.
+
+    z/OSMF answers such a range either with status 416, or with status 400 and a message about the
+    "X-IBM-Record-Range" header. Any other error is a real failure, e.g. an expired session.
+
+    Parameters
+    ----------
+    error: RequestFailed
+        The error of the request
+
+    Returns
+    -------
+    bool
+        True if the error marks the end of the data
+    """
+    if error.status_code == _OUT_OF_RANGE_STATUS:
+        return True
+    if error.status_code != 400:
+        return False
+    # The request output is the URL, headers and body of the request, followed by the text of the response
+    response_text = str(error.request_output).split("\n", 3)[-1]
+    try:
+        response_json = json.loads(response_text)
+    except ValueError:
+        return False
+    message = response_json.get("message", "") if isinstance(response_json, dict) else ""
+    return "record-range" in str(message).lower() or "record range" in str(message).lower()
+
+
+class ResumableDownload:
+    """
+    Class used to download a remote file in parts, recording the progress in a checkpoint file.
+
+    Downloads interrupted by a network error can be resumed by running them again: the local file is
+    verified against the checkpoint and only the remaining data is requested. If the remote file changed
+    since the checkpoint (its ETag differs), the download starts over.
+
+    Parameters
+    ----------
+    request_handler: RequestHandler
+        The request handler of the API object
+    request_arguments: dict[str, Any]
+        Arguments of the request retrieving the whole remote file
+    local_file_path: str
+        Path of the local file
+    remote: str
+        Name of the remote data set or path of the remote USS file
+    mode: str
+        Description of the content type and encodings of the transfer, checked when resuming
+    """
+
+    def __init__(
+        self,
+        request_handler: RequestHandler,
+        request_arguments: dict[str, Any],
+        local_file_path: str,
+        remote: str,
+        mode: str,
+    ):
+        self.request_handler = request_handler
+        self.request_arguments = request_arguments
+        self.local_file_path = local_file_path
+        self.checkpoint = TransferCheckpoint.load(local_file_path, remote, mode)
+        self.__logger = Log.register_logger(__name__)
+
+    def by_records(
+        self,
+        content_type: ContentType,
+        encoding: Optional[str] = None,
+        records_per_request: int = zos_file_constants["ResumeRecordsPerRequest"],
+        codec: Optional[EbcdicCodec] = None,
+    ) -> None:
+        """
+        Download the remote file in ranges of records using the "X-IBM-Record-Range" header.
+
+        The request must use the "record" data type, so that records are counted exactly.
+
+        Parameters
+        ----------
+        content_type: ContentType
+            How records are written locally: "text" converts them to lines in `encoding` with `codec`,
+            "record" keeps the 4 byte length prefixes and "binary" removes them
+        encoding: Optional[str]
+            Encoding of the local file for "text" content
+        records_per_request: int
+            Number of records requested at once; progress is recorded after each request
+        codec: Optional[EbcdicCodec]
+            Codec converting "text" content on the client, required for "text" content
+
+        Raises
+        ------
+        ValueError
+            If "text" content is not converted on the client
+        RequestFailed
+            If z/OSMF rejects a range for another reason than starting past the end of the data
+        """
+        if content_type == ContentType.TEXT and codec is None:
+            # Text converted by z/OSMF cannot be counted in records: a record holding a line feed becomes two lines
+            self.__logger.error("Text must be converted on the client to be downloaded in ranges of records")
+            raise ValueError("Text must be converted on the client to be downloaded in ranges of records")
+        while True:
+            request_arguments = copy.deepcopy(self.request_arguments)
+            request_arguments["headers"]["X-IBM-Record-Range"] = f"{self.checkpoint.position},{records_per_request}"
+            try:
+                response = self.__request(request_arguments, [200])
+            except RequestFailed as error:
+                if not self.checkpoint.position or not _is_out_of_range(error):
+                    raise
+                # The previous range ended exactly at the end of the data
+                break
+            if response is None:
+                continue
+            try:
+                records = _write_records(response, self.local_file_path, content_type, encoding, codec)
+            finally:
+                response.close()
+            self.checkpoint.position += records
+            self.checkpoint.size = os.path.getsize(self.local_file_path)
+            self.checkpoint.save(self.local_file_path)
+            if records < records_per_request:
+                break
+        TransferCheckpoint.remove(self.local_file_path)
+
+    def by_bytes(
+        self,
+        checkpoint_bytes: int = zos_file_constants["ResumeCheckpointBytes"],
+        codec: Optional[EbcdicCodec] = None,
+        encoding: Optional[str] = None,
+    ) -> None:
+        """
+        Download the remote file as binary data, resuming with an HTTP "Range" header.
+
+        Parameters
+        ----------
+        checkpoint_bytes: int
+            Number of bytes received between two updates of the checkpoint
+        codec: Optional[EbcdicCodec]
+            Codec converting the data to text on the client (default is None, i.e. the data is written as is)
+        encoding: Optional[str]
+            Encoding of the local file when the data is converted to text
+        """
+        while True:
+            request_arguments = copy.deepcopy(self.request_arguments)
+            if self.checkpoint.position:
+                request_arguments["headers"]["Range"] = f"bytes={self.checkpoint.position}-"
+            response = self.__request(request_arguments, [200, 206])
+            if response is None:
+                continue
+            if self.checkpoint.position and response.status_code != 206:
+                self.__logger.warning(f"Range requests are not supported for {self.checkpoint.remote}; starting over")
+                self.__reset()
+            try:
+                with open(self.local_file_path, "ab") as f:
+                    unsaved = 0
+                    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                        f.write(chunk if codec is None else codec.decode(chunk).encode(encoding or "utf-8"))
+                        unsaved += len(chunk)
+                        if unsaved >= checkpoint_bytes:
+                            self.__save_bytes(f, unsaved)
+                            unsaved = 0
+                    self.__save_bytes(f, unsaved)
+            finally:
+                response.close()
+            break
+        TransferCheckpoint.remove(self.local_file_path)
+
+    def __request(self, request_arguments: dict[str, Any], expected_code: list[int]) -> Optional[Response]:
+        """
+        Send a streamed request for the next part of the remote file.
+
+        Parameters
+        ----------
+        request_arguments: dict[str, Any]
+            Arguments of the request
+        expected_code: list[int]
+            The acceptable response codes
+
+        Returns
+        -------
+        Optional[Response]
+            The response, or None if the remote file changed and the download was reset
+        """
+        response: Response = self.request_handler.perform_request(
+            "GET", request_arguments, expected_code=expected_code, stream=True
+        )
+        etag = response.headers.get("ETag")
+        if self.checkpoint.position and self.checkpoint.etag and etag and etag != self.checkpoint.etag:
+            response.close()
+            self.__logger.warning(f"{self.checkpoint.remote} changed since the last checkpoint; starting over")
+            self.__reset()
+            return None
+        self.checkpoint.etag = etag or self.checkpoint.etag
+        return response
+
+    def __save_bytes(self, f: Any, received: int) -> None:
+        """
+        Record the bytes received so far.
+
+        Parameters
+        ----------
+        f: Any
+            The local file, open for writing
+        received: int
+            Number of bytes received since the last checkpoint
+        """
+        f.flush()
+        self.checkpoint.position += received
+        self.checkpoint.size = f.tell()
+        self.checkpoint.save(self.local_file_path)
+
+    def __reset(self) -> None:
+        """Discard the downloaded data and start over."""
+        with open(self.local_file_path, "wb"):
+            pass
+        self.checkpoint = TransferCheckpoint(self.checkpoint.remote, self.checkpoint.mode)
+
+
+class SegmentedDownload:
+    """
+    Class used to download a remote file as ranges of records fetched concurrently.
+
+    Each range is requested with the "X-IBM-Record-Range" header and streamed to a temporary part file,
+    and the parts are appended to the local file in order as soon as all previous parts are complete.
+    Every worker thread reuses its own connection for the ranges it downloads.
+
+    Ranges are counted in records, and the size of variable length records and of converted text is only
+    known once they are received, so a range cannot be written at its offset in a preallocated local file
+    while the previous ranges are still in flight. Part files are the price of fetching them concurrently.
+
+    Parameters
+    ----------
+    request_handler: RequestHandler
+        The request handler of the API object
+    request_arguments: dict[str, Any]
+        Arguments of the request retrieving the whole remote file
+    local_file_path: str
+        Path of the local file
+    max_workers: int
+        Number of ranges downloaded at the same time
+    records_per_segment: int
+        Number of records in each range
+
+    Raises
+    ------
+    ValueError
+        If `max_workers` or `records_per_segment` is lower than 1
+    """
+
+    def __init__(
+        self,
+        request_handler: RequestHandler,
+        request_arguments: dict[str, Any],
+        local_file_path: str,
+        max_workers: int = 4,
+        records_per_segment: int = zos_file_constants["ResumeRecordsPerRequest"],
+    ):
+        self.__logger = Log.register_logger(__name__)
+        if max_workers < 1 or records_per_segment < 1:
+            self.__logger.error("max_workers and records_per_segment must be at least 1")
+            raise ValueError("max_workers and records_per_segment must be at least 1")
+        self.request_handler = request_handler
+        self.request_arguments = request_arguments
+        self.local_file_path = local_file_path
+        self.max_workers = max_workers
+        self.records_per_segment = records_per_segment
+        self.__lock = threading.Lock()
+        # Index of the first range known to end the data
+        self.__last_segment: Optional[int] = None
+
+    def run(
+        self, content_type: ContentType, encoding: Optional[str] = None, codec: Optional[EbcdicCodec] = None
+    ) -> None:
+        """
+        Download all ranges and assemble them into the local file.
+
+        The request must use the "record" data type, so that records are counted exactly.
+
+        Parameters
+        ----------
+        content_type: ContentType
+            How records are written locally: "text" converts them to lines in `encoding` with `codec`,
+            "record" keeps the 4 byte length prefixes and "binary" removes them
+        encoding: Optional[str]
+            Encoding of the local file for "text" content
+        codec: Optional[EbcdicCodec]
+            Codec converting "text" content on the client, required for "text" content
+
+        Raises
+        ------
+        ValueError
+            If "text" content is not converted on the client
+        """
+        if content_type == ContentType.TEXT and codec is None:
+            # Text converted by z/OSMF cannot be counted in records: a record holding a line feed becomes two lines
+            self.__logger.error("Text must be converted on the client to be downloaded in ranges of records")
+            raise ValueError("Text must be converted on the client to be downloaded in ranges of records")
+        part_prefix = os.path.join(
+            os.path.dirname(os.path.abspath(self.local_file_path)),
+            f".{os.path.basename(self.local_file_path)}.{uuid.uuid4().hex}",
+        )
+        # Keep more ranges in flight than workers so that a slow range does not leave the others idle
+        window = 2 * self.max_workers
+        in_flight: deque[Future[int]] = deque()
+        submitted = 0
+        self.__last_segment = None
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="zowe-segment")
+        try:
+            with open(self.local_file_path, "wb") as out_file:
+                for segment in itertools.count():
+                    # Stop scheduling ranges once one of them is known to end the data
+                    while len(in_flight) < window and (self.__last_segment is None or submitted <= self.__last_segment):
+                        in_flight.append(
+                            executor.submit(
+                                self.__download_segment,
+                                submitted,
+                                f"{part_prefix}.{submitted}",
+                                content_type,
+                                encoding,
+                                codec,
+                            )
+                        )
+                        submitted += 1
+                    records = in_flight.popleft().result()
+                    part_path = f"{part_prefix}.{segment}"
+                    with open(part_path, "rb") as part_file:
+                        shutil.copyfileobj(part_file, out_file, _CHUNK_SIZE)
+                    os.remove(part_path)
+                    if records < self.records_per_segment:
+                        break
+        finally:
+            for future in in_flight:
+                future.cancel()
+            # Ranges past the end of the file may still be in flight; wait for them before removing their parts
+            executor.shutdown(wait=True)
+            for segment in range(submitted):
+                part_path = f"{part_prefix}.{segment}"
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+        self.__logger.info(f"Downloaded {self.local_file_path} in {segment + 1} ranges")
+
+    def __download_segment(
+        self,
+        segment: int,
+        part_path: str,
+        content_type: ContentType,
+        encoding: Optional[str],
+        codec: Optional[EbcdicCodec],
+    ) -> int:
+        """
+        Download one range of records to a part file.
+
+        Parameters
+        ----------
+        segment: int
+            Index of the range
+        part_path: str
+            Path of the part file
+        content_type: ContentType
+            How records are written locally
+        encoding: Optional[str]
+            Encoding of the local file for "text" content
+        codec: Optional[EbcdicCodec]
+            Codec converting "text" content on the client
+
+        Returns
+        -------
+        int
+            The number of records received, 0 for a range past the end of the data
+
+        Raises
+        ------
+        RequestFailed
+            If z/OSMF rejects the range for another reason than starting past the end of the data
+        """
+        with open(part_path, "wb"):
+            pass
+        if self.__last_segment is not None and segment > self.__last_segment:
+            return 0
+        request_handler = self.request_handler.for_current_thread()
+        request_arguments = copy.deepcopy(self.request_arguments)
+        request_arguments["headers"][
+            "X-IBM-Record-Range"
+        ] = f"{segment * self.records_per_segment},{self.records_per_segment}"
+        response: Optional[Response] = None
+        try:
+            response = request_handler.perform_request("GET", request_arguments, stream=True)
+        except RequestFailed as error:
+            if not segment or not _is_out_of_range(error):
+                raise
+        records = 0
+        if response is not None:
+            try:
+                records = _write_records(response, part_path, content_type, encoding, codec)
+            finally:
+                response.close()
+        if records < self.records_per_segment:
+            with self.__lock:
+                if self.__last_segment is None or segment < self.__last_segment:
+                    self.__last_segment = segment
+        return records
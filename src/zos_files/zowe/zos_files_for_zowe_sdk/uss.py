@@ -11,15 +11,22 @@ Copyright Contributors to the Zowe Project.
 """
 
 import os
-from typing import Any, Optional, Union
+import posixpath
+from collections import defaultdict, deque
+from typing import Any, Iterable, Iterator, Optional, Union
 
 from requests import Response
 from zowe.core_for_zowe_sdk import SdkApi
 from zowe.core_for_zowe_sdk.exceptions import FileNotFound
+from zowe.core_for_zowe_sdk.thread_pool import thread_pool
 from zowe.zos_files_for_zowe_sdk.constants import ContentType, zos_file_constants
 from zowe.zos_files_for_zowe_sdk.api import BaseFilesApi
+from zowe.zos_files_for_zowe_sdk.ebcdic import EbcdicCodec
+from zowe.zos_files_for_zowe_sdk.tag_cache import USSTagCache
+from zowe.zos_files_for_zowe_sdk.transfer import ResumableDownload
 
 from .response import USSFileTag, USSListResponse
+from .response.uss import USSFileTagType, USSResponse
 
 _ZOWE_FILES_DEFAULT_ENCODING = zos_file_constants["ZoweFilesDefaultEncoding"]
 
@@ -28,7 +35,7 @@ class USSFiles(BaseFilesApi):  # type: ignore
     """
     Class used to represent the base z/OSMF USSFiles API.
 
-    It includes all operations related to USS files.
+    It includes all operations related to USS files. File tags retrieved recently are kept in `tag_cache`.
 
     Parameters
     ----------
@@ -40,15 +47,55 @@ class USSFiles(BaseFilesApi):  # type: ignore
 
     def __init__(self, connection: dict[str, Any], log: bool = True):
         super().__init__(connection, log=log)
+        self.tag_cache = USSTagCache()
 
-    def list(self, path: str) -> USSListResponse:
+    def list(
+        self,
+        path: str,
+        depth: Optional[int] = None,
+        name: Optional[str] = None,
+        file_type: Optional[str] = None,
+        size: Optional[str] = None,
+        mtime: Optional[Union[int, str]] = None,
+        user: Optional[Union[int, str]] = None,
+        group: Optional[Union[int, str]] = None,
+        filesys: Optional[str] = None,
+        symlinks: Optional[str] = None,
+        max_items: Optional[int] = None,
+    ) -> USSListResponse:
         """
         Retrieve a list of USS files based on a given pattern.
 
+        The filters are applied by z/OSMF, so that only matching entries are transferred.
+
         Parameters
         ----------
         path: str
             Path to retrieve the list
+        depth: Optional[int]
+            Number of directory levels to list (z/OSMF lists 1 level by default). Entries below the first level
+            are named relative to `path`, e.g. "dir/file"
+        name: Optional[str]
+            Only list entries whose name matches this pattern, which may contain the wildcards * and ?
+        file_type: Optional[str]
+            Only list entries of this type: "c" (character special file), "d" (directory), "f" (file),
+            "p" (FIFO) or "s" (symbolic link)
+        size: Optional[str]
+            Only list entries of this size, in bytes or with a K, M or G suffix; prefix with "+" for larger
+            entries and "-" for smaller entries, e.g. "+10M"
+        mtime: Optional[Union[int, str]]
+            Only list entries modified this number of days ago; prefix with "+" for older entries and "-" for
+            newer entries, e.g. "-7"
+        user: Optional[Union[int, str]]
+            Only list entries owned by this user name or UID
+        group: Optional[Union[int, str]]
+            Only list entries owned by this group name or GID
+        filesys: Optional[str]
+            "all" to list entries of all file systems (the default), or "same" to stay in the file system of `path`
+        symlinks: Optional[str]
+            "follow" to list the entries of linked directories (the default), or "report" to list the links only
+        max_items: Optional[int]
+            Maximum number of entries returned, 0 for no limit (z/OSMF returns 1000 by default)
 
         Returns
         -------
@@ -57,10 +104,143 @@ class USSFiles(BaseFilesApi):  # type: ignore
         """
         custom_args = self._create_custom_request_arguments()
         custom_args["params"] = {"path": path}
+        filters = {
+            "depth": depth,
+            "name": name,
+            "type": file_type,
+            "size": size,
+            "mtime": mtime,
+            "user": user,
+            "group": group,
+            "filesys": filesys,
+            "symlinks": symlinks,
+        }
+        custom_args["params"].update({key: str(value) for key, value in filters.items() if value is not None})
+        if max_items is not None:
+            custom_args["headers"]["X-IBM-Max-Items"] = str(max_items)
         custom_args["url"] = "{}fs".format(self._request_endpoint)
         response_json = self.request_handler.perform_request("GET", custom_args)
         return USSListResponse(response_json)
 
+    def walk(
+        self,
+        path: str,
+        max_depth: Optional[int] = None,
+        depth_per_request: int = 4,
+        name: Optional[str] = None,
+        file_type: Optional[str] = None,
+        size: Optional[str] = None,
+        mtime: Optional[Union[int, str]] = None,
+        user: Optional[Union[int, str]] = None,
+        group: Optional[Union[int, str]] = None,
+        filesys: Optional[str] = None,
+        symlinks: str = "report",
+    ) -> Iterator[tuple[str, USSResponse]]:
+        """
+        Walk a directory tree, listing several levels per request and filtering entries on z/OSMF.
+
+        z/OSMF cannot page through the entries of a directory, so the tree is listed in slices of
+        `depth_per_request` levels instead: each slice is one request, and the directories found at its last
+        level are listed by the next requests. This bounds the size of each response without one request
+        per directory. When filters are given, the directories at the last level of a slice are found with an
+        additional request listing directories only.
+
+        Parameters
+        ----------
+        path: str
+            Path of the directory to walk
+        max_depth: Optional[int]
+            Number of directory levels to walk, or None to walk the whole tree (default is None)
+        depth_per_request: int
+            Number of directory levels listed by each request (default is 4)
+        name: Optional[str]
+            Only return entries whose name matches this pattern, which may contain the wildcards * and ?
+        file_type: Optional[str]
+            Only return entries of this type: "c", "d", "f", "p" or "s"
+        size: Optional[str]
+            Only return entries of this size, e.g. "+10M" for entries larger than 10 MB
+        mtime: Optional[Union[int, str]]
+            Only return entries modified this number of days ago, e.g. "-7" for the last week
+        user: Optional[Union[int, str]]
+            Only return entries owned by this user name or UID
+        group: Optional[Union[int, str]]
+            Only return entries owned by this group name or GID
+        filesys: Optional[str]
+            "all" to walk all file systems (the default), or "same" to stay in the file system of `path`
+        symlinks: str
+            "report" to return the links without walking them (the default), or "follow" to walk linked
+            directories. z/OSMF does not return the identity of the directories, so a cycle of links cannot be
+            detected: following links requires `max_depth`
+
+        Yields
+        ------
+        tuple[str, USSResponse]
+            The absolute path and the attributes of each entry
+
+        Raises
+        ------
+        ValueError
+            If `max_depth` or `depth_per_request` is lower than 1, or links are followed without `max_depth`
+        """
+        if depth_per_request < 1 or (max_depth is not None and max_depth < 1):
+            self.logger.error("max_depth and depth_per_request must be at least 1")
+            raise ValueError("max_depth and depth_per_request must be at least 1")
+        if symlinks != "report" and max_depth is None:
+            self.logger.error("Following symbolic links requires max_depth")
+            raise ValueError("Following symbolic links requires max_depth, since a cycle of links never ends")
+        filtered = any(value is not None for value in (name, file_type, size, mtime, user, group))
+        pending = deque([(path.rstrip("/") or "/", 0)])
+        while pending:
+            directory, level = pending.popleft()
+            depth = depth_per_request if max_depth is None else min(depth_per_request, max_depth - level)
+            listing = self.list(
+                directory, depth, name, file_type, size, mtime, user, group, filesys, symlinks, max_items=0
+            )
+            boundary = []
+            for entry in listing.items or []:
+                if entry.name is None or posixpath.basename(entry.name) in (".", ".."):
+                    continue
+                entry_path = posixpath.join(directory, entry.name)
+                yield entry_path, entry
+                if not filtered and self.__is_boundary_directory(entry, depth):
+                    boundary.append(entry_path)
+            if max_depth is not None and level + depth >= max_depth:
+                continue
+            if filtered:
+                directories = self.list(
+                    directory, depth=depth, file_type="d", filesys=filesys, symlinks=symlinks, max_items=0
+                )
+                boundary = [
+                    posixpath.join(directory, str(entry.name))
+                    for entry in directories.items or []
+                    if self.__is_boundary_directory(entry, depth)
+                ]
+            pending.extend((entry_path, level + depth) for entry_path in boundary)
+
+    @staticmethod
+    def __is_boundary_directory(entry: USSResponse, depth: int) -> bool:
+        """
+        Return whether an entry is a directory at the last level of a listing.
+
+        Parameters
+        ----------
+        entry: USSResponse
+            The entry, named relative to the listed directory
+        depth: int
+            Number of directory levels of the listing
+
+        Returns
+        -------
+        bool
+            True if the contents of the entry were not listed
+        """
+        return (
+            entry.name is not None
+            and (entry.mode or "").startswith("d")
+            and posixpath.basename(entry.name) not in (".", "..")
+            and entry.name.count("/") + 1 == depth
+        )
+
     def delete(self, filepath_name: str, recursive: bool = False) -> None:
         """
         Delete a file or directory.
@@ -78,6 +258,7 @@ class USSFiles(BaseFilesApi):  # type: ignore
             custom_args["headers"]["X-IBM-Option"] = "recursive"
 
         self.request_handler.perform_request("DELETE", custom_args, expected_code=[204])
+        self.tag_cache.invalidate(filepath_name, recursive=True)
 
     def create(self, file_path: str, type: str, mode: Optional[str] = None) -> None:
         """
@@ -133,6 +314,7 @@ class USSFiles(BaseFilesApi):  # type: ignore
             raise ValueError("Data must be either a string or bytes.")
 
         self.request_handler.perform_request("PUT", custom_args, expected_code=[204, 201])
+        self.tag_cache.invalidate(filepath_name)
 
     def retrieve_content(
         self,
@@ -226,7 +408,10 @@ class USSFiles(BaseFilesApi):  # type: ignore
         local_file_path: str,
         content_type: ContentType = ContentType.TEXT,
         remote_file_encoding: str = "IBM-1047",
-        receive_in_encoding: str = "UTF-8"
+        receive_in_encoding: str = "UTF-8",
+        resume: bool = False,
+        convert_locally: bool = False,
+        use_file_tag: bool = False
     ) -> None:
         """
         Retrieve the contents of a USS file and save it to a local file.
@@ -244,6 +429,18 @@ class USSFiles(BaseFilesApi):  # type: ignore
         receive_in_encoding: str
             Encoding to convert file content to (to convert to; by default,
             it is always being converted to "UTF-8" during download). Ignored when "binary" is True
+        resume: bool
+            Record the progress in a checkpoint file next to the local file, so that running the download again
+            after a failure only retrieves the remaining bytes (default is False). Text is then always
+            converted on the client, so `remote_file_encoding` must be an EBCDIC code page
+        convert_locally: bool
+            Transfer text as binary data and convert it from `remote_file_encoding` on the client instead of
+            having z/OSMF convert it (default is False). `remote_file_encoding` must be an EBCDIC code page
+        use_file_tag: bool
+            Choose the content type and remote encoding from the tag of the file (default is False): files tagged
+            binary are downloaded as binary and files tagged text or mixed are converted from their tag's code page.
+            `content_type` and `remote_file_encoding` are used for untagged files. Tags are read from
+            `tag_cache`, which `get_file_tags` fills for many files at once
 
         Raises
         ------
@@ -252,6 +449,33 @@ class USSFiles(BaseFilesApi):  # type: ignore
         ValueError
             Content type must be either ContenType.TEXT or ContentType.BINARY.
         """
+        if use_file_tag:
+            tag = self.get_file_tag(remote_file_path, use_cache=True)
+            if tag.tag_type == USSFileTagType.BINARY:
+                content_type = ContentType.BINARY
+            elif tag.tag_type is not None and tag.charset is not None:
+                content_type = ContentType.TEXT
+                remote_file_encoding = tag.charset
+                # Files tagged with an ASCII code page cannot be converted by the EBCDIC codec
+                convert_locally = convert_locally and EbcdicCodec.is_supported(remote_file_encoding)
+        if resume:
+            self.__resume_download(
+                remote_file_path,
+                local_file_path,
+                content_type,
+                remote_file_encoding,
+                receive_in_encoding
+            )
+            return
+        if convert_locally and content_type == ContentType.TEXT:
+            codec = EbcdicCodec.for_encoding(remote_file_encoding)
+            response = self.retrieve_content(remote_file_path, content_type=ContentType.BINARY, as_stream=True)
+            if not isinstance(response, Response):
+                raise TypeError(f"Expected Response, got {type(response)}")
+            with open(local_file_path, "w", encoding=receive_in_encoding) as f:
+                for text in codec.iter_decode(response.iter_content(chunk_size=65536)):
+                    f.write(text)
+            return
         response = self.retrieve_content(
             remote_file_path,
             content_type=content_type,
@@ -279,6 +503,66 @@ class USSFiles(BaseFilesApi):  # type: ignore
             for chunk in response.iter_content(chunk_size=4096, decode_unicode=decode_unicode):
                 f.write(chunk)
 
+    def __resume_download(
+        self,
+        remote_file_path: str,
+        local_file_path: str,
+        content_type: ContentType,
+        remote_file_encoding: str,
+        receive_in_encoding: str
+    ) -> None:
+        """
+        Download a USS file with a checkpoint, using byte ranges.
+
+        Text is transferred as binary data and converted on the client, since lines converted by z/OSMF cannot
+        be mapped back to exact positions in the remote file.
+
+        Parameters
+        ----------
+        remote_file_path: str
+            Path of the file to be downloaded
+        local_file_path: str
+            Name of the file to be saved locally
+        content_type: ContentType
+            Specifies the content type to fetch ("text" or "binary")
+        remote_file_encoding: str
+            Encoding file content originally in
+        receive_in_encoding: str
+            Encoding to convert file content to
+
+        Raises
+        ------
+        ValueError
+            Content type must be either ContenType.TEXT or ContentType.BINARY, and text must be in an EBCDIC
+            code page that can be converted on the client.
+        """
+        custom_args = self._create_custom_request_arguments()
+        custom_args["url"] = "{}fs/{}".format(
+            self._request_endpoint,
+            self._encode_uri_component(remote_file_path.lstrip("/"))
+        )
+        if content_type == ContentType.TEXT:
+            if not EbcdicCodec.is_supported(remote_file_encoding):
+                self.logger.error(f"Text in {remote_file_encoding} cannot be downloaded with resume")
+                raise ValueError(f"Text in {remote_file_encoding} cannot be downloaded with resume")
+            # The local file is converted, but progress is still counted in bytes of the remote file
+            custom_args["headers"]["X-IBM-Data-Type"] = "binary"
+            mode = "{};{};{};local".format(content_type.value, remote_file_encoding, receive_in_encoding)
+            ResumableDownload(
+                self.request_handler, custom_args, local_file_path, remote_file_path, mode
+            ).by_bytes(codec=EbcdicCodec.for_encoding(remote_file_encoding), encoding=receive_in_encoding)
+        elif content_type == ContentType.BINARY:
+            custom_args["headers"]["X-IBM-Data-Type"] = "binary"
+            ResumableDownload(
+                self.request_handler, custom_args, local_file_path, remote_file_path, content_type.value
+            ).by_bytes()
+        else:
+            error_str = "Content type must be either \"{}\" or \"{}\".".format(
+                ContentType.TEXT.value,
+                ContentType.BINARY.value
+            )
+            raise ValueError(error_str)
+
     def download(
         self,
         file_path: str,
@@ -300,7 +584,8 @@ class USSFiles(BaseFilesApi):  # type: ignore
         local_file_path: str,
         remote_file_path: str,
         content_type: ContentType = ContentType.TEXT,
-        upload_in_encoding: str = _ZOWE_FILES_DEFAULT_ENCODING
+        upload_in_encoding: str = _ZOWE_FILES_DEFAULT_ENCODING,
+        convert_locally: bool = False
     ) -> None:
         """
         Upload contents of a given file and save it to a file at the given USS path.
@@ -315,6 +600,9 @@ class USSFiles(BaseFilesApi):  # type: ignore
             Specifies the content type to fetch ("text" or "binary", "text" by default)
         upload_in_encoding: str
             Specifies encoding schema of the uploaded file
+        convert_locally: bool
+            Convert text to `upload_in_encoding` on the client and upload it as binary data instead of having
+            z/OSMF convert it (default is False). `upload_in_encoding` must be an EBCDIC code page, e.g. "IBM-1047"
 
         Raises
         ------
@@ -337,7 +625,11 @@ class USSFiles(BaseFilesApi):  # type: ignore
                 )
                 raise ValueError(error_str)
             with open(local_file_path, read_mode, encoding=read_in_encoding) as in_file:
-                self.write(remote_file_path, in_file.read(), encoding=upload_in_encoding)
+                data = in_file.read()
+            if convert_locally and content_type == ContentType.TEXT:
+                self.write(remote_file_path, EbcdicCodec.for_encoding(upload_in_encoding).encode(data))
+            else:
+                self.write(remote_file_path, data, encoding=upload_in_encoding)
         else:
             self.logger.error(f"File {local_file_path} not found.")
             raise FileNotFound(local_file_path)
@@ -357,7 +649,7 @@ class USSFiles(BaseFilesApi):  # type: ignore
             self.logger.error(f"File {input_file} not found.")
             raise FileNotFound(input_file)
 
-    def get_file_tag(self, filepath_name: str) -> USSFileTag:
+    def get_file_tag(self, filepath_name: str, use_cache: bool = False) -> USSFileTag:
         """
         Retrieve the file tag if specified for the filename. Raises exception if it is impossible to identify the tag info.
 
@@ -365,14 +657,133 @@ class USSFiles(BaseFilesApi):  # type: ignore
         ----------
         filepath_name: str
             Path of the file
+        use_cache: bool
+            Return the tag from `tag_cache` if it was retrieved recently, instead of sending a request
+            (default is False)
 
         Returns
         -------
         USSFileTag
             Tag info of a given file.
         """
+        if use_cache:
+            tag = self.tag_cache.get(filepath_name)
+            if tag is not None:
+                return tag
         custom_args = self._create_custom_request_arguments()
-        custom_args["url"] = "{}fs{}".format(self._request_endpoint, filepath_name)
+        custom_args["url"] = "{}fs/{}".format(
+            self._request_endpoint, self._encode_uri_component(filepath_name.lstrip("/"))
+        )
         custom_args["json"] = { "request": "chtag", "action": "list" }
         response_json = self.request_handler.perform_request("PUT", custom_args)
-        return USSFileTag(response_json)
+        tag = USSFileTag(response_json)
+        self.tag_cache.set(filepath_name, tag)
+        return tag
+
+    def get_file_tags(
+        self, file_paths: Iterable[str], max_workers: int = 8, min_files_per_listing: int = 4
+    ) -> dict[str, USSFileTag]:
+        """
+        Retrieve the tags of many files, listing whole directories in one request each.
+
+        Files whose tag is not in `tag_cache` are grouped by directory. A directory directly holding at least
+        `min_files_per_listing` of the files is resolved by one recursive 'chtag list', which also covers the
+        files in its subdirectories; the other files are listed one by one. The requests are sent concurrently.
+        The tags of all the listed files are added to `tag_cache`, so that downloading a tree with
+        `perform_download(use_file_tag=True)` then needs no request per file to choose its encoding.
+
+        Parameters
+        ----------
+        file_paths: Iterable[str]
+            Absolute paths of the files
+        max_workers: int
+            Number of requests sent at the same time (default is 8)
+        min_files_per_listing: int
+            Number of files a directory must directly hold to be listed recursively (default is 4). Lower values
+            send fewer requests, but may list large directory trees for a few files
+
+        Returns
+        -------
+        dict[str, USSFileTag]
+            The tag of each file, by path. Files missing from the listing of their directory are omitted
+
+        Raises
+        ------
+        ValueError
+            If `max_workers` is lower than 1
+        """
+        if max_workers < 1:
+            self.logger.error("max_workers must be at least 1")
+            raise ValueError("max_workers must be at least 1")
+        tags: dict[str, USSFileTag] = {}
+        missing = []
+        for file_path in dict.fromkeys(posixpath.normpath(path) for path in file_paths):
+            tag = self.tag_cache.get(file_path)
+            if tag is None:
+                missing.append(file_path)
+            else:
+                tags[file_path] = tag
+        groups: dict[str, list[str]] = defaultdict(list)
+        for file_path in missing:
+            groups[posixpath.dirname(file_path)].append(file_path)
+        roots = {directory for directory, files in groups.items() if len(files) >= min_files_per_listing}
+        listings = [(root, True) for root in roots if not self.__is_below(root, roots)]
+        # Files outside of the listed directory trees are listed on their own
+        listings.extend((file_path, False) for file_path in missing if not self.__is_below(file_path, roots))
+        listed_tags: dict[str, USSFileTag] = {}
+        with thread_pool(max_workers, len(listings)) as executor:
+            for listed in executor.map(lambda listing: self.__list_tags(*listing), listings):
+                listed_tags.update(listed)
+        for file_path, tag in listed_tags.items():
+            self.tag_cache.set(file_path, tag)
+        tags.update((file_path, listed_tags[file_path]) for file_path in missing if file_path in listed_tags)
+        return tags
+
+    @staticmethod
+    def __is_below(path: str, directories: set[str]) -> bool:
+        """
+        Return whether a path is below one of the given directories.
+
+        Parameters
+        ----------
+        path: str
+            The normalized path
+        directories: set[str]
+            The normalized paths of the directories
+
+        Returns
+        -------
+        bool
+            True if one of the directories is an ancestor of the path
+        """
+        ancestor = path
+        while posixpath.dirname(ancestor) != ancestor:
+            ancestor = posixpath.dirname(ancestor)
+            if ancestor in directories:
+                return True
+        return False
+
+    def __list_tags(self, path: str, recursive: bool) -> dict[str, USSFileTag]:
+        """
+        List the tags of a file, or of all the files below a directory.
+
+        Parameters
+        ----------
+        path: str
+            Path of the file or directory
+        recursive: bool
+            List the files below the directory
+
+        Returns
+        -------
+        dict[str, USSFileTag]
+            The tag of each listed file, by path
+        """
+        request_handler = self.request_handler.for_current_thread()
+        custom_args = self._create_custom_request_arguments()
+        custom_args["url"] = "{}fs/{}".format(self._request_endpoint, self._encode_uri_component(path.lstrip("/")))
+        custom_args["json"] = {"request": "chtag", "action": "list", "recursive": recursive}
+        response_json = request_handler.perform_request("PUT", custom_args)
+        if not recursive:
+            return {path: USSFileTag(response_json)}
+        return USSFileTag.from_listing(response_json)
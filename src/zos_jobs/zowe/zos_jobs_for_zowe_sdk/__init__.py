@@ -10,4 +10,9 @@ SPDX-License-Identifier: EPL-2.0
 Copyright Contributors to the Zowe Project.
 """
 
+from .bulk import BulkJobRunner, JobActionResult
 from .jobs import Jobs
+from .notifications import JobNotificationReceiver
+from .spool_cache import SpoolCache
+from .spool_search import SpoolMatch, SpoolSearch
+from .watcher import JobEvent, JobEventType, JobWatcher
@@ -0,0 +1,134 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, Union
+
+from zowe.core_for_zowe_sdk import RequestHandler
+from zowe.core_for_zowe_sdk.thread_pool import thread_pool
+
+from .response import JobResponse, StatusResponse
+
+
+@dataclass
+class JobActionResult:
+    """Outcome of an operation on one job."""
+
+    jobname: str
+    jobid: str
+    response: Optional[StatusResponse] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Return whether z/OSMF accepted the operation."""
+        # Asynchronous requests return the status as a string
+        return self.error is None and self.response is not None and str(self.response.status) == "0"
+
+
+class BulkJobRunner:
+    """
+    Class used to run the same operation (e.g. cancel or purge) on many jobs concurrently.
+
+    At most `max_workers` requests are sent at the same time, each worker thread with its own request handler,
+    and at most `max_rate` requests are started per second, so that large clean-ups do not flood z/OSMF and JES.
+
+    Parameters
+    ----------
+    request_handler: RequestHandler
+        The request handler of the API object
+    max_workers: int
+        Number of requests sent at the same time (default is 8)
+    max_rate: Optional[float]
+        Maximum number of requests started per second (default is no limit)
+
+    Raises
+    ------
+    ValueError
+        If `max_workers` is lower than 1 or `max_rate` is not positive
+    """
+
+    def __init__(self, request_handler: RequestHandler, max_workers: int = 8, max_rate: Optional[float] = None):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError("max_rate must be positive")
+        self.request_handler = request_handler
+        self.max_workers = max_workers
+        self.max_rate = max_rate
+        self.__lock = threading.Lock()
+        self.__next_start = 0.0
+
+    def run(
+        self,
+        jobs: Iterable[Union[JobResponse, tuple[str, str]]],
+        action: Callable[[RequestHandler, str, str], StatusResponse],
+    ) -> list[JobActionResult]:
+        """
+        Run an operation on every job.
+
+        Parameters
+        ----------
+        jobs: Iterable[Union[JobResponse, tuple[str, str]]]
+            The jobs, e.g. from `Jobs.iter_jobs`, or (job name, job id) pairs
+        action: Callable[[RequestHandler, str, str], StatusResponse]
+            Runs the operation on one job, given a request handler, the job name and the job id
+
+        Returns
+        -------
+        list[JobActionResult]
+            The outcome for each job, in the order of `jobs`
+        """
+        names = [(job.jobname, job.jobid) if isinstance(job, JobResponse) else tuple(job) for job in jobs]
+        with thread_pool(self.max_workers, len(names)) as executor:
+            return list(executor.map(lambda name: self.__run_one(name[0], name[1], action), names))
+
+    def __run_one(
+        self, jobname: str, jobid: str, action: Callable[[RequestHandler, str, str], StatusResponse]
+    ) -> JobActionResult:
+        """
+        Run the operation on one job.
+
+        Parameters
+        ----------
+        jobname: str
+            The name of the job
+        jobid: str
+            The job id on JES
+        action: Callable[[RequestHandler, str, str], StatusResponse]
+            Runs the operation
+
+        Returns
+        -------
+        JobActionResult
+            The response of z/OSMF, or the error if the request failed
+        """
+        self.__throttle()
+        try:
+            return JobActionResult(
+                jobname, jobid, response=action(self.request_handler.for_current_thread(), jobname, jobid)
+            )
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return JobActionResult(jobname, jobid, error=str(error))
+
+    def __throttle(self) -> None:
+        """Wait until the next request may start, so that no more than `max_rate` requests start per second."""
+        if self.max_rate is None:
+            return
+        with self.__lock:
+            now = time.monotonic()
+            start = max(now, self.__next_start)
+            self.__next_start = start + 1 / self.max_rate
+        if start > now:
+            time.sleep(start - now)
@@ -10,13 +10,25 @@ SPDX-License-Identifier: EPL-2.0
 Copyright Contributors to the Zowe Project.
 """
 
+import json
 import os
-from typing import Optional, Any
+import re
+from concurrent.futures import Future
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
 
-from zowe.core_for_zowe_sdk import SdkApi
+from zowe.core_for_zowe_sdk import RequestHandler, SdkApi
+from zowe.core_for_zowe_sdk.thread_pool import thread_pool
 from zowe.core_for_zowe_sdk.validators import reject_unsafe_component, reject_unsafe_path
 
+from .bulk import BulkJobRunner, JobActionResult
+from .notifications import JobNotificationReceiver
 from .response import JobResponse, SpoolResponse, StatusResponse
+from .spool_cache import SpoolCache
+from .spool_search import SpoolMatch, SpoolSearch
+
+_JOBNAME_FIRST_CHARACTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ@#$"
+_JOBNAME_CHARACTERS = _JOBNAME_FIRST_CHARACTERS + "0123456789"
+_JCL_SYMBOL_NAME = re.compile(r"[A-Z@#$][A-Z0-9@#$]{0,7}")
 
 
 class Jobs(SdkApi):  # type: ignore
@@ -31,10 +43,14 @@ class Jobs(SdkApi):  # type: ignore
         A profile for connection in dict (json) format
     log : bool
         Flag to disable logger
+    spool_cache : Optional[SpoolCache]
+        Local cache of the JCL and spool files of jobs in the OUTPUT status, used by `get_jcl_text`,
+        `get_spool_files` and `get_spool_file_contents` (default is None)
     """
 
-    def __init__(self, connection: dict[str, Any], log: bool = True):
+    def __init__(self, connection: dict[str, Any], log: bool = True, spool_cache: Optional[SpoolCache] = None):
         super().__init__(connection, "/zosmf/restjobs/jobs/", logger_name=__name__, log=log)
+        self.spool_cache = spool_cache
 
     def get_job_status(self, jobname: str, jobid: str) -> JobResponse:
         """
@@ -133,7 +149,14 @@ class Jobs(SdkApi):  # type: ignore
         response_json = self.request_handler.perform_request("DELETE", custom_args, expected_code=[202, 200])
         return StatusResponse(response_json)
 
-    def _issue_job_request(self, req: dict[str, Any], jobname: str, jobid: str, modify_version: str) -> StatusResponse:
+    def _issue_job_request(
+        self,
+        req: dict[str, Any],
+        jobname: str,
+        jobid: str,
+        modify_version: str,
+        request_handler: Optional[RequestHandler] = None,
+    ) -> StatusResponse:
         """
         Issue a job request.
 
@@ -148,6 +171,8 @@ class Jobs(SdkApi):  # type: ignore
         modify_version: str
             "2.0" specifies that the request is to be processed synchronously.
             For asynchronous processing - change the value to "1.0"
+        request_handler: Optional[RequestHandler]
+            The request handler of the calling thread (default is the request handler of the API object)
 
         Returns
         -------
@@ -162,7 +187,8 @@ class Jobs(SdkApi):  # type: ignore
 
         custom_args["headers"]["X-IBM-Job-Modify-Version"] = modify_version
 
-        response_json = self.request_handler.perform_request("PUT", custom_args, expected_code=[202, 200])
+        request_handler = request_handler or self.request_handler
+        response_json = request_handler.perform_request("PUT", custom_args, expected_code=[202, 200])
         return StatusResponse(response_json)
 
     def change_job_class(
@@ -262,6 +288,234 @@ class Jobs(SdkApi):  # type: ignore
         response = self._issue_job_request({"request": "release"}, jobname, jobid, modify_version)
         return response
 
+    def cancel_jobs(
+        self,
+        jobs: Iterable[Union[JobResponse, tuple[str, str]]],
+        modify_version: str = "1.0",
+        max_workers: int = 8,
+        max_rate: Optional[float] = None,
+    ) -> list[JobActionResult]:
+        """
+        Cancel many jobs concurrently.
+
+        Parameters
+        ----------
+        jobs: Iterable[Union[JobResponse, tuple[str, str]]]
+            The jobs, e.g. from `iter_jobs` or `list_jobs`, or (job name, job id) pairs
+        modify_version: str
+            Default ("1.0") specifies that the requests are processed asynchronously, which returns as soon as
+            JES accepts them. Use "2.0" to wait for JES to complete each request
+        max_workers: int
+            Number of requests sent at the same time (default is 8)
+        max_rate: Optional[float]
+            Maximum number of requests started per second (default is no limit)
+
+        Returns
+        -------
+        list[JobActionResult]
+            The outcome for each job, in the order of `jobs`
+        """
+        return self.__run_bulk(
+            jobs,
+            modify_version,
+            max_workers,
+            max_rate,
+            lambda request_handler, jobname, jobid: self._issue_job_request(
+                {"request": "cancel"}, jobname, jobid, modify_version, request_handler
+            ),
+        )
+
+    def delete_jobs(
+        self,
+        jobs: Iterable[Union[JobResponse, tuple[str, str]]],
+        modify_version: str = "1.0",
+        max_workers: int = 8,
+        max_rate: Optional[float] = None,
+    ) -> list[JobActionResult]:
+        """
+        Cancel and purge many jobs concurrently.
+
+        Parameters
+        ----------
+        jobs: Iterable[Union[JobResponse, tuple[str, str]]]
+            The jobs, e.g. from `iter_jobs` or `list_jobs`, or (job name, job id) pairs
+        modify_version: str
+            Default ("1.0") specifies that the requests are processed asynchronously, which returns as soon as
+            JES accepts them. Use "2.0" to wait for JES to complete each request
+        max_workers: int
+            Number of requests sent at the same time (default is 8)
+        max_rate: Optional[float]
+            Maximum number of requests started per second (default is no limit)
+
+        Returns
+        -------
+        list[JobActionResult]
+            The outcome for each job, in the order of `jobs`
+        """
+
+        def delete(request_handler: RequestHandler, jobname: str, jobid: str) -> StatusResponse:
+            custom_args = self._create_custom_request_arguments()
+            job_url = "{}/{}".format(jobname, jobid)
+            custom_args["url"] = "{}{}".format(self._request_endpoint, self._encode_uri_component(job_url))
+            custom_args["headers"]["X-IBM-Job-Modify-Version"] = modify_version
+            response_json = request_handler.perform_request("DELETE", custom_args, expected_code=[202, 200])
+            return StatusResponse(response_json)
+
+        return self.__run_bulk(jobs, modify_version, max_workers, max_rate, delete)
+
+    def hold_jobs(
+        self,
+        jobs: Iterable[Union[JobResponse, tuple[str, str]]],
+        modify_version: str = "1.0",
+        max_workers: int = 8,
+        max_rate: Optional[float] = None,
+    ) -> list[JobActionResult]:
+        """
+        Hold many jobs concurrently.
+
+        Parameters
+        ----------
+        jobs: Iterable[Union[JobResponse, tuple[str, str]]]
+            The jobs, e.g. from `iter_jobs` or `list_jobs`, or (job name, job id) pairs
+        modify_version: str
+            Default ("1.0") specifies that the requests are processed asynchronously, which returns as soon as
+            JES accepts them. Use "2.0" to wait for JES to complete each request
+        max_workers: int
+            Number of requests sent at the same time (default is 8)
+        max_rate: Optional[float]
+            Maximum number of requests started per second (default is no limit)
+
+        Returns
+        -------
+        list[JobActionResult]
+            The outcome for each job, in the order of `jobs`
+        """
+        return self.__run_bulk(
+            jobs,
+            modify_version,
+            max_workers,
+            max_rate,
+            lambda request_handler, jobname, jobid: self._issue_job_request(
+                {"request": "hold"}, jobname, jobid, modify_version, request_handler
+            ),
+        )
+
+    def release_jobs(
+        self,
+        jobs: Iterable[Union[JobResponse, tuple[str, str]]],
+        modify_version: str = "1.0",
+        max_workers: int = 8,
+        max_rate: Optional[float] = None,
+    ) -> list[JobActionResult]:
+        """
+        Release many jobs concurrently.
+
+        Parameters
+        ----------
+        jobs: Iterable[Union[JobResponse, tuple[str, str]]]
+            The jobs, e.g. from `iter_jobs` or `list_jobs`, or (job name, job id) pairs
+        modify_version: str
+            Default ("1.0") specifies that the requests are processed asynchronously, which returns as soon as
+            JES accepts them. Use "2.0" to wait for JES to complete each request
+        max_workers: int
+            Number of requests sent at the same time (default is 8)
+        max_rate: Optional[float]
+            Maximum number of requests started per second (default is no limit)
+
+        Returns
+        -------
+        list[JobActionResult]
+            The outcome for each job, in the order of `jobs`
+        """
+        return self.__run_bulk(
+            jobs,
+            modify_version,
+            max_workers,
+            max_rate,
+            lambda request_handler, jobname, jobid: self._issue_job_request(
+                {"request": "release"}, jobname, jobid, modify_version, request_handler
+            ),
+        )
+
+    def change_jobs_class(
+        self,
+        jobs: Iterable[Union[JobResponse, tuple[str, str]]],
+        class_name: str,
+        modify_version: str = "1.0",
+        max_workers: int = 8,
+        max_rate: Optional[float] = None,
+    ) -> list[JobActionResult]:
+        """
+        Change the class of many jobs concurrently.
+
+        Parameters
+        ----------
+        jobs: Iterable[Union[JobResponse, tuple[str, str]]]
+            The jobs, e.g. from `iter_jobs` or `list_jobs`, or (job name, job id) pairs
+        class_name: str
+            The name of class to be set to
+        modify_version: str
+            Default ("1.0") specifies that the requests are processed asynchronously, which returns as soon as
+            JES accepts them. Use "2.0" to wait for JES to complete each request
+        max_workers: int
+            Number of requests sent at the same time (default is 8)
+        max_rate: Optional[float]
+            Maximum number of requests started per second (default is no limit)
+
+        Returns
+        -------
+        list[JobActionResult]
+            The outcome for each job, in the order of `jobs`
+        """
+        return self.__run_bulk(
+            jobs,
+            modify_version,
+            max_workers,
+            max_rate,
+            lambda request_handler, jobname, jobid: self._issue_job_request(
+                {"class": class_name}, jobname, jobid, modify_version, request_handler
+            ),
+        )
+
+    def __run_bulk(
+        self,
+        jobs: Iterable[Union[JobResponse, tuple[str, str]]],
+        modify_version: str,
+        max_workers: int,
+        max_rate: Optional[float],
+        action: Callable[[RequestHandler, str, str], StatusResponse],
+    ) -> list[JobActionResult]:
+        """
+        Run an operation on many jobs concurrently.
+
+        Parameters
+        ----------
+        jobs: Iterable[Union[JobResponse, tuple[str, str]]]
+            The jobs
+        modify_version: str
+            "1.0" for asynchronous or "2.0" for synchronous processing
+        max_workers: int
+            Number of requests sent at the same time
+        max_rate: Optional[float]
+            Maximum number of requests started per second
+        action: Callable[[RequestHandler, str, str], StatusResponse]
+            Runs the operation on one job
+
+        Returns
+        -------
+        list[JobActionResult]
+            The outcome for each job, in the order of `jobs`
+
+        Raises
+        ------
+        ValueError
+            Thrown if the modify_version is invalid
+        """
+        if modify_version not in ("1.0", "2.0"):
+            self.logger.error('Modify version not accepted; Must be "1.0" or "2.0"')
+            raise ValueError('Accepted values for modify_version: "1.0" or "2.0"')
+        return BulkJobRunner(self.request_handler, max_workers, max_rate).run(jobs, action)
+
     def list_jobs(
         self,
         owner: Optional[str] = None,
@@ -301,7 +555,115 @@ class Jobs(SdkApi):  # type: ignore
             response.append(JobResponse(item))
         return response
 
-    def submit_from_mainframe(self, jcl_path: str) -> JobResponse:
+    def iter_jobs(
+        self,
+        owner: Optional[str] = None,
+        prefix: str = "*",
+        jobid: Optional[str] = None,
+        status: Optional[str] = None,
+        user_correlator: Optional[str] = None,
+        exec_data: bool = False,
+        page_size: int = 1000,
+    ) -> Iterator[JobResponse]:
+        """
+        Iterate over the jobs on JES matching the filters, however many there are.
+
+        z/OSMF has no paging for the job list, so the listing is split by job name instead: when more than
+        `page_size` jobs match a request, its job name pattern is replaced by one pattern per possible next
+        character, and each of them is listed in turn. Once the job name is exact, the owner pattern is split in
+        the same way, if it ends with `*`. Only one page of jobs is held in memory at a time.
+
+        Parameters
+        ----------
+        owner: Optional[str]
+            The job owner (default is zosmf user)
+        prefix: str
+            The job name prefix (default is `*`)
+        jobid: Optional[str]
+            The job id
+        status: Optional[str]
+            The job status filter supported by z/OSMF, e.g. "active"
+        user_correlator: Optional[str]
+            The z/OSMF user correlator attribute (default is None)
+        exec_data: bool
+            Include the execution data (submission, start and end times, system) of each job (default is False)
+        page_size: int
+            The maximum number of jobs listed by one request; one more is requested to detect longer listings
+            (default is 1000)
+
+        Yields
+        ------
+        JobResponse
+            The jobs, ordered by job name pattern
+
+        Raises
+        ------
+        ValueError
+            If `page_size` is lower than 1, or if more than `page_size` jobs match a job name and owner that cannot
+            be split
+        """
+        if page_size < 1:
+            self.logger.error("page_size must be at least 1")
+            raise ValueError("page_size must be at least 1")
+        params = {"max-jobs": page_size + 1}
+        if jobid:
+            params["jobid"] = jobid
+        if status:
+            params["status"] = status
+        if user_correlator:
+            params["user-correlator"] = user_correlator
+        if exec_data:
+            params["exec-data"] = "Y"
+        patterns: list[tuple[str, Optional[str]]] = [(prefix, owner)]
+        while patterns:
+            pattern, owner_pattern = patterns.pop()
+            custom_args = self._create_custom_request_arguments()
+            custom_args["params"] = dict(params, prefix=pattern)
+            if owner_pattern:
+                custom_args["params"]["owner"] = owner_pattern
+            response_json = self.request_handler.perform_request("GET", custom_args)
+            if len(response_json) <= page_size:
+                for item in response_json:
+                    yield JobResponse(item)
+                continue
+            # Listed last to first, so that the jobs are yielded in the order of the patterns
+            narrower = self.__split_pattern(pattern)
+            if narrower is not None:
+                patterns.extend((name, owner_pattern) for name in reversed(narrower))
+                continue
+            narrower = self.__split_pattern(owner_pattern) if owner_pattern else None
+            if narrower is not None:
+                patterns.extend((pattern, name) for name in reversed(narrower))
+                continue
+            self.logger.error(f"More than {page_size} jobs match job name {pattern} and owner {owner_pattern}")
+            raise ValueError(
+                f"More than {page_size} jobs match job name {pattern} and owner {owner_pattern}, "
+                "which cannot be split: increase page_size"
+            )
+
+    @staticmethod
+    def __split_pattern(pattern: str) -> Optional[list[str]]:
+        """
+        Split a job name or owner pattern ending with `*` into patterns matching the same jobs.
+
+        Parameters
+        ----------
+        pattern: str
+            The job name or owner pattern
+
+        Returns
+        -------
+        Optional[list[str]]
+            The name without the `*`, followed by one pattern per possible next character,
+            or None if the pattern cannot be split
+        """
+        base = pattern[:-1]
+        if not pattern.endswith("*") or "*" in base or len(base) >= 8:
+            return None
+        characters = _JOBNAME_CHARACTERS if base else _JOBNAME_FIRST_CHARACTERS
+        return ([base] if base else []) + [base + character + "*" for character in characters]
+
+    def submit_from_mainframe(self, jcl_path: str, notification_url: Optional[str] = None) -> JobResponse:
         """
         Submit a job from a given dataset.
 
@@ -309,6 +671,9 @@ class Jobs(SdkApi):  # type: ignore
         ----------
         jcl_path: str
             The dataset where the JCL is located
+        notification_url: Optional[str]
+            URL to which z/OSMF sends the job status when the job ends, e.g. from `JobNotificationReceiver.expect`
+            (default is None)
 
         Returns
         -------
@@ -318,6 +683,8 @@ class Jobs(SdkApi):  # type: ignore
         custom_args = self._create_custom_request_arguments()
         request_body = {"file": "//'%s'" % jcl_path}
         custom_args["json"] = request_body
+        if notification_url:
+            custom_args["headers"]["X-IBM-Notification-URL"] = notification_url
         response_json = self.request_handler.perform_request("PUT", custom_args, expected_code=[201])
         return JobResponse(response_json)
 
@@ -352,7 +719,9 @@ class Jobs(SdkApi):  # type: ignore
             self.logger.error("Provided argument is not a file path {}".format(jcl_path))
             raise FileNotFoundError("Provided argument is not a file path {}".format(jcl_path))
 
-    def submit_plaintext(self, jcl: str) -> JobResponse:
+    def submit_plaintext(
+        self, jcl: str, symbols: Optional[dict[str, str]] = None, notification_url: Optional[str] = None
+    ) -> JobResponse:
         """
         Submit a job from plain text input.
 
@@ -360,18 +729,168 @@ class Jobs(SdkApi):  # type: ignore
         ----------
         jcl: str
             The plain text JCL to be submitted
+        symbols: Optional[dict[str, str]]
+            Values of the JCL symbols (`&NAME`) used in the JCL, by symbol name. Values must be
+            printable ASCII of at most 255 characters (default is None)
+        notification_url: Optional[str]
+            URL to which z/OSMF sends the job status when the job ends, e.g. from `JobNotificationReceiver.expect`
+            (default is None)
 
         Returns
         -------
         JobResponse
             A JSON object containing the result of the request execution
         """
-        custom_args = self._create_custom_request_arguments()
-        custom_args["data"] = str(jcl)
-        custom_args["headers"] = {"Content-Type": "text/plain", "X-CSRF-ZOSMF-HEADER": ""}
+        custom_args = self.__submit_arguments(jcl, symbols)
+        if notification_url:
+            custom_args["headers"]["X-IBM-Notification-URL"] = notification_url
         response_json = self.request_handler.perform_request("PUT", custom_args, expected_code=[201])
         return JobResponse(response_json)
 
+    def submit_notified(
+        self,
+        receiver: JobNotificationReceiver,
+        jcl: Optional[str] = None,
+        jcl_path: Optional[str] = None,
+        symbols: Optional[dict[str, str]] = None,
+    ) -> tuple[JobResponse, "Future[JobResponse]"]:
+        """
+        Submit a job and ask z/OSMF to notify a receiver when it ends, instead of polling its status.
+
+        Parameters
+        ----------
+        receiver: JobNotificationReceiver
+            The receiver of the notification, started if needed
+        jcl: Optional[str]
+            The plain text JCL to be submitted
+        jcl_path: Optional[str]
+            The dataset where the JCL is located, if `jcl` is not given
+        symbols: Optional[dict[str, str]]
+            Values of the JCL symbols used in the plain text JCL, by symbol name (default is None)
+
+        Returns
+        -------
+        tuple[JobResponse, Future[JobResponse]]
+            The submitted job, and the future resolving to its status when it ends
+
+        Raises
+        ------
+        ValueError
+            If neither or both of `jcl` and `jcl_path` are given
+        """
+        if (jcl is None) == (jcl_path is None):
+            self.logger.error("Exactly one of jcl and jcl_path must be given")
+            raise ValueError("Exactly one of jcl and jcl_path must be given")
+        notification_url, future = receiver.expect()
+        submitted = False
+        try:
+            if jcl is not None:
+                job = self.submit_plaintext(jcl, symbols, notification_url)
+            else:
+                job = self.submit_from_mainframe(str(jcl_path), notification_url)
+            submitted = True
+        finally:
+            if not submitted:
+                receiver.discard(notification_url)
+        return job, future
+
+    def submit_batch(
+        self,
+        jcl: str,
+        symbol_sets: Iterable[dict[str, str]],
+        max_workers: int = 8,
+        return_exceptions: bool = False,
+    ) -> list[Union[JobResponse, Exception]]:
+        """
+        Submit the same JCL once per set of JCL symbol values, several jobs at a time.
+
+        Symbols are passed to z/OSMF in `X-IBM-JCL-Symbol-NAME` headers, so that the JCL is sent unchanged and
+        JES resolves `&NAME` in the JCL statements. Symbols whose name cannot be sent in a header are substituted
+        in the JCL before it is sent. Symbol values must be printable ASCII of at most 255 characters.
+
+        Parameters
+        ----------
+        jcl: str
+            The plain text JCL, referencing the symbols as `&NAME` or `&NAME.`
+        symbol_sets: Iterable[dict[str, str]]
+            The symbol values of each job, by symbol name
+        max_workers: int
+            Number of jobs submitted at the same time (default is 8)
+        return_exceptions: bool
+            Return the error of a job that could not be submitted in its place instead of raising it once all
+            the jobs are submitted (default is False)
+
+        Returns
+        -------
+        list[Union[JobResponse, Exception]]
+            The submitted jobs, in the order of `symbol_sets`
+
+        Raises
+        ------
+        ValueError
+            If `max_workers` is lower than 1, or if a symbol value is longer than 255 characters or is not
+            printable ASCII
+        """
+        if max_workers < 1:
+            self.logger.error("max_workers must be at least 1")
+            raise ValueError("max_workers must be at least 1")
+
+        def submit(symbols: dict[str, str]) -> JobResponse:
+            custom_args = self.__submit_arguments(jcl, symbols)
+            request_handler = self.request_handler.for_current_thread()
+            return JobResponse(request_handler.perform_request("PUT", custom_args, expected_code=[201]))
+
+        symbol_sets = list(symbol_sets)
+        with thread_pool(max_workers, len(symbol_sets)) as executor:
+            futures = [executor.submit(submit, symbols) for symbols in symbol_sets]
+        results: list[Union[JobResponse, Exception]] = []
+        for future in futures:
+            error = future.exception()
+            if return_exceptions and isinstance(error, Exception):
+                results.append(error)
+            else:
+                # Raises the error of the first job that could not be submitted
+                results.append(future.result())
+        return results
+
+    def __submit_arguments(self, jcl: str, symbols: Optional[dict[str, str]]) -> dict[str, Any]:
+        """
+        Build the arguments of a request submitting plain text JCL.
+
+        Parameters
+        ----------
+        jcl: str
+            The plain text JCL
+        symbols: Optional[dict[str, str]]
+            Values of the JCL symbols, by symbol name
+
+        Returns
+        -------
+        dict[str, Any]
+            The request arguments
+
+        Raises
+        ------
+        ValueError
+            If a symbol value is longer than 255 characters or is not printable ASCII
+        """
+        custom_args = self._create_custom_request_arguments()
+        custom_args["headers"]["Content-Type"] = "text/plain"
+        jcl = str(jcl)
+        for name, value in (symbols or {}).items():
+            name, value = name.upper(), str(value)
+            if len(value) > 255 or not value.isascii() or not value.isprintable():
+                # Such values would not fit in the JCL statements either
+                self.logger.error(f"The value of JCL symbol {name} is not printable ASCII of at most 255 characters")
+                raise ValueError(f"The value of JCL symbol {name} is not printable ASCII of at most 255 characters")
+            if _JCL_SYMBOL_NAME.fullmatch(name):
+                custom_args["headers"]["X-IBM-JCL-Symbol-{}".format(name)] = value
+            else:
+                pattern = r"&{}(?![A-Z0-9@#$])\.?".format(re.escape(name))
+                jcl = re.sub(pattern, lambda _, value=value: value, jcl, flags=re.IGNORECASE)
+        custom_args["data"] = jcl
+        return custom_args
+
     def get_spool_files(self, correlator: str) -> list[SpoolResponse]:
         """
         Retrieve the spool files for a job identified by the correlator.
@@ -386,11 +905,17 @@ class Jobs(SdkApi):  # type: ignore
         list[SpoolResponse]
             A JSON object containing the result of the request execution
         """
+        cache_key = self.__spool_cache_key(correlator)
+        cached = self.__cached_spool(cache_key, "files")
+        if cached is not None:
+            return [SpoolResponse(item) for item in json.loads(cached)]
         custom_args = self._create_custom_request_arguments()
         job_url = "{}/files".format(correlator)
         request_url = "{}{}".format(self._request_endpoint, self._encode_uri_component(job_url))
         custom_args["url"] = request_url
         response_json = self.request_handler.perform_request("GET", custom_args)
+        if cache_key is not None:
+            self.spool_cache.put(cache_key, "files", json.dumps(response_json))
         response = []
         for item in response_json:
             response.append(SpoolResponse(item))
@@ -410,11 +935,17 @@ class Jobs(SdkApi):  # type: ignore
         str
             A str object containing the result of the request execution
         """
+        cache_key = self.__spool_cache_key(correlator)
+        cached = self.__cached_spool(cache_key, "jcl")
+        if cached is not None:
+            return cached
         custom_args = self._create_custom_request_arguments()
         job_url = "{}/files/JCL/records".format(correlator)
         request_url = "{}{}".format(self._request_endpoint, self._encode_uri_component(job_url))
         custom_args["url"] = request_url
         response_json: str = self.request_handler.perform_request("GET", custom_args)
+        if cache_key is not None:
+            self.spool_cache.put(cache_key, "jcl", response_json)
         return response_json
 
     def get_spool_file_contents(self, correlator: str, id: str) -> str:
@@ -434,13 +965,126 @@ class Jobs(SdkApi):  # type: ignore
         str
             The contents of the spool file
         """
+        key = "spool-{}".format(id)
+        cache_key = self.__spool_cache_key(correlator)
+        cached = self.__cached_spool(cache_key, key)
+        if cached is not None:
+            return cached
         custom_args = self._create_custom_request_arguments()
         job_url = "{}/files/{}/records".format(correlator, id)
         request_url = "{}{}".format(self._request_endpoint, self._encode_uri_component(job_url))
         custom_args["url"] = request_url
         response_json: str = self.request_handler.perform_request("GET", custom_args)
+        if cache_key is not None:
+            self.spool_cache.put(cache_key, key, response_json)
         return response_json
 
+    def __cached_spool(self, cache_key: Optional[str], key: str) -> Optional[str]:
+        """
+        Return a spool entry of a job from the spool cache.
+
+        Parameters
+        ----------
+        cache_key: Optional[str]
+            The unique correlator of the job, from `__spool_cache_key`
+        key: str
+            The key of the entry in the cache
+
+        Returns
+        -------
+        Optional[str]
+            The entry, or None if the spool of the job cannot be cached or the entry is not cached
+        """
+        if cache_key is None:
+            return None
+        return self.spool_cache.get(cache_key, key)
+
+    def __spool_cache_key(self, correlator: str) -> Optional[str]:
+        """
+        Return the key of the spool of a job in the cache, if it can be cached because the job is complete.
+
+        The status is checked before the spool is retrieved, so that the spool of a job that was still running
+        is never cached. A "JOBNAME/JOBID" correlator is resolved to the unique 'job-correlator' of the status
+        every time, since job ids are reused when JES job numbers wrap around. The status of a job identified by
+        its unique correlator is only retrieved once, as completed jobs are remembered in the cache.
+
+        Parameters
+        ----------
+        correlator: str
+            The correlator of the job, either unique or "JOBNAME/JOBID"
+
+        Returns
+        -------
+        Optional[str]
+            The unique correlator of the job, or None if there is no cache or the job is not in the OUTPUT status
+        """
+        if self.spool_cache is None:
+            return None
+        if "/" not in correlator and self.spool_cache.get(correlator, "status") is not None:
+            return correlator
+        custom_args = self._create_custom_request_arguments()
+        custom_args["url"] = "{}{}".format(self._request_endpoint, self._encode_uri_component(correlator))
+        status = JobResponse(self.request_handler.perform_request("GET", custom_args))
+        if status.status != "OUTPUT" or not status.job_correlator:
+            return None
+        self.spool_cache.put(status.job_correlator, "status", status.status)
+        return status.job_correlator
+
+    def search_spool(
+        self,
+        jobs: Iterable[JobResponse],
+        pattern: Union[str, "re.Pattern[str]"],
+        ddnames: Optional[Iterable[str]] = None,
+        max_matches: Optional[int] = None,
+        max_matches_per_job: Optional[int] = None,
+        max_workers: int = 8,
+        skip_errors: bool = False,
+    ) -> Iterator[SpoolMatch]:
+        """
+        Search the spool files of many jobs concurrently for lines matching a regular expression.
+
+        Spool files are streamed and matched as their lines arrive, and no more data is fetched once
+        `max_matches` lines are found or the caller stops iterating.
+
+        Parameters
+        ----------
+        jobs: Iterable[JobResponse]
+            The jobs to search, e.g. from `list_jobs` or `iter_jobs`
+        pattern: Union[str, re.Pattern[str]]
+            The regular expression searched in each line
+        ddnames: Optional[Iterable[str]]
+            Only search the spool files with these DD names, e.g. ["JESMSGLG", "SYSPRINT"] (default is all)
+        max_matches: Optional[int]
+            Stop the search after this number of matches (default is no limit)
+        max_matches_per_job: Optional[int]
+            Stop searching a job after this number of matches, e.g. 1 to find which jobs match (default is no limit)
+        max_workers: int
+            Number of jobs searched at the same time (default is 8)
+        skip_errors: bool
+            Log the error and skip a job whose spool files cannot be read, e.g. because it was purged, instead of
+            stopping the search (default is False)
+
+        Returns
+        -------
+        Iterator[SpoolMatch]
+            The matching lines, in the order they are found
+        """
+
+        def list_files(request_handler: RequestHandler, job: JobResponse) -> list[SpoolResponse]:
+            custom_args = self._create_custom_request_arguments()
+            job_url = "{}/{}/files".format(job.jobname, job.jobid)
+            custom_args["url"] = "{}{}".format(self._request_endpoint, self._encode_uri_component(job_url))
+            return [SpoolResponse(item) for item in request_handler.perform_request("GET", custom_args)]
+
+        def read_lines(request_handler: RequestHandler, spool_file: SpoolResponse) -> Any:
+            custom_args = self._create_custom_request_arguments()
+            job_url = "{}/{}/files/{}/records".format(spool_file.jobname, spool_file.jobid, spool_file.id)
+            custom_args["url"] = "{}{}".format(self._request_endpoint, self._encode_uri_component(job_url))
+            return request_handler.perform_request("GET", custom_args, stream=True)
+
+        spool_search = SpoolSearch(self.request_handler, list_files, read_lines, max_workers)
+        return spool_search.search(jobs, pattern, ddnames, max_matches, max_matches_per_job, skip_errors)
+
     def get_job_output_as_files(self, status: dict[str, Any], output_dir: str) -> None:
         """
         Get all spool files and submitted jcl text in separate files in the specified output directory.
@@ -0,0 +1,223 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import json
+import secrets
+import socket
+import ssl
+import threading
+from concurrent.futures import Future, InvalidStateError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional, Type
+
+from zowe.core_for_zowe_sdk import Log
+
+from .response import JobResponse
+
+# Largest notification body accepted, in bytes; z/OSMF sends a small JSON object with the job status
+_MAX_NOTIFICATION_SIZE = 64 * 1024
+
+
+class JobNotificationReceiver:
+    """
+    Class used to receive the job completion notifications sent by z/OSMF.
+
+    The receiver runs a small HTTP server in a background thread. Each expected job gets its own notification
+    URL, containing a random token, which is passed to z/OSMF in the `X-IBM-Notification-URL` header when the
+    job is submitted. When the job ends, z/OSMF sends a POST request with the job status to that URL, and the
+    future returned for the job resolves, so that callers do not poll the job status.
+
+    z/OSMF must be able to open connections to the receiver. Notifications are not retried, so callers
+    should use a timeout when waiting and fall back to `Jobs.get_job_status` if it expires. Requests for an
+    unknown token are rejected before their body is read, and bodies larger than 64 KiB are refused.
+
+    Parameters
+    ----------
+    callback_host: Optional[str]
+        Host name or address at which z/OSMF reaches this machine (default is the fully qualified host name)
+    port: int
+        Port the server listens on (default is 0, i.e. any free port)
+    bind_address: str
+        Address the server listens on (default is all addresses)
+    ssl_context: Optional[ssl.SSLContext]
+        Server TLS context, to receive notifications over HTTPS (default is None, i.e. HTTP)
+    request_timeout: float
+        Maximum time, in seconds, to wait for the TLS handshake and for each read of a notification (default is 30)
+    """
+
+    def __init__(
+        self,
+        callback_host: Optional[str] = None,
+        port: int = 0,
+        bind_address: str = "",
+        ssl_context: Optional[ssl.SSLContext] = None,
+        request_timeout: float = 30,
+    ):
+        self.callback_host = callback_host or socket.getfqdn()
+        self.port = port
+        self.bind_address = bind_address
+        self.ssl_context = ssl_context
+        self.request_timeout = request_timeout
+        self.__logger = Log.register_logger(__name__)
+        self.__expected: dict[str, "Future[JobResponse]"] = {}
+        self.__lock = threading.Lock()
+        self.__server: Optional[ThreadingHTTPServer] = None
+        self.__thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "JobNotificationReceiver":
+        """Start the receiver and return it."""
+        self.start()
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[Type[BaseException]], exception: Optional[BaseException], traceback: Optional[object]
+    ) -> None:
+        """Stop the receiver before exit."""
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the receiver."""
+        scheme = "http" if self.ssl_context is None else "https"
+        return "{}://{}:{}/".format(scheme, self.callback_host, self.port)
+
+    def start(self) -> None:
+        """Start listening for notifications, if not already started."""
+        if self.__server is not None:
+            return
+        notify, logger = self.__notify, self.__logger
+
+        class NotificationHandler(BaseHTTPRequestHandler):
+            """Handles the notification requests of z/OSMF."""
+
+            timeout = self.request_timeout
+
+            def handle(self) -> None:
+                """Complete the TLS handshake in this thread, so that a slow client does not block the others."""
+                if isinstance(self.connection, ssl.SSLSocket):
+                    try:
+                        self.connection.do_handshake()
+                    except OSError as error:
+                        logger.warning(f"TLS handshake with {self.client_address[0]} failed: {error}")
+                        return
+                super().handle()
+
+            def do_POST(self) -> None:  # pylint: disable=invalid-name
+                """Resolve the future of the job whose token is in the path."""
+                self.send_response(notify(self.path.strip("/"), self.headers.get("Content-Length"), self.rfile.read))
+                self.end_headers()
+
+            def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+                """Log requests with the SDK logger instead of standard error."""
+                logger.debug(format % args)
+
+        server = ThreadingHTTPServer((self.bind_address, self.port), NotificationHandler)
+        server.daemon_threads = True
+        if self.ssl_context is not None:
+            server.socket = self.ssl_context.wrap_socket(server.socket, server_side=True, do_handshake_on_connect=False)
+        self.port = server.server_address[1]
+        self.__server = server
+        self.__thread = threading.Thread(target=server.serve_forever, name="zowe-job-notifications", daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """Stop listening and cancel the futures of the jobs that did not complete."""
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+        with self.__lock:
+            expected, self.__expected = self.__expected, {}
+        for future in expected.values():
+            future.cancel()
+
+    def expect(self) -> tuple[str, "Future[JobResponse]"]:
+        """
+        Create the notification URL of a job that is about to be submitted.
+
+        Returns
+        -------
+        tuple[str, Future[JobResponse]]
+            The URL to pass to z/OSMF, and the future resolving to the job status sent by z/OSMF when the job ends
+        """
+        self.start()
+        token = secrets.token_urlsafe(24)
+        future: "Future[JobResponse]" = Future()
+        with self.__lock:
+            self.__expected[token] = future
+        return self.url + token, future
+
+    def discard(self, notification_url: str) -> None:
+        """
+        Stop expecting the notification of a job, e.g. because it could not be submitted.
+
+        Parameters
+        ----------
+        notification_url: str
+            The URL returned by `expect`
+        """
+        with self.__lock:
+            future = self.__expected.pop(notification_url.rsplit("/", 1)[-1], None)
+        if future is not None:
+            future.cancel()
+
+    def __notify(self, token: str, content_length: Optional[str], read: Callable[[int], bytes]) -> int:
+        """
+        Resolve the future of a job from the notification sent by z/OSMF.
+
+        Parameters
+        ----------
+        token: str
+            The token of the notification URL
+        content_length: Optional[str]
+            The Content-Length header of the notification
+        read: Callable[[int], bytes]
+            Reads the given number of bytes of the body of the notification, a JSON object with the job status
+
+        Returns
+        -------
+        int
+            The HTTP status of the response to z/OSMF
+        """
+        with self.__lock:
+            expected = token in self.__expected
+        if not expected:
+            self.__logger.warning("Received a notification for an unknown job")
+            return 404
+        try:
+            length = int(content_length or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.__logger.error("Received a job notification with an invalid Content-Length")
+            return 400
+        if length > _MAX_NOTIFICATION_SIZE:
+            self.__logger.error(f"Received a job notification of {length} bytes")
+            return 413
+        body = read(length) if length else b""
+        try:
+            status = json.loads(body.decode("utf-8")) if body else {}
+        except ValueError:
+            status = None
+        if not isinstance(status, dict):
+            self.__logger.error("Received an invalid job notification")
+            return 400
+        with self.__lock:
+            future = self.__expected.pop(token, None)
+        if future is None:
+            self.__logger.warning("Received a notification for an unknown job")
+            return 404
+        try:
+            future.set_result(JobResponse(status))
+        except InvalidStateError:
+            self.__logger.debug("Received a notification for a job that is no longer awaited")
+        return 200
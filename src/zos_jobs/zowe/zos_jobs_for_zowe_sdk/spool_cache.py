@@ -0,0 +1,111 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import gzip
+import hashlib
+import os
+from typing import Optional
+
+from zowe.core_for_zowe_sdk.file_cache import FileCache
+
+
+class SpoolCache(FileCache):
+    """
+    Class used to keep the spool of completed jobs in a local directory shared between processes.
+
+    The spool of a job does not change once the job is in the OUTPUT status, so cached entries never expire;
+    when the cache grows over its maximum size, the least recently used entries are removed. Entries are keyed
+    by the unique job correlator, the 'job-correlator' of the job status, which is never reused when JES job
+    numbers wrap around, and by name ("spool-<id>" for a spool file, "jcl" and "files" for the JCL and the list
+    of spool files, "status" to remember that the job is complete).
+
+    Parameters
+    ----------
+    directory: str
+        The cache directory, created if needed
+    max_size: int
+        Maximum total size of the cached files, in bytes, at least 1 (default is 1 GiB)
+    compress: bool
+        Compress new entries with gzip, which typically divides the size of spool files by 5 to 10 at the cost
+        of some CPU time (default is False)
+    """
+
+    def __init__(self, directory: str, max_size: int = 1024**3, compress: bool = False):
+        super().__init__(directory, max_size, (".spool", ".spool.gz"))
+        self.compress = compress
+
+    def get(self, correlator: str, key: str) -> Optional[str]:
+        """
+        Return a cached spool entry.
+
+        Parameters
+        ----------
+        correlator: str
+            The unique correlator of the job, the 'job-correlator' of its status
+        key: str
+            The name of the entry: "spool-<id>" for a spool file, "jcl", "files" or "status"
+
+        Returns
+        -------
+        Optional[str]
+            The entry, or None if it is not cached
+        """
+        path = self.__path(correlator, key)
+        for name, opener in ((path + ".gz", gzip.open), (path, open)):
+            try:
+                with opener(name, "rb") as f:
+                    data = f.read()
+            except (OSError, EOFError):
+                continue
+            self._touch(name)
+            return data.decode("utf-8")
+        return None
+
+    def put(self, correlator: str, key: str, data: str) -> None:
+        """
+        Cache a spool entry and evict the least recently used entries if needed.
+
+        Parameters
+        ----------
+        correlator: str
+            The unique correlator of the job, the 'job-correlator' of its status
+        key: str
+            The name of the entry: "spool-<id>" for a spool file, "jcl", "files" or "status"
+        data: str
+            The entry
+        """
+        path = self.__path(correlator, key)
+        # Remove the copy stored with the other compression setting, which would be found first
+        self._remove(path if self.compress else path + ".gz")
+        path += ".gz" if self.compress else ""
+        encoded = data.encode("utf-8")
+        self._write(path, [gzip.compress(encoded) if self.compress else encoded])
+        self.evict(keep=os.path.basename(path))
+
+    def __path(self, correlator: str, key: str) -> str:
+        """
+        Return the path of an entry, without the compression suffix.
+
+        Parameters
+        ----------
+        correlator: str
+            The unique correlator of the job, the 'job-correlator' of its status
+        key: str
+            The key of the entry
+
+        Returns
+        -------
+        str
+            Path of the entry
+        """
+        digest = hashlib.sha256("{}\0{}".format(correlator, key).encode("utf-8")).hexdigest()[:40]
+        return os.path.join(self.directory, digest + ".spool")
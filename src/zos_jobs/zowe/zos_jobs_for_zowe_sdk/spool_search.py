@@ -0,0 +1,212 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import itertools
+import queue
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+from zowe.core_for_zowe_sdk import Log, RequestHandler
+
+from .response import JobResponse, SpoolResponse
+
+
+@dataclass
+class SpoolMatch:
+    """Line of a spool file matching a search."""
+
+    jobname: str
+    jobid: str
+    ddname: str
+    stepname: Optional[str]
+    spool_id: int
+    line_number: int
+    line: str
+
+
+class SpoolSearch:
+    """
+    Class used to search the spool files of many jobs concurrently.
+
+    The spool files of up to `max_workers` jobs are streamed at the same time and matched line by line as
+    they arrive, so that matches are returned before whole spool files are downloaded. Once enough matches
+    are found, or the caller stops iterating, no more spool files are requested and the ones being
+    streamed are closed.
+
+    Parameters
+    ----------
+    request_handler: RequestHandler
+        The request handler of the API object
+    list_files: Callable[[RequestHandler, JobResponse], list[SpoolResponse]]
+        Lists the spool files of one job
+    read_lines: Callable[[RequestHandler, SpoolResponse], Any]
+        Returns a streamed response with the records of one spool file
+    max_workers: int
+        Number of jobs searched at the same time (default is 8)
+
+    Raises
+    ------
+    ValueError
+        If `max_workers` is lower than 1
+    """
+
+    def __init__(
+        self,
+        request_handler: RequestHandler,
+        list_files: Callable[[RequestHandler, JobResponse], list[SpoolResponse]],
+        read_lines: Callable[[RequestHandler, SpoolResponse], Any],
+        max_workers: int = 8,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.request_handler = request_handler
+        self.list_files = list_files
+        self.read_lines = read_lines
+        self.max_workers = max_workers
+        self.__logger = Log.register_logger(__name__)
+
+    def search(
+        self,
+        jobs: Iterable[JobResponse],
+        pattern: Union[str, "re.Pattern[str]"],
+        ddnames: Optional[Iterable[str]] = None,
+        max_matches: Optional[int] = None,
+        max_matches_per_job: Optional[int] = None,
+        skip_errors: bool = False,
+    ) -> Iterator[SpoolMatch]:
+        """
+        Search the spool files of the jobs for lines matching a regular expression.
+
+        Jobs are taken from `jobs` only as workers become free, so a lazy iterable such as `Jobs.iter_jobs`
+        is not listed further than needed.
+
+        Parameters
+        ----------
+        jobs: Iterable[JobResponse]
+            The jobs to search
+        pattern: Union[str, re.Pattern[str]]
+            The regular expression searched in each line
+        ddnames: Optional[Iterable[str]]
+            Only search the spool files with these DD names, e.g. ["JESMSGLG", "SYSPRINT"] (default is all)
+        max_matches: Optional[int]
+            Stop the search after this number of matches (default is no limit)
+        max_matches_per_job: Optional[int]
+            Stop searching a job after this number of matches, e.g. 1 to find which jobs match (default is no limit)
+        skip_errors: bool
+            Log the error and skip a job whose spool files cannot be read, instead of raising it and stopping
+            the search (default is False)
+
+        Yields
+        ------
+        SpoolMatch
+            The matching lines, in the order they are found
+        """
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+        selected = None if ddnames is None else {ddname.upper() for ddname in ddnames}
+        found: "queue.Queue[Union[SpoolMatch, Future[None]]]" = queue.Queue()
+        stop = threading.Event()
+        pending = iter(jobs)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="zowe-spool-search")
+
+        def start(job: JobResponse) -> None:
+            future = executor.submit(self.__search_job, job, regex, selected, max_matches_per_job, found, stop)
+            # Queued after the matches of the job, to report that it is finished
+            future.add_done_callback(found.put)
+
+        running = 0
+        matches = 0
+        try:
+            for job in itertools.islice(pending, self.max_workers):
+                start(job)
+                running += 1
+            while running:
+                item = found.get()
+                if isinstance(item, Future):
+                    running -= 1
+                    job = next(pending, None)
+                    if job is not None:
+                        start(job)
+                        running += 1
+                    if skip_errors and item.exception() is not None:
+                        self.__logger.warning("Skipping job whose spool files cannot be read: %s", item.exception())
+                    else:
+                        # Raises the error that stopped the search of the job
+                        item.result()
+                    continue
+                yield item
+                matches += 1
+                if max_matches is not None and matches >= max_matches:
+                    return
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __search_job(
+        self,
+        job: JobResponse,
+        regex: "re.Pattern[str]",
+        ddnames: Optional[set[str]],
+        max_matches: Optional[int],
+        found: "queue.Queue[Union[SpoolMatch, Future[None]]]",
+        stop: threading.Event,
+    ) -> None:
+        """
+        Search the spool files of one job.
+
+        Parameters
+        ----------
+        job: JobResponse
+            The job
+        regex: re.Pattern[str]
+            The regular expression searched in each line
+        ddnames: Optional[set[str]]
+            The DD names of the spool files to search, or None for all
+        max_matches: Optional[int]
+            Maximum number of matches in the job
+        found: queue.Queue[Union[SpoolMatch, Future[None]]]
+            Receives the matches
+        stop: threading.Event
+            Set when the search is over
+        """
+        matches = 0
+        request_handler = self.request_handler.for_current_thread()
+        for spool_file in self.list_files(request_handler, job):
+            if stop.is_set() or (max_matches is not None and matches >= max_matches):
+                break
+            if ddnames is not None and str(spool_file.ddname).upper() not in ddnames:
+                continue
+            response = self.read_lines(request_handler, spool_file)
+            try:
+                if response.encoding is None:
+                    response.encoding = "utf-8"
+                for line_number, line in enumerate(response.iter_lines(decode_unicode=True), 1):
+                    if stop.is_set() or (max_matches is not None and matches >= max_matches):
+                        break
+                    if regex.search(line):
+                        matches += 1
+                        found.put(
+                            SpoolMatch(
+                                job.jobname,
+                                job.jobid,
+                                spool_file.ddname,
+                                spool_file.stepname,
+                                spool_file.id,
+                                line_number,
+                                line,
+                            )
+                        )
+            finally:
+                # Stops the transfer of the rest of the spool file
+                response.close()
@@ -0,0 +1,242 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Type
+
+from zowe.core_for_zowe_sdk import Log
+from zowe.core_for_zowe_sdk.exceptions import RequestFailed
+
+from .response import JobResponse
+
+if TYPE_CHECKING:
+    from .jobs import Jobs
+
+
+class JobEventType(Enum):
+    """Represents a change of a job between two snapshots of the queue."""
+
+    NEW = "new"
+    PHASE_CHANGED = "phase changed"
+    RETCODE_SET = "retcode set"
+    PURGED = "purged"
+    LEFT_FILTER = "left filter"
+
+
+@dataclass
+class JobEvent:
+    """Change of a job detected by `JobWatcher`."""
+
+    type: JobEventType
+    job: JobResponse
+    previous: Optional[JobResponse] = None
+
+
+class JobWatcher:
+    """
+    Class used to watch the JES queue and notify subscribers of the changes of its jobs.
+
+    One polling loop lists the jobs matching the filters, compares the snapshot with the previous one by
+    job correlator, and delivers the changes to every subscriber, so that many consumers share the load of a
+    single poller. Subscribers are called from the polling thread, in the order they subscribed, and must
+    not block it for long.
+
+    The status of a job missing from a snapshot is retrieved, to tell a purged job from a job that no longer
+    matches the filters (e.g. an active job that ended while watching `status="ACTIVE"`).
+
+    Parameters
+    ----------
+    jobs: Jobs
+        The Jobs API object used to list the jobs
+    interval: float
+        Number of seconds between two snapshots when running in the background (default is 30)
+    **filters: Any
+        The filters of `Jobs.iter_jobs`, e.g. `owner`, `prefix` or `status`
+    """
+
+    def __init__(self, jobs: "Jobs", interval: float = 30, **filters: Any):
+        self.jobs = jobs
+        self.interval = interval
+        self.filters = filters
+        self.__logger = Log.register_logger(__name__)
+        self.__snapshot: Optional[dict[str, JobResponse]] = None
+        self.__subscribers: list[tuple[Callable[[JobEvent], None], Optional[frozenset[JobEventType]]]] = []
+        self.__lock = threading.Lock()
+        self.__poll_lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "JobWatcher":
+        """Start watching in the background and return the watcher."""
+        self.start()
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[Type[BaseException]], exception: Optional[BaseException], traceback: Optional[object]
+    ) -> None:
+        """Stop watching before exit."""
+        self.stop()
+
+    def subscribe(
+        self, callback: Callable[[JobEvent], None], types: Optional[Iterable[JobEventType]] = None
+    ) -> Callable[[], None]:
+        """
+        Register a function called with each change of the queue.
+
+        Parameters
+        ----------
+        callback: Callable[[JobEvent], None]
+            The function
+        types: Optional[Iterable[JobEventType]]
+            Only deliver these types of changes (default is all)
+
+        Returns
+        -------
+        Callable[[], None]
+            A function that unsubscribes the callback
+        """
+        subscriber = (callback, None if types is None else frozenset(types))
+        with self.__lock:
+            self.__subscribers.append(subscriber)
+
+        def unsubscribe() -> None:
+            with self.__lock:
+                if subscriber in self.__subscribers:
+                    self.__subscribers.remove(subscriber)
+
+        return unsubscribe
+
+    def poll(self) -> list[JobEvent]:
+        """
+        Take a snapshot of the queue and deliver the changes since the previous one.
+
+        The first snapshot is the baseline and produces no events. If a request fails, the previous snapshot
+        is kept, so that the changes are delivered by the next poll.
+
+        Returns
+        -------
+        list[JobEvent]
+            The changes, also delivered to the subscribers
+        """
+        with self.__poll_lock:
+            current = {self.__key(job): job for job in self.jobs.iter_jobs(**self.filters)}
+            previous = self.__snapshot
+            if previous is None:
+                self.__snapshot = current
+                return []
+            events = []
+            for key, job in current.items():
+                before = previous.get(key)
+                if before is None:
+                    events.append(JobEvent(JobEventType.NEW, job))
+                    continue
+                if (before.phase, before.status) != (job.phase, job.status):
+                    events.append(JobEvent(JobEventType.PHASE_CHANGED, job, before))
+                if before.retcode is None and job.retcode is not None:
+                    events.append(JobEvent(JobEventType.RETCODE_SET, job, before))
+            for key, before in previous.items():
+                if key not in current:
+                    events.append(self.__missing_job_event(before))
+            self.__snapshot = current
+        self.__deliver(events)
+        return events
+
+    def start(self) -> None:
+        """Start polling in a background thread, if not already started."""
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+        self.__stop.clear()
+        self.__thread = threading.Thread(target=self.__run, name="zowe-job-watcher", daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and wait for the background thread to finish."""
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def __run(self) -> None:
+        """Poll until stopped, logging the errors of failed snapshots."""
+        while not self.__stop.is_set():
+            try:
+                self.poll()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                # The previous snapshot is kept, so no change is lost
+                self.__logger.error(f"Could not list the jobs: {error}")
+            self.__stop.wait(self.interval)
+
+    def __missing_job_event(self, before: JobResponse) -> JobEvent:
+        """
+        Tell whether a job missing from the snapshot was purged or no longer matches the filters.
+
+        Parameters
+        ----------
+        before: JobResponse
+            The job in the previous snapshot
+
+        Returns
+        -------
+        JobEvent
+            A PURGED event if z/OSMF no longer knows the job, or a LEFT_FILTER event with its current status
+
+        Raises
+        ------
+        RequestFailed
+            If the status of the job cannot be retrieved for another reason
+        """
+        try:
+            job = self.jobs.get_job_status(str(before.jobname), str(before.jobid))
+        except RequestFailed as error:
+            if error.status_code not in (400, 404):
+                raise
+            return JobEvent(JobEventType.PURGED, before, before)
+        return JobEvent(JobEventType.LEFT_FILTER, job, before)
+
+    def __deliver(self, events: list[JobEvent]) -> None:
+        """
+        Call the subscribers with the events they subscribed to.
+
+        Parameters
+        ----------
+        events: list[JobEvent]
+            The events
+        """
+        with self.__lock:
+            subscribers = list(self.__subscribers)
+        for event in events:
+            for callback, types in subscribers:
+                if types is not None and event.type not in types:
+                    continue
+                try:
+                    callback(event)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    self.__logger.error(f"Job watcher subscriber failed: {error}")
+
+    @staticmethod
+    def __key(job: JobResponse) -> str:
+        """
+        Return the key identifying a job across snapshots.
+
+        Parameters
+        ----------
+        job: JobResponse
+            The job
+
+        Returns
+        -------
+        str
+            The job correlator, or the job name and id if z/OSMF did not return it
+        """
+        return job.job_correlator or "{}/{}".format(job.jobname, job.jobid)
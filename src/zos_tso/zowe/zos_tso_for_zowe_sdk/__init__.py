@@ -10,4 +10,5 @@ SPDX-License-Identifier: EPL-2.0
 Copyright Contributors to the Zowe Project.
 """
 
+from .session import TsoSession
 from .tso import Tso
@@ -0,0 +1,210 @@
+"""Zowe Client Python SDK.
+
+This program and the accompanying materials are made available under the terms of the
+Eclipse Public License v2.0 which accompanies this distribution, and is available at
+
+https://www.eclipse.org/legal/epl-v20.html
+
+SPDX-License-Identifier: EPL-2.0
+
+Copyright Contributors to the Zowe Project.
+"""
+
+import time
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Type
+
+from zowe.core_for_zowe_sdk import Log
+
+from .response import EndResponse
+
+if TYPE_CHECKING:
+    from .tso import Tso
+
+
+class TsoSession:
+    """
+    Class used to run several TSO commands in the same TSO address space.
+
+    The address space is started once by `open` and ended once by `close`, instead of once per command as
+    with `Tso.issue_command`. Commands run one after the other: the output of each command is read until
+    TSO prompts for the next one, so that it is kept separate from the output of the other commands.
+
+    Parameters
+    ----------
+    tso: Tso
+        The TSO API object
+    command_timeout: float
+        Maximum time, in seconds, to wait for each command to complete (default is 1800, i.e. 30 minutes)
+    **start_options: Optional[str]
+        The parameters of `Tso.start`, e.g. `proc` or `acct`
+    """
+
+    def __init__(self, tso: "Tso", command_timeout: float = 1800, **start_options: Optional[str]):
+        self.tso = tso
+        self.command_timeout = command_timeout
+        self.start_options = start_options
+        self.session_key: Optional[str] = None
+        self.__logger = Log.register_logger(__name__)
+        # Whether the output of the last command was not read up to the next prompt
+        self.__awaiting_prompt = False
+
+    def __enter__(self) -> "TsoSession":
+        """Open the session and return it."""
+        self.open()
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[Type[BaseException]], exception: Optional[BaseException], traceback: Optional[object]
+    ) -> None:
+        """End the session before exit."""
+        self.close()
+
+    def open(self) -> list[str]:
+        """
+        Start the TSO address space and wait until it is ready for commands.
+
+        Returns
+        -------
+        list[str]
+            The logon messages
+        """
+        start_response = self.tso.start(**self.start_options)
+        self.session_key = str(start_response.servletKey)
+        tso_data = list(start_response.tsoData or [])
+        messages = self.tso.retrieve_tso_messages(tso_data)
+        if not self.__has_prompt(tso_data):
+            self.__awaiting_prompt = True
+            ready = False
+            try:
+                messages += list(self.__read_until_prompt("logon"))
+                ready = True
+            finally:
+                if not ready:
+                    # Do not leave the address space running when the session cannot be used
+                    self.close()
+        return messages
+
+    def stream(self, command: str) -> Iterator[str]:
+        """
+        Send a command and return its output as it arrives.
+
+        The output of the previous command is discarded if it was not read until the end.
+
+        Parameters
+        ----------
+        command: str
+            TSO command to be executed
+
+        Returns
+        -------
+        Iterator[str]
+            The messages of the command, until TSO prompts for the next command
+
+        Raises
+        ------
+        ValueError
+            If the session is not open
+        """
+        if self.session_key is None:
+            self.__logger.error("The TSO session is not open")
+            raise ValueError("The TSO session is not open")
+        if self.__awaiting_prompt:
+            for message in self.__read_until_prompt("previous command"):
+                self.__logger.debug("Discarded TSO message: %s", message)
+        self.tso.send(self.session_key, command, False)
+        self.__awaiting_prompt = True
+        return self.__read_until_prompt(command)
+
+    def run(self, command: str) -> list[str]:
+        """
+        Run a command and wait for its output.
+
+        Parameters
+        ----------
+        command: str
+            TSO command to be executed
+
+        Returns
+        -------
+        list[str]
+            The messages of the command
+        """
+        return list(self.stream(command))
+
+    def run_all(self, commands: Iterable[str]) -> list[list[str]]:
+        """
+        Run commands one after the other.
+
+        Parameters
+        ----------
+        commands: Iterable[str]
+            TSO commands to be executed
+
+        Returns
+        -------
+        list[list[str]]
+            The messages of each command
+        """
+        return [self.run(command) for command in commands]
+
+    def close(self) -> Optional[EndResponse]:
+        """
+        End the TSO address space, even if a command is still running.
+
+        Returns
+        -------
+        Optional[EndResponse]
+            The response of z/OSMF, or None if the session was not open
+        """
+        if self.session_key is None:
+            return None
+        session_key, self.session_key = self.session_key, None
+        self.__awaiting_prompt = False
+        return self.tso.end(session_key)
+
+    def __read_until_prompt(self, command: str) -> Iterator[str]:
+        """
+        Read the output of the session until TSO prompts for a command.
+
+        Parameters
+        ----------
+        command: str
+            The command whose output is read, for the error message
+
+        Yields
+        ------
+        str
+            The messages
+
+        Raises
+        ------
+        TimeoutError
+            If TSO does not prompt within `command_timeout` seconds
+        """
+        deadline = time.monotonic() + self.command_timeout
+        while self.__awaiting_prompt:
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"Timed out after {self.command_timeout} seconds waiting for TSO PROMPT for command: {command}"
+                )
+            tso_data = self.tso.receive(str(self.session_key))
+            if self.__has_prompt(tso_data):
+                self.__awaiting_prompt = False
+            yield from self.tso.retrieve_tso_messages(tso_data)
+
+    @staticmethod
+    def __has_prompt(tso_data: list[Any]) -> bool:
+        """
+        Return whether TSO prompts for a command.
+
+        Parameters
+        ----------
+        tso_data: list[Any]
+            The output of the session
+
+        Returns
+        -------
+        bool
+            True if the output contains a TSO prompt
+        """
+        return any("TSO PROMPT" in item for item in tso_data)
@@ -12,11 +12,12 @@ Copyright Contributors to the Zowe Project.
 
 import json
 import time
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 from zowe.core_for_zowe_sdk import SdkApi, constants
 
 from .response import EndResponse, IssueResponse, SendResponse, StartResponse
+from .session import TsoSession
 
 
 class Tso(SdkApi):  # type: ignore
@@ -66,7 +67,7 @@ class Tso(SdkApi):  # type: ignore
         start_response = self.start()
         session_key = start_response.servletKey
         # Fetch startup messages and suppress from command output
-        self.__get_tso_data(session_key)
+        self.receive(session_key)
         send_response = self.send(session_key, command, False)
         command_output = ""
         tso_messages = []
@@ -77,12 +78,82 @@ class Tso(SdkApi):  # type: ignore
                     raise TimeoutError(
                         f"Timed out after {command_timeout} seconds waiting for TSO PROMPT for command: {command}"
                     )
-                command_output = self.__get_tso_data(session_key)
+                command_output = self.receive(session_key)
                 tso_messages += self.retrieve_tso_messages(command_output)
         finally:
             end_response = self.end(session_key)
         return IssueResponse(start_response, send_response, end_response, tso_messages)
 
+    def stream_command(self, command: str, command_timeout: float = 1800) -> Iterator[str]:
+        """
+        Issue a TSO command and yield its output as it arrives.
+
+        Unlike `issue_command`, the messages are not accumulated: each poll of
+        the TSO session is yielded before the next one is sent, so only the
+        messages of one poll are held in memory. The session is ended when the
+        command completes, or when the generator is closed before the command
+        completes.
+
+        Parameters
+        ----------
+        command: str
+            TSO command to be executed
+        command_timeout: float
+            Maximum time, in seconds, to wait for the "TSO PROMPT" message
+            before giving up (default is 1800, i.e. 30 minutes)
+
+        Yields
+        ------
+        str
+            The messages of the command
+        """
+        with self.tso_session(command_timeout) as session:
+            yield from session.stream(command)
+
+    def issue_commands(
+        self, commands: Iterable[str], command_timeout: float = 1800, **start_options: Optional[str]
+    ) -> list[list[str]]:
+        """
+        Issue several TSO commands in the same TSO session.
+
+        The session is started once, the commands are run one after the other,
+        and the session is ended once, instead of once per command.
+
+        Parameters
+        ----------
+        commands: Iterable[str]
+            TSO commands to be executed
+        command_timeout: float
+            Maximum time, in seconds, to wait for each command to complete (default is 1800, i.e. 30 minutes)
+        **start_options: Optional[str]
+            The parameters of `start`, e.g. `proc` or `acct`
+
+        Returns
+        -------
+        list[list[str]]
+            The output of each command
+        """
+        with self.tso_session(command_timeout, **start_options) as session:
+            return session.run_all(commands)
+
+    def tso_session(self, command_timeout: float = 1800, **start_options: Optional[str]) -> TsoSession:
+        """
+        Create a TSO session to run several commands in the same address space.
+
+        Parameters
+        ----------
+        command_timeout: float
+            Maximum time, in seconds, to wait for each command to complete (default is 1800, i.e. 30 minutes)
+        **start_options: Optional[str]
+            The parameters of `start`, e.g. `proc` or `acct`
+
+        Returns
+        -------
+        TsoSession
+            The session, started by `open` or when used as a context manager
+        """
+        return TsoSession(self, command_timeout, **start_options)
+
     def start_tso_session(
         self,
         proc: Optional[str] = None,
@@ -213,6 +284,24 @@ class Tso(SdkApi):  # type: ignore
         response_json = self.request_handler.perform_request("PUT", custom_args)
         return SendResponse(**response_json)
 
+    def receive(self, session_key: str) -> list[dict[str, Any]]:
+        """
+        Read the pending output of an existing TSO session.
+
+        Parameters
+        ----------
+        session_key: str
+            The session key of an existing TSO session
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            A non-normalized list from TSO containing the output
+        """
+        custom_args = self._create_custom_request_arguments()
+        custom_args["url"] = "{}/{}".format(self._request_endpoint, session_key)
+        return list(self.request_handler.perform_request("GET", custom_args).get("tsoData", []))
+
     def ping_tso_session(self, session_key: str) -> str:
         """
         Ping an existing TSO session and returns if it is still available.
@@ -303,22 +392,3 @@ class Tso(SdkApi):  # type: ignore
             A list containing the TSO response messages
         """
         return [message["TSO MESSAGE"]["DATA"] for message in response_json if "TSO MESSAGE" in message]
-
-    def __get_tso_data(self, session_key: str) -> dict[str, Any]:
-        """
-        Get data from a tso session.
-
-        Parameters
-        ----------
-        session_key: str
-            The session key of an existing TSO session
-
-        Returns
-        -------
-        dict[str, Any]
-            A json response of the operation result
-        """
-        custom_args = self._create_custom_request_arguments()
-        custom_args["url"] = "{}/{}".format(self._request_endpoint, session_key)
-        command_output = self.request_handler.perform_request("GET", custom_args).get("tsoData", [])
-        return command_output
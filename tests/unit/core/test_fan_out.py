@@ -0,0 +1,113 @@
+"""Unit tests for the Zowe Python SDK Core package."""
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+from zowe.core_for_zowe_sdk import FanOutExecutor, HostResult, SdkApi
+
+
+class TestFanOutExecutorClass(unittest.TestCase):
+    """FanOutExecutor class unit tests."""
+
+    def setUp(self):
+        """Setup fixtures for FanOutExecutor class."""
+        self.profiles = [
+            {"host": "lpar1.com", "user": "Username", "password": "Password"},
+            {"host": "lpar2.com", "user": "Username", "password": "Password"},
+            {"host": "lpar3.com", "user": "Username", "password": "Password"},
+        ]
+
+    def test_run_keys_results_by_host(self):
+        """Results and errors should be reported per host."""
+
+        def call(api):
+            if api.session.host == "lpar2.com":
+                raise RuntimeError("boom")
+            return api.session.host.upper()
+
+        results = FanOutExecutor(self.profiles).run(lambda profile: SdkApi(profile, "/zosmf/"), call)
+
+        self.assertEqual(set(results), {"lpar1.com", "lpar2.com", "lpar3.com"})
+        self.assertEqual(results["lpar1.com"].result, "LPAR1.COM")
+        self.assertTrue(results["lpar3.com"].ok)
+        self.assertFalse(results["lpar2.com"].ok)
+        self.assertIsInstance(results["lpar2.com"].error, RuntimeError)
+
+    def test_base_exception_is_raised_to_caller(self):
+        """An exception that is not an error of the call should be raised instead of leaving the host pending."""
+
+        def call(api):
+            raise SystemExit(3)
+
+        with self.assertRaises(SystemExit):
+            FanOutExecutor(self.profiles[:1]).run(lambda profile: SdkApi(profile, "/zosmf/"), call, timeout=5)
+
+    def test_runs_hosts_concurrently(self):
+        """Every host should be called at the same time when there is a thread per host."""
+        barrier = threading.Barrier(len(self.profiles), timeout=5)
+        results = FanOutExecutor(self.profiles).run(lambda profile: profile, lambda profile: barrier.wait())
+        self.assertTrue(all(result.ok for result in results.values()))
+
+    def test_timeout(self):
+        """A host that does not answer in time should be reported with a TimeoutError without blocking the others."""
+        release = threading.Event()
+
+        def call(profile):
+            if profile["host"] == "lpar3.com":
+                release.wait(5)
+            return profile["host"]
+
+        try:
+            results = list(FanOutExecutor(self.profiles, timeout=0.2).as_completed(lambda profile: profile, call))
+        finally:
+            release.set()
+
+        self.assertEqual(results[-1].host, "lpar3.com")
+        self.assertIsInstance(results[-1].error, TimeoutError)
+        self.assertEqual({result.host for result in results[:-1]}, {"lpar1.com", "lpar2.com"})
+
+    def test_timeout_frees_worker_for_queued_hosts(self):
+        """A host that never answers should not block the hosts queued behind it."""
+        release = threading.Event()
+
+        def call(profile):
+            if profile["host"] == "lpar1.com":
+                release.wait(10)
+            return profile["host"]
+
+        executor = FanOutExecutor(self.profiles, max_workers=1, timeout=0.2)
+        started = time.monotonic()
+        try:
+            results = list(executor.as_completed(lambda profile: profile, call))
+        finally:
+            release.set()
+
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual([result.host for result in results], ["lpar1.com", "lpar2.com", "lpar3.com"])
+        self.assertIsInstance(results[0].error, TimeoutError)
+        self.assertTrue(results[1].ok and results[2].ok)
+
+    @mock.patch("requests.Session.send")
+    def test_context_manager_closes_session(self, mock_send_request):
+        """Each host's API object should be used as a context manager."""
+        with mock.patch("requests.Session.close") as mock_close:
+            FanOutExecutor(self.profiles).run(lambda profile: SdkApi(profile, "/zosmf/"), lambda api: None)
+        self.assertEqual(mock_close.call_count, len(self.profiles))
+
+    def test_duplicate_hosts(self):
+        """A list of profiles must not contain the same host twice."""
+        with self.assertRaises(ValueError):
+            FanOutExecutor([self.profiles[0], self.profiles[0]])
+
+    def test_from_profile_names(self):
+        """Profiles loaded through a profile manager should be keyed by profile name."""
+        profile_manager = mock.Mock()
+        profile_manager.load.side_effect = lambda profile_name, **kwargs: {"host": profile_name + ".com"}
+        executor = FanOutExecutor.from_profile_names(profile_manager, ["lpar1", "lpar2"], validate_schema=False)
+        self.assertEqual(executor.profiles, {"lpar1": {"host": "lpar1.com"}, "lpar2": {"host": "lpar2.com"}})
+        profile_manager.load.assert_any_call(profile_name="lpar1", validate_schema=False)
+        self.assertIsInstance(
+            executor.run(lambda profile: profile, lambda profile: profile["host"])["lpar1"], HostResult
+        )
@@ -0,0 +1,52 @@
+"""Unit tests for the Zowe Python SDK Core package."""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from zowe.core_for_zowe_sdk.file_cache import FileCache, atomic_write
+
+
+class TestFileCacheClass(unittest.TestCase):
+    """FileCache class unit tests."""
+
+    def setUp(self):
+        """Create a temporary cache directory."""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_atomic_write_keeps_previous_file_on_error(self):
+        """A file should be left unchanged, and no temporary file left behind, when writing it fails."""
+        path = os.path.join(self.directory, "entry")
+        with atomic_write(path, "w", encoding="utf-8") as f:
+            f.write("first")
+
+        with self.assertRaises(RuntimeError):
+            with atomic_write(path, "w", encoding="utf-8") as f:
+                f.write("second")
+                raise RuntimeError("interrupted")
+
+        with open(path, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), "first")
+        self.assertEqual(os.listdir(self.directory), ["entry"])
+
+    def test_evict_least_recently_used(self):
+        """The least recently used files with the cache suffixes should be evicted when the cache is full."""
+        cache = FileCache(self.directory, 10, (".data",))
+        for name in ("a.data", "b.data", "c.json"):
+            cache._write(os.path.join(self.directory, name), [b"1234", b"56"])
+        past = time.time() - 60
+        os.utime(os.path.join(self.directory, "a.data"), (past, past))
+
+        cache.evict()
+
+        self.assertEqual(sorted(os.listdir(self.directory)), ["b.data", "c.json"])
+        cache.clear()
+        self.assertEqual(os.listdir(self.directory), ["c.json"])
+
+    def test_max_size(self):
+        """The maximum size should be at least one byte."""
+        with self.assertRaises(ValueError):
+            FileCache(self.directory, 0, (".data",))
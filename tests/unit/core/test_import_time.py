@@ -0,0 +1,114 @@
+"""Import-time regression tests for the Zowe Python SDK Core package."""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# Generous bound, measured around 4 ms; importing requests alone takes over 100 ms
+IMPORT_TIME_LIMIT_US = 50_000
+
+HEAVY_MODULES = ["requests", "jsonschema", "json5", "deepmerge", "yaml", "zowe.secrets_for_zowe_sdk"]
+
+
+def run_isolated(code: str, home: str) -> dict:
+    """Run a snippet in a fresh interpreter and return the JSON it prints."""
+    env = {**os.environ, "HOME": home, "USERPROFILE": home}
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+class TestImportTime(unittest.TestCase):
+    """Guard the cost of importing the Core package."""
+
+    def setUp(self):
+        self.home = tempfile.mkdtemp()
+
+    def test_package_import_is_lightweight(self):
+        """Importing the package should neither load third-party dependencies nor touch the log directory."""
+        result = run_isolated(
+            "import json, sys; import zowe.core_for_zowe_sdk; "
+            f"print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))",
+            self.home,
+        )
+        self.assertEqual(result, [])
+        self.assertFalse(os.path.exists(os.path.join(self.home, ".zowe", "logs")))
+
+    def test_sdk_api_does_not_load_profile_dependencies(self):
+        """Accessing SdkApi should only load what is needed to send requests."""
+        result = run_isolated(
+            "import json, sys; from zowe.core_for_zowe_sdk import SdkApi, Log; "
+            f"print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))",
+            self.home,
+        )
+        self.assertEqual(result, ["requests"])
+        self.assertFalse(os.path.exists(os.path.join(self.home, ".zowe", "logs")))
+
+    def test_lazy_attributes_resolve(self):
+        """Lazily imported names should resolve to the classes defined in their submodules."""
+        import zowe.core_for_zowe_sdk as core
+        from zowe.core_for_zowe_sdk.profile_manager import ProfileManager
+
+        self.assertIs(core.ProfileManager, ProfileManager)
+        self.assertIn("SdkApi", dir(core))
+        with self.assertRaises(AttributeError):
+            getattr(core, "NotAnAttribute")
+
+    def test_star_import_exports_lazy_attributes(self):
+        """A star import should export the lazily imported classes along with the eager names."""
+        namespace = {}
+        exec("from zowe.core_for_zowe_sdk import *", namespace)
+        self.assertIn("SdkApi", namespace)
+        self.assertIn("RequestFailed", namespace)
+        self.assertIn("AUTH_TYPE_TOKEN", namespace)
+        self.assertIn("constants", namespace)
+
+    def test_all_follows_submodules(self):
+        """Every exception and session constant should be exported, and the internal helpers should not."""
+        import zowe.core_for_zowe_sdk as core
+        from zowe.core_for_zowe_sdk import exceptions, session_constants
+
+        for name, value in vars(exceptions).items():
+            if isinstance(value, type) and issubclass(value, Exception) and value.__module__ == exceptions.__name__:
+                self.assertIn(name, core.__all__)
+        for name in ("AUTH_TYPE_TOKEN", "DEFAULT_HTTPS_PORT"):
+            self.assertIn(name, core.__all__)
+            self.assertEqual(getattr(core, name), getattr(session_constants, name))
+        for name in ("thread_pool", "atomic_write", "FileCache"):
+            self.assertNotIn(name, core.__all__)
+
+    def test_package_import_time(self):
+        """Importing the package should take a few milliseconds, far less than importing requests alone."""
+        env = {**os.environ, "HOME": self.home, "USERPROFILE": self.home}
+        output = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import zowe.core_for_zowe_sdk"],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # Lines are "import time: <self us> | <cumulative us> | <module>"
+        cumulative = {
+            fields[2].strip(): int(fields[1])
+            for fields in (line.split(":", 1)[1].split("|") for line in output.stderr.splitlines())
+            if fields[1].strip().isdigit()
+        }
+        self.assertLess(cumulative["zowe.core_for_zowe_sdk"], IMPORT_TIME_LIMIT_US)
+
+    def test_package_import_loads_only_eager_submodules(self):
+        """Importing the package should only load the submodules that are not lazily imported."""
+        result = run_isolated(
+            "import json, sys; import zowe.core_for_zowe_sdk; "
+            "print(json.dumps(sorted(name for name in sys.modules if name.startswith('zowe.core_for_zowe_sdk.'))))",
+            self.home,
+        )
+        self.assertEqual(
+            result,
+            [
+                "zowe.core_for_zowe_sdk.constants",
+                "zowe.core_for_zowe_sdk.exceptions",
+                "zowe.core_for_zowe_sdk.session_constants",
+            ],
+        )
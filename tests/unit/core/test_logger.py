@@ -3,13 +3,21 @@
 # Including necessary paths
 import logging
 import os
+import signal
 import stat
 import sys
+import tempfile
 import unittest
 from unittest import mock
 
 from pyfakefs.fake_filesystem_unittest import TestCase
-from zowe.core_for_zowe_sdk.logger import Log, restrict_to_owner
+from zowe.core_for_zowe_sdk.logger import (
+    BackgroundQueueHandler,
+    Log,
+    OwnerOnlyFileHandler,
+    SamplingFilter,
+    restrict_to_owner,
+)
 
 
 class test_logger_setLoggerLevel(TestCase):
@@ -90,6 +98,7 @@ class test_logger_setLoggerLevel(TestCase):
     def test_log_directory_and_file_are_owner_only(self):
         """The log directory and file should not be readable/writable by group or others, since log
         content may include request/response details."""
+        Log.file_writer.handle(logging.makeLogRecord({"levelno": logging.INFO, "msg": "create log file"}))
         dir_mode = stat.S_IMODE(os.stat(Log.dirname).st_mode)
         self.assertEqual(dir_mode, 0o700)
 
@@ -97,6 +106,87 @@ class test_logger_setLoggerLevel(TestCase):
         file_mode = stat.S_IMODE(os.stat(log_file).st_mode)
         self.assertEqual(file_mode, 0o600)
 
+    @mock.patch("zowe.core_for_zowe_sdk.logger.restrict_to_owner")
+    @mock.patch("zowe.core_for_zowe_sdk.logger.os.makedirs")
+    def test_file_handler_defers_file_creation(self, mock_makedirs, mock_restrict):
+        """Creating the file handler should not touch the file system until the first record is written."""
+        log_file = os.path.join(tempfile.mkdtemp(), "logs", "python_sdk_logs.log")
+        handler = OwnerOnlyFileHandler(log_file)
+        mock_makedirs.assert_not_called()
+        mock_restrict.assert_not_called()
+        self.assertIsNone(handler.stream)
+
+        mock_makedirs.side_effect = lambda name, mode, exist_ok: os.mkdir(name, mode)
+        handler.handle(logging.makeLogRecord({"levelno": logging.INFO, "msg": "first record"}))
+        handler.close()
+        mock_makedirs.assert_called_once_with(os.path.dirname(log_file), mode=0o700, exist_ok=True)
+        mock_restrict.assert_any_call(log_file, 0o600)
+        with open(log_file, "r", encoding="utf-8") as f:
+            self.assertIn("first record", f.read())
+
+    def test_background_queue_handler(self):
+        """Records should be written by the target handler on a background thread."""
+        target = mock.Mock(spec=logging.Handler, level=logging.NOTSET)
+        handler = BackgroundQueueHandler(target)
+        record = logging.makeLogRecord({"levelno": logging.INFO, "msg": "hello %s", "args": ("world",)})
+        handler.handle(record)
+        handler.flush()
+        target.handle.assert_called_once()
+        self.assertEqual(target.handle.call_args[0][0].getMessage(), "hello world")
+        handler.stop()
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_background_queue_handler_after_fork(self):
+        """A forked child should write its records with its own writer thread."""
+        target = mock.Mock(spec=logging.Handler, level=logging.NOTSET)
+        handler = BackgroundQueueHandler(target)
+        handler.handle(logging.makeLogRecord({"msg": "parent"}))
+        handler.flush()
+        pid = os.fork()
+        if pid == 0:
+            signal.alarm(10)
+            target.reset_mock()
+            handler.handle(logging.makeLogRecord({"msg": "child"}))
+            handler.flush()
+            os._exit(0 if target.handle.call_count == 1 else 1)
+        _, status = os.waitpid(pid, 0)
+        handler.stop()
+        self.assertTrue(os.WIFEXITED(status))
+        self.assertEqual(os.WEXITSTATUS(status), 0)
+
+    def test_sampling(self):
+        """Only one in every `rate` records of the same message should be logged below the sampled level."""
+        test_logger = Log.register_logger("test_sampling")
+        test_logger.setLevel(logging.DEBUG)
+        Log.set_sampling(test_logger, 3)
+        with self.assertLogs(test_logger.name, level="DEBUG") as log:
+            for i in range(6):
+                test_logger.debug("polling %d", i)
+                test_logger.debug("other %d", i)
+            test_logger.error("always")
+        self.assertEqual(
+            [record.getMessage() for record in log.records],
+            ["polling 0", "other 0", "polling 3", "other 3", "always"],
+        )
+        Log.set_sampling(test_logger, 1)
+        self.assertEqual([], [f for f in test_logger.filters if isinstance(f, SamplingFilter)])
+        with self.assertRaises(ValueError):
+            SamplingFilter(0)
+
+    def test_sampling_by_call_site(self):
+        """Records from one call site should share a count, and only the most recent call sites are kept."""
+        sampling = SamplingFilter(2, max_sites=1)
+
+        def record(lineno, msg):
+            return logging.makeLogRecord({"levelno": logging.DEBUG, "pathname": "job.py", "lineno": lineno, "msg": msg})
+
+        self.assertEqual(
+            [sampling.filter(record(10, "polling {}".format(i))) for i in range(4)],
+            [True, False, True, False],
+        )
+        self.assertTrue(sampling.filter(record(20, "other")))
+        self.assertTrue(sampling.filter(record(10, "polling 4")))
+
     @mock.patch("zowe.core_for_zowe_sdk.logger.subprocess.run")
     @mock.patch("zowe.core_for_zowe_sdk.logger.getpass.getuser", return_value="testuser")
     @mock.patch("zowe.core_for_zowe_sdk.logger.sys.platform", "win32")
@@ -1,6 +1,7 @@
 """Unit tests for the Zowe Python SDK Core package."""
 
 # Including necessary paths
+import threading
 import unittest
 from unittest import mock
 
@@ -32,10 +33,59 @@ class TestRequestHandlerClass(unittest.TestCase):
 
         mock_logger_error.assert_not_called()
         mock_logger_debug.assert_called()
-        self.assertIn("Request method: GET", mock_logger_debug.call_args[0][0])
+        debug_args = mock_logger_debug.call_args[0]
+        self.assertIn("Request method: GET", debug_args[0] % debug_args[1:])
         mock_send_request.assert_called_once()
         self.assertTrue(mock_send_request.call_args[1]["stream"])
 
+    @mock.patch("requests.Session.send")
+    def test_unauthorized_request_is_retried(self, mock_send_request):
+        """A request rejected with 401 should be sent again when on_unauthorized returns True."""
+        mock_send_request.side_effect = [
+            mock.Mock(status_code=401),
+            mock.Mock(headers={"Content-Type": "application/json"}, status_code=200, json=lambda: {}),
+        ]
+        request_handler = RequestHandler(self.session_arguments)
+        request_handler.on_unauthorized = mock.Mock(return_value=True)
+        request_handler.perform_request("PUT", {"url": "https://www.zowe.org", "data": b"content"})
+
+        request_handler.on_unauthorized.assert_called_once()
+        self.assertEqual(mock_send_request.call_count, 2)
+
+    @mock.patch("logging.Logger.error")
+    @mock.patch("requests.Session.send")
+    def test_unauthorized_streamed_body_is_not_retried(self, mock_send_request, mock_logger_error: mock.MagicMock):
+        """A request whose body was consumed by the first attempt should not be sent again."""
+        mock_send_request.return_value = mock.Mock(
+            ok=False,
+            status_code=401,
+            text="",
+            request=mock.Mock(url="https://www.zowe.org", headers={}, body=None),
+        )
+        request_handler = RequestHandler(self.session_arguments)
+        request_handler.on_unauthorized = mock.Mock(return_value=True)
+        with self.assertRaises(exceptions.RequestFailed):
+            request_handler.perform_request("PUT", {"url": "https://www.zowe.org", "data": iter([b"content"])})
+
+        request_handler.on_unauthorized.assert_not_called()
+        mock_send_request.assert_called_once()
+
+    def test_for_current_thread(self):
+        """Each thread should get its own request handler, reused for its later requests."""
+        request_handler = RequestHandler(self.session_arguments)
+        request_handler.on_unauthorized = mock.Mock()
+        handlers = []
+        thread = threading.Thread(target=lambda: handlers.append(request_handler.for_current_thread()))
+        thread.start()
+        thread.join()
+
+        own = request_handler.for_current_thread()
+        self.assertIs(own, request_handler.for_current_thread())
+        self.assertIsNot(own, request_handler)
+        self.assertIsNot(handlers[0], own)
+        self.assertIs(handlers[0].session_arguments, self.session_arguments)
+        self.assertIs(handlers[0].on_unauthorized, request_handler.on_unauthorized)
+
     @mock.patch("logging.Logger.error")
     def test_logger_unmatched_status_code(self, mock_logger_error: mock.MagicMock):
         """Test logger with unexpected status code"""
@@ -95,7 +145,8 @@ class TestRequestHandlerClass(unittest.TestCase):
             },
             stream=True,
         )
-        debug_message = mock_logger_debug.call_args[0][0]
+        debug_args = mock_logger_debug.call_args[0]
+        debug_message = debug_args[0] % debug_args[1:]
         self.assertNotIn("super-secret-password", debug_message)
         self.assertNotIn("token", debug_message)
         self.assertNotIn("test-cookie", debug_message)
@@ -119,3 +170,12 @@ class TestRequestHandlerClass(unittest.TestCase):
         for secret in ("basic", "test-cookie", "super-secret-body-content"):
             self.assertNotIn(secret, error_message)
             self.assertNotIn(secret, exception_message)
+
+    @mock.patch("zowe.core_for_zowe_sdk.request_handler._redact_request_arguments")
+    @mock.patch("requests.Session.send")
+    def test_debug_log_is_lazy_when_disabled(self, mock_send_request, mock_redact: mock.MagicMock):
+        """Request arguments should not be redacted or formatted when DEBUG records are not emitted."""
+        mock_send_request.return_value = mock.Mock(status_code=200)
+        request_handler = RequestHandler(self.session_arguments, logger_name="test_lazy_debug")
+        request_handler.perform_request("GET", {"url": "https://www.zowe.org"}, stream=True)
+        mock_redact.assert_not_called()
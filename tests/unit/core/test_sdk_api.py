@@ -5,7 +5,7 @@ import os
 from unittest import mock
 
 from pyfakefs.fake_filesystem_unittest import TestCase
-from zowe.core_for_zowe_sdk import SdkApi, session_constants
+from zowe.core_for_zowe_sdk import SdkApi, TokenManager, exceptions, session_constants
 
 
 class TestSdkApiClass(TestCase):
@@ -18,6 +18,7 @@ class TestSdkApiClass(TestCase):
         self.bearer_props = {**common_props, "tokenValue": "BearerToken"}
         self.token_props = {**common_props, "tokenType": "MyToken", "tokenValue": "TokenValue"}
         self.cert_props = {**common_props, "rejectUnauthorized": False, "certFile": "cert", "certKeyFile": "certKey"}
+        self.login_props = {**self.basic_props, "autoLogin": True}
         self.default_url = "https://default-api.com/"
 
     def test_object_should_be_instance_of_class(self):
@@ -110,3 +111,117 @@ class TestSdkApiClass(TestCase):
         actual_none = sdk_api._encode_uri_component(None)
         expected_none = None
         self.assertEqual(actual_none, expected_none)
+
+    @mock.patch("requests.Session.send")
+    def test_should_handle_auto_login(self, mock_send_request):
+        """Created objects should log in once and share the token instead of sending basic credentials."""
+        TokenManager.clear()
+        mock_send_request.return_value = mock.Mock(status_code=200, cookies={"LtpaToken2": "LoginToken"})
+
+        sdk_api = SdkApi(self.login_props, self.default_url)
+        other_sdk_api = SdkApi(self.login_props, self.default_url)
+
+        mock_send_request.assert_called_once()
+        login_request = mock_send_request.call_args[0][0]
+        self.assertEqual(login_request.method, "POST")
+        self.assertEqual(login_request.url, "https://mock-url.com:443/zosmf/services/authenticate")
+        self.assertEqual(sdk_api.session.type, session_constants.AUTH_TYPE_TOKEN)
+        self.assertNotIn("auth", sdk_api._request_arguments)
+        self.assertEqual(sdk_api._default_headers["Cookie"], "LtpaToken2=LoginToken")
+        self.assertEqual(other_sdk_api._default_headers["Cookie"], "LtpaToken2=LoginToken")
+        TokenManager.clear()
+
+    @mock.patch("requests.Session.send")
+    def test_auto_login_refreshes_rejected_token(self, mock_send_request):
+        """A request rejected with 401 should log in again and be retried with the new token."""
+        TokenManager.clear()
+        TokenManager.tokens[("https://mock-url.com:443", "Username", "LtpaToken2")] = "StaleToken"
+        mock_send_request.side_effect = [
+            mock.Mock(status_code=401),
+            mock.Mock(status_code=200, cookies={"LtpaToken2": "FreshToken"}),
+            mock.Mock(status_code=200, headers={"Content-Type": "application/json"}, json=lambda: {"ok": True}),
+        ]
+
+        sdk_api = SdkApi(self.login_props, self.default_url)
+        custom_args = sdk_api._create_custom_request_arguments()
+        custom_args["url"] = "https://mock-url.com:443/zosmf/info"
+        response = sdk_api.request_handler.perform_request("GET", custom_args)
+
+        self.assertEqual(response, {"ok": True})
+        self.assertEqual(mock_send_request.call_count, 3)
+        self.assertEqual(mock_send_request.call_args_list[0][0][0].headers["Cookie"], "LtpaToken2=StaleToken")
+        self.assertEqual(mock_send_request.call_args_list[2][0][0].headers["Cookie"], "LtpaToken2=FreshToken")
+        self.assertEqual(sdk_api._default_headers["Cookie"], "LtpaToken2=FreshToken")
+        TokenManager.clear()
+
+    @mock.patch("requests.Session.send")
+    def test_auto_login_refreshes_token_once(self, mock_send_request):
+        """Requests rejected with the same stale token should only log in again once."""
+        TokenManager.clear()
+        TokenManager.tokens[("https://mock-url.com:443", "Username", "LtpaToken2")] = "StaleToken"
+        mock_send_request.side_effect = [
+            mock.Mock(status_code=401),
+            mock.Mock(status_code=200, cookies={"LtpaToken2": "FreshToken"}),
+            mock.Mock(status_code=200, headers={"Content-Type": "application/json"}, json=lambda: {"ok": True}),
+            mock.Mock(status_code=401),
+            mock.Mock(status_code=200, headers={"Content-Type": "application/json"}, json=lambda: {"ok": True}),
+        ]
+
+        sdk_api = SdkApi(self.login_props, self.default_url)
+        requests_arguments = [sdk_api._create_custom_request_arguments() for _ in range(2)]
+        for custom_args in requests_arguments:
+            custom_args["url"] = "https://mock-url.com:443/zosmf/info"
+            self.assertEqual(sdk_api.request_handler.perform_request("GET", custom_args), {"ok": True})
+
+        self.assertEqual(mock_send_request.call_count, 5)
+        self.assertEqual(mock_send_request.call_args_list[3][0][0].headers["Cookie"], "LtpaToken2=StaleToken")
+        self.assertEqual(mock_send_request.call_args_list[4][0][0].headers["Cookie"], "LtpaToken2=FreshToken")
+        TokenManager.clear()
+
+    @mock.patch("requests.Session.send")
+    def test_auto_login_without_token(self, mock_send_request):
+        """Logging in should fail if z/OSMF does not return the requested token type."""
+        TokenManager.clear()
+        mock_send_request.return_value = mock.Mock(status_code=200, cookies={})
+        with self.assertRaises(exceptions.TokenLoginFailed):
+            SdkApi({**self.login_props, "tokenType": "jwtToken"}, self.default_url)
+
+    @mock.patch("requests.Session.send")
+    def test_logout(self, mock_send_request):
+        """Logging out should invalidate the token on z/OSMF and forget it."""
+        TokenManager.clear()
+        mock_send_request.return_value = mock.Mock(status_code=200, cookies={"LtpaToken2": "LoginToken"})
+        sdk_api = SdkApi(self.login_props, self.default_url)
+        mock_send_request.return_value = mock.Mock(status_code=204, headers={}, text="")
+        sdk_api.logout()
+
+        logout_request = mock_send_request.call_args[0][0]
+        self.assertEqual(logout_request.method, "DELETE")
+        self.assertEqual(logout_request.headers["Cookie"], "LtpaToken2=LoginToken")
+        self.assertEqual(TokenManager.tokens, {})
+
+    @mock.patch("requests.Session.send")
+    def test_login_again_after_logout(self, mock_send_request):
+        """A request rejected after logging out should log in again and be sent with the new token."""
+        TokenManager.clear()
+        mock_send_request.return_value = mock.Mock(status_code=200, cookies={"LtpaToken2": "LoginToken"})
+        sdk_api = SdkApi(self.login_props, self.default_url)
+        mock_send_request.return_value = mock.Mock(status_code=204, headers={}, text="")
+        sdk_api.logout()
+        mock_send_request.reset_mock()
+        mock_send_request.return_value = None
+        mock_send_request.side_effect = [
+            mock.Mock(status_code=401),
+            mock.Mock(status_code=200, cookies={"LtpaToken2": "NewToken"}),
+            mock.Mock(status_code=200, headers={"Content-Type": "application/json"}, json=lambda: {"ok": True}),
+        ]
+
+        custom_args = sdk_api._create_custom_request_arguments()
+        custom_args["url"] = "https://mock-url.com:443/zosmf/info"
+        self.assertEqual(sdk_api.request_handler.perform_request("GET", custom_args), {"ok": True})
+
+        self.assertNotIn("Cookie", mock_send_request.call_args_list[0][0][0].headers)
+        self.assertEqual(mock_send_request.call_args_list[1][0][0].method, "POST")
+        self.assertEqual(mock_send_request.call_args_list[2][0][0].headers["Cookie"], "LtpaToken2=NewToken")
+        self.assertEqual(sdk_api._default_headers["Cookie"], "LtpaToken2=NewToken")
+        TokenManager.clear()
@@ -0,0 +1,104 @@
+"""Unit tests for the Zowe Python SDK Core package."""
+
+import base64
+import json
+import os
+import stat
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from zowe.core_for_zowe_sdk import SdkApi, TokenCache, TokenManager
+from zowe.core_for_zowe_sdk.token_cache import token_expiry
+
+
+def make_jwt(expires: float) -> str:
+    """Build an unsigned JSON Web Token with the given expiry."""
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": expires}).encode()).decode().rstrip("=")
+    return f"eyJhbGciOiJub25lIn0.{payload}.signature"
+
+
+class TestTokenCacheClass(unittest.TestCase):
+    """TokenCache class unit tests."""
+
+    def setUp(self):
+        """Setup fixtures for TokenCache class."""
+        self.cache_path = os.path.join(tempfile.mkdtemp(), "tokens", "tokens.json")
+        self.cache = TokenCache(self.cache_path, ttl=60)
+        self.login_props = {
+            "host": "mock-url.com",
+            "port": 443,
+            "user": "Username",
+            "password": "Password",
+            "autoLogin": True,
+        }
+        TokenManager.clear()
+
+    def tearDown(self):
+        TokenManager.clear()
+        TokenManager.set_cache(None)
+
+    def test_set_get_delete(self):
+        """Tokens should be stored per host, user and token type."""
+        with self.cache.lock():
+            self.cache.set("https://host:443", "user", "LtpaToken2", "token1")
+            self.cache.set("https://host:443", "other", "LtpaToken2", "token2")
+        self.assertEqual(self.cache.get("https://host:443", "user", "LtpaToken2"), "token1")
+        self.assertEqual(self.cache.get("https://host:443", "other", "LtpaToken2"), "token2")
+        self.assertIsNone(self.cache.get("https://host:443", "user", "jwtToken"))
+
+        with self.cache.lock():
+            self.cache.delete("https://host:443", "user", "LtpaToken2")
+        self.assertIsNone(self.cache.get("https://host:443", "user", "LtpaToken2"))
+
+    def test_expired_tokens_are_ignored(self):
+        """Tokens past their expiry should not be returned."""
+        expired_cache = TokenCache(self.cache_path, ttl=-1)
+        with expired_cache.lock():
+            expired_cache.set("https://host:443", "user", "LtpaToken2", "token")
+        self.assertIsNone(expired_cache.get("https://host:443", "user", "LtpaToken2"))
+
+    def test_jwt_expiry(self):
+        """The expiry of JSON Web Tokens should come from their "exp" claim when it is sooner than the ttl."""
+        expires = time.time() + 10
+        self.assertEqual(token_expiry(make_jwt(expires), 60), expires)
+        self.assertAlmostEqual(token_expiry("opaque-ltpa-token", 60), time.time() + 60, delta=5)
+        self.assertAlmostEqual(token_expiry("not.a.jwt", 60), time.time() + 60, delta=5)
+
+    @unittest.skipIf(sys.platform == "win32", "POSIX permission bits do not reflect NTFS ACLs")
+    def test_cache_file_is_owner_only(self):
+        """The cache file and its directory should only be accessible by the owner."""
+        with self.cache.lock():
+            self.cache.set("https://host:443", "user", "LtpaToken2", "token")
+        self.assertEqual(stat.S_IMODE(os.stat(self.cache_path).st_mode), 0o600)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.dirname(self.cache_path)).st_mode), 0o700)
+
+    @mock.patch("requests.Session.send")
+    def test_token_manager_reuses_cached_token(self, mock_send_request):
+        """A new process (empty in-memory tokens) should pick up the cached token instead of logging in."""
+        TokenManager.set_cache(self.cache)
+        mock_send_request.return_value = mock.Mock(status_code=200, cookies={"LtpaToken2": "LoginToken"})
+        SdkApi(self.login_props, "/zosmf/")
+        mock_send_request.assert_called_once()
+
+        TokenManager.clear()
+        sdk_api = SdkApi(self.login_props, "/zosmf/")
+        mock_send_request.assert_called_once()
+        self.assertEqual(sdk_api._default_headers["Cookie"], "LtpaToken2=LoginToken")
+
+    @mock.patch("requests.Session.send")
+    def test_token_manager_refreshes_cached_token(self, mock_send_request):
+        """A rejected cached token should be replaced in the cache after logging in again."""
+        TokenManager.set_cache(self.cache)
+        with self.cache.lock():
+            self.cache.set("https://mock-url.com:443", "Username", "LtpaToken2", "StaleToken")
+        mock_send_request.return_value = mock.Mock(status_code=200, cookies={"LtpaToken2": "FreshToken"})
+
+        token_value = TokenManager.refresh_token(
+            "https://mock-url.com:443", "Username", "Password", "LtpaToken2", "StaleToken", {"verify": True}
+        )
+
+        self.assertEqual(token_value, "FreshToken")
+        self.assertEqual(self.cache.get("https://mock-url.com:443", "Username", "LtpaToken2"), "FreshToken")
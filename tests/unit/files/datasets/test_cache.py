@@ -0,0 +1,156 @@
+"""Unit tests for the Zowe Python SDK z/OS Files package."""
+
+import os
+import shutil
+import tempfile
+import time
+from unittest import TestCase, mock
+
+import requests
+from zowe.zos_files_for_zowe_sdk import DatasetCache, Files
+from zowe.zos_files_for_zowe_sdk.constants import ContentType
+from zowe.zos_files_for_zowe_sdk.exceptions import DatasetNotCacheable
+
+
+def stream_response(chunks, status_code=200, etag=None):
+    """Build a streamed response yielding the given chunks."""
+    response = mock.Mock(spec=requests.Response, headers={"ETag": etag} if etag else {}, status_code=status_code)
+    response.ok = True
+    response.iter_content = mock.Mock(return_value=chunks)
+    return response
+
+
+class TestDatasetCache(TestCase):
+    """DatasetCache class unit tests."""
+
+    def setUp(self):
+        """Create a temporary cache directory."""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_store_and_open(self):
+        """Stored data sets should be mapped read-only into memory."""
+        cache = DatasetCache(self.directory)
+        entry = cache.store("hlq.ds", "binary", '"etag1"', [b"abc", b"def"])
+        self.assertEqual((entry.dataset, entry.etag, entry.size), ("HLQ.DS", '"etag1"', 6))
+        data = cache.open("HLQ.DS")
+        self.assertEqual(data[:], b"abcdef")
+        with self.assertRaises(TypeError):
+            data[0] = 0
+        data.close()
+        self.assertIsNone(cache.open("HLQ.DS", "text"))
+
+    def test_store_replaces_previous_version(self):
+        """A new version of a data set should replace the previous one."""
+        cache = DatasetCache(self.directory)
+        first = cache.store("HLQ.DS", "binary", '"etag1"', [b"old"])
+        second = cache.store("HLQ.DS", "binary", '"etag2"', [b"new"])
+        self.assertEqual(cache.lookup("HLQ.DS", "binary").etag, '"etag2"')
+        self.assertFalse(os.path.exists(cache.path(first)))
+        self.assertTrue(os.path.exists(cache.path(second)))
+
+    def entry_files(self, entry):
+        """Return the paths of the data and index files of a cached copy."""
+        key = entry.data.split(".", 1)[0]
+        return [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.startswith(key)]
+
+    def test_evict_least_recently_used(self):
+        """The least recently used data sets should be evicted with their index when the cache is full."""
+        probe = DatasetCache(self.directory).store("HLQ.A", "binary", "a", [b"1234"])
+        entry_size = sum(os.path.getsize(path) for path in self.entry_files(probe))
+        cache = DatasetCache(self.directory, max_size=2 * entry_size + 1)
+        first = cache.store("HLQ.A", "binary", "a", [b"1234"])
+        second = cache.store("HLQ.B", "binary", "b", [b"1234"])
+        past = time.time() - 60
+        for path in self.entry_files(second):
+            os.utime(path, (past, past))
+        for path in self.entry_files(first):
+            os.utime(path, (past + 1, past + 1))
+        cache.store("HLQ.C", "binary", "c", [b"1234"])
+        self.assertIsNotNone(cache.lookup("HLQ.A", "binary"))
+        self.assertIsNone(cache.lookup("HLQ.B", "binary"))
+        self.assertEqual(self.entry_files(second), [])
+        self.assertIsNotNone(cache.lookup("HLQ.C", "binary"))
+
+    def test_invalid_max_size(self):
+        """A cache that cannot hold any data should be rejected."""
+        with self.assertRaises(ValueError):
+            DatasetCache(self.directory, max_size=0)
+
+
+class TestCachedDownload(TestCase):
+    """Datasets cached download unit tests."""
+
+    def setUp(self):
+        """Create a temporary cache directory."""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.cache = DatasetCache(os.path.join(self.directory, "cache"))
+        self.files = Files({"host": "mock-url.com", "port": 443})
+
+    @mock.patch("requests.Session.send")
+    def test_download_populates_cache(self, mock_send_request):
+        """A download should be stored in the cache and copied from it when z/OSMF reports no change."""
+        local_file = os.path.join(self.directory, "ds.bin")
+        mock_send_request.side_effect = [
+            stream_response([b"\x01\x02", b"\x03"], etag='"v1"'),
+            stream_response([], status_code=304),
+        ]
+        self.files.ds.perform_download("HLQ.DS", local_file, content_type=ContentType.BINARY, cache=self.cache)
+        os.remove(local_file)
+        self.files.ds.perform_download("HLQ.DS", local_file, content_type=ContentType.BINARY, cache=self.cache)
+
+        with open(local_file, "rb") as f:
+            self.assertEqual(f.read(), b"\x01\x02\x03")
+        first, second = [call[0][0] for call in mock_send_request.call_args_list]
+        self.assertEqual(first.headers["X-IBM-Return-Etag"], "true")
+        self.assertNotIn("If-None-Match", first.headers)
+        self.assertEqual(second.headers["If-None-Match"], '"v1"')
+
+    @mock.patch("requests.Session.send")
+    def test_open_cached_downloads_changed_data_set(self, mock_send_request):
+        """A data set that changed should be downloaded again and mapped into memory."""
+        self.cache.store("HLQ.DS", "binary", '"v1"', [b"old"])
+        mock_send_request.return_value = stream_response([b"new"], etag='"v2"')
+
+        data = self.files.ds.open_cached("HLQ.DS", self.cache)
+        self.assertEqual(data[:], b"new")
+        data.close()
+        self.assertEqual(self.cache.lookup("HLQ.DS", "binary").etag, '"v2"')
+
+    @mock.patch("requests.Session.send")
+    def test_open_cached_without_etag(self, mock_send_request):
+        """A data set returned without an ETag cannot be cached."""
+        mock_send_request.return_value = stream_response([b"data"])
+        with self.assertRaises(DatasetNotCacheable):
+            self.files.ds.open_cached("HLQ.DS", self.cache)
+
+    @mock.patch("requests.Session.send")
+    def test_download_without_etag_is_not_requested_twice(self, mock_send_request):
+        """A data set returned without an ETag should be saved from the first response."""
+        local_file = os.path.join(self.directory, "ds.bin")
+        mock_send_request.return_value = stream_response([b"da", b"ta"])
+
+        self.files.ds.perform_download("HLQ.DS", local_file, content_type=ContentType.BINARY, cache=self.cache)
+        mock_send_request.assert_called_once()
+        with open(local_file, "rb") as f:
+            self.assertEqual(f.read(), b"data")
+        self.assertIsNone(self.cache.lookup("HLQ.DS", "binary"))
+
+    @mock.patch("requests.Session.send")
+    def test_download_falls_back_when_entry_is_evicted(self, mock_send_request):
+        """A cached copy evicted before it is copied should be downloaded directly."""
+        local_file = os.path.join(self.directory, "ds.bin")
+        self.cache.store("HLQ.DS", "binary", '"v1"', [b"old"])
+        mock_send_request.side_effect = [stream_response([], status_code=304), stream_response([b"data"])]
+
+        with mock.patch("shutil.copyfile", side_effect=FileNotFoundError):
+            self.files.ds.perform_download("HLQ.DS", local_file, content_type=ContentType.BINARY, cache=self.cache)
+        self.assertEqual(mock_send_request.call_count, 2)
+        with open(local_file, "rb") as f:
+            self.assertEqual(f.read(), b"data")
+
+    def test_cache_cannot_resume(self):
+        """Cached downloads cannot be resumed."""
+        with self.assertRaises(ValueError):
+            self.files.ds.perform_download("HLQ.DS", "ds.txt", resume=True, cache=self.cache)
@@ -0,0 +1,139 @@
+"""Unit tests for the Zowe Python SDK z/OS Files package."""
+
+import os
+import shutil
+import tempfile
+from datetime import date
+from unittest import TestCase, mock
+from urllib.parse import parse_qs, urlparse
+
+from zowe.zos_files_for_zowe_sdk import CatalogIndex
+from zowe.zos_files_for_zowe_sdk.response import DatasetListResponse, MemberListResponse
+
+
+def dataset(dsname, vol="VOL001", sizex="10", spacu="TRACKS", migr="NO", cdate="2024/01/15", rdate="2024/06/01"):
+    """Build the attributes of a data set as listed by z/OSMF."""
+    return {
+        "dsname": dsname,
+        "vol": vol,
+        "dsorg": "PS",
+        "sizex": sizex,
+        "spacu": spacu,
+        "blksz": "27920",
+        "migr": migr,
+        "cdate": cdate,
+        "rdate": rdate,
+        "edate": "***None***",
+    }
+
+
+def json_response(body):
+    """Build a JSON response."""
+    response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=200)
+    response.json.return_value = body
+    return response
+
+
+class TestCatalogIndex(TestCase):
+    """CatalogIndex class unit tests."""
+
+    def setUp(self):
+        """Fill an index in memory."""
+        self.index = CatalogIndex(":memory:")
+        self.addCleanup(self.index.close)
+        self.index.update_datasets(
+            "PROD.**",
+            DatasetListResponse(
+                {
+                    "items": [
+                        dataset("PROD.APP.LOAD", sizex="100", spacu="CYLINDERS"),
+                        dataset("PROD.APP.DATA", cdate="2023/12/31"),
+                        dataset("PROD.OLD.DATA", vol="MIGRAT", sizex="?", migr="YES", rdate="2022/02/02"),
+                    ]
+                },
+                True,
+            ),
+        )
+
+    def names(self, **kwargs):
+        """Return the names of the data sets matching a query."""
+        return [item.dsname for item in self.index.query(**kwargs)]
+
+    def test_query_pattern(self):
+        """Patterns should match within a qualifier with * and across qualifiers with **."""
+        self.assertEqual(self.names(pattern="PROD.APP.*"), ["PROD.APP.DATA", "PROD.APP.LOAD"])
+        self.assertEqual(self.names(pattern="PROD.*.DATA"), ["PROD.APP.DATA", "PROD.OLD.DATA"])
+        self.assertEqual(self.names(pattern="**.LOAD"), ["PROD.APP.LOAD"])
+        self.assertEqual(self.names(pattern="PROD.APP.LOA%"), ["PROD.APP.LOAD"])
+
+    def test_query_attributes(self):
+        """Queries should filter by size, migration status and dates."""
+        self.assertEqual(self.names(min_size=50 * 1024 * 1024), ["PROD.APP.LOAD"])
+        self.assertEqual(self.names(migrated=True), ["PROD.OLD.DATA"])
+        self.assertEqual(self.names(volume="vol001", created_before=date(2023, 12, 31)), ["PROD.APP.DATA"])
+        self.assertEqual(self.names(referenced_after="2024-01-01", max_size=10 * 56664), ["PROD.APP.DATA"])
+        self.assertEqual(self.index.query(pattern="PROD.APP.DATA")[0].vol, "VOL001")
+
+    def test_refresh_replaces_pattern(self):
+        """A new listing of a pattern should drop the data sets that were deleted."""
+        self.index.update_datasets("PROD.**", DatasetListResponse({"items": [dataset("PROD.APP.LOAD")]}, True))
+        self.assertEqual(self.names(), ["PROD.APP.LOAD"])
+        self.assertIsNotNone(self.index.refreshed("prod.**"))
+
+    @mock.patch("time.time", side_effect=[1000.0, 2000.0, 3000.0])
+    def test_overlapping_patterns(self, mock_time):
+        """A data set listed by several patterns should be returned once, as listed last, until it is deleted."""
+        self.index.update_datasets(
+            "PROD.APP.*", DatasetListResponse({"items": [dataset("PROD.APP.LOAD", vol="VOL002")]}, True)
+        )
+        self.index.update_datasets(
+            "PROD.**",
+            DatasetListResponse({"items": [dataset("PROD.APP.LOAD", vol="VOL003"), dataset("PROD.APP.DATA")]}, True),
+        )
+        self.assertEqual(self.names(), ["PROD.APP.DATA", "PROD.APP.LOAD"])
+        self.assertEqual(self.index.query(pattern="PROD.APP.LOAD")[0].vol, "VOL003")
+
+        self.index.update_datasets("PROD.APP.*", DatasetListResponse({"items": []}, True))
+        self.assertEqual(self.names(), [])
+
+    def test_members(self):
+        """Members should be stored by data set and filtered by pattern."""
+        self.index.update_members(
+            "prod.app.load",
+            MemberListResponse({"items": [{"member": "PGMA", "vers": 1}, {"member": "PGMB", "vers": 2}]}, True),
+        )
+        members = self.index.members("PROD.APP.LOAD", pattern="*B")
+        self.assertEqual([(member.member, member.vers) for member in members], [("PGMB", 2)])
+
+    @mock.patch("requests.Session.send")
+    def test_refresh_lists_stale_patterns(self, mock_send_request):
+        """Refresh should list each stale pattern with attributes and no item limit."""
+        listings = {"TEST.**": [dataset("TEST.A")], "DEV.**": [dataset("DEV.B")]}
+
+        def send(request, **kwargs):
+            self.assertEqual(request.headers["X-IBM-Attributes"], "base")
+            self.assertEqual(request.headers["X-IBM-Max-Items"], "0")
+            pattern = parse_qs(urlparse(request.url).query)["dslevel"][0]
+            return json_response({"items": listings[pattern]})
+
+        mock_send_request.side_effect = send
+        connection = {"host": "mock-url.com", "port": 443, "user": "user", "password": "password"}
+
+        refreshed = self.index.refresh(connection, ["test.**", "dev.**", "prod.**"], max_age=3600)
+
+        self.assertEqual(refreshed, ["TEST.**", "DEV.**"])
+        self.assertEqual(self.names(pattern="TEST.**") + self.names(pattern="DEV.**"), ["TEST.A", "DEV.B"])
+
+
+class TestCatalogIndexFile(TestCase):
+    """CatalogIndex persistence unit tests."""
+
+    def test_persistent_index(self):
+        """The index should be kept in its database file."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "catalog.db")
+        with CatalogIndex(path) as index:
+            index.update_datasets("A.**", DatasetListResponse({"items": [{"dsname": "A.B"}]}, False))
+        with CatalogIndex(path) as index:
+            self.assertEqual([item.dsname for item in index.query()], ["A.B"])
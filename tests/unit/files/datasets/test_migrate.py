@@ -1,6 +1,9 @@
+import json
+import threading
 from unittest import TestCase, mock
+from urllib.parse import parse_qs, unquote, urlparse
 
-from zowe.zos_files_for_zowe_sdk import Files
+from zowe.zos_files_for_zowe_sdk import Files, HsmStatus
 
 
 class TestMigrateClass(TestCase):
@@ -124,3 +127,135 @@ class TestMigrateClass(TestCase):
             files_test_profile.ds.request_handler.perform_request.assert_called_once_with(
                 "PUT", custom_args, expected_code=[200]
             )
+
+
+class TestBulkHsm(TestCase):
+    """Bulk HSM operations unit tests."""
+
+    def setUp(self):
+        """Setup fixtures for bulk HSM operations."""
+        self.files = Files({"host": "mock-url.com", "user": "Username", "password": "Password", "port": 443})
+        self.migrated = {"A.DS": True, "B.DS": True, "C.DS": True}
+        self.polls = 0
+
+    def send(self, request, **kwargs):
+        """Simulate HSM: recalls are queued and complete after the first poll, C.DS cannot be recalled."""
+        response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=200)
+        if request.method == "PUT":
+            name = unquote(request.url.rsplit("/", 1)[1])
+            self.assertEqual(json.loads(request.body), {"request": "hrecall", "wait": False})
+            if name == "C.DS":
+                response.status_code = 500
+                response.ok = False
+                response.text = "ARC1102I"
+                response.request = mock.Mock(url=request.url, headers={}, body=None)
+            response.json.return_value = {}
+            return response
+        name = parse_qs(urlparse(request.url).query)["dslevel"][0]
+        with self.lock:
+            self.polls += 1
+            migrated = self.migrated[name]
+            self.migrated[name] = False
+        response.json.return_value = {
+            "items": [{"dsname": name, "migr": "YES" if migrated else "NO", "vol": "MIGRAT" if migrated else "VOL001"}]
+        }
+        return response
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.Session.send")
+    def test_recall_migrated_many(self, mock_send_request, mock_sleep):
+        """Test recalls are all queued before their completion is polled"""
+        self.lock = threading.Lock()
+        mock_send_request.side_effect = self.send
+
+        results = self.files.ds.recall_migrated_many(["A.DS", "B.DS", "C.DS"], max_workers=2, poll_interval=1)
+
+        self.assertEqual(results["A.DS"].status, HsmStatus.COMPLETED)
+        self.assertEqual(results["B.DS"].status, HsmStatus.COMPLETED)
+        self.assertEqual(results["C.DS"].status, HsmStatus.FAILED)
+        self.assertIn("500", results["C.DS"].error)
+        self.assertEqual(self.polls, 4)
+        mock_sleep.assert_called_once_with(1)
+
+    @mock.patch("requests.Session.send")
+    def test_recall_migrated_many_without_wait(self, mock_send_request):
+        """Test recalls are only queued when not waiting"""
+        self.lock = threading.Lock()
+        mock_send_request.side_effect = self.send
+
+        results = self.files.ds.recall_migrated_many(["A.DS", "B.DS"], wait=False)
+
+        self.assertEqual({result.status for result in results.values()}, {HsmStatus.QUEUED})
+        self.assertEqual(self.polls, 0)
+
+    @mock.patch("requests.Session.send")
+    def test_delete_migrated_many_timeout(self, mock_send_request):
+        """Test data sets still cataloged when the timeout expires are reported as timed out"""
+        mock_response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=200)
+        mock_response.json.return_value = {"items": [{"dsname": "A.DS", "migr": "YES"}]}
+        mock_send_request.return_value = mock_response
+
+        results = self.files.ds.delete_migrated_many(["A.DS"], purge=True, poll_interval=10, timeout=5)
+
+        self.assertEqual(results["A.DS"].status, HsmStatus.TIMED_OUT)
+        self.assertEqual(json.loads(mock_send_request.call_args_list[0][0][0].body)["purge"], True)
+
+
+class TestRecallPrefetch(TestCase):
+    """Recall-before-read prefetch unit tests."""
+
+    def setUp(self):
+        """Setup fixtures for the prefetch."""
+        self.files = Files({"host": "mock-url.com", "user": "Username", "password": "Password", "port": 443})
+        self.migrated = {"A.DS": False, "B.DS": True, "C.DS": True}
+        self.events = []
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        """Simulate HSM: queued recalls complete immediately, and reading a migrated data set fails."""
+        response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=200)
+        path = unquote(urlparse(request.url).path.rsplit("/", 1)[1])
+        with self.lock:
+            if request.method == "PUT":
+                self.events.append(("recall", path))
+                self.migrated[path] = False
+                response.json.return_value = {}
+            elif path == "ds":
+                name = parse_qs(urlparse(request.url).query)["dslevel"][0]
+                migrated = self.migrated[name]
+                response.json.return_value = {"items": [{"dsname": name, "migr": "YES" if migrated else "NO"}]}
+            else:
+                self.assertFalse(self.migrated[path.split("(")[0]])
+                self.events.append(("read", path))
+                response.headers = {"Content-Type": "text/plain"}
+                response.text = "content of " + path
+        return response
+
+    @mock.patch("requests.Session.send")
+    def test_retrieve_many(self, mock_send_request):
+        """Test migrated data sets are recalled once before they are read"""
+        mock_send_request.side_effect = self.send
+
+        results = list(
+            self.files.ds.retrieve_many(["A.DS", "B.DS", "C.DS(MEM1)", "C.DS(MEM2)"], max_workers=1, poll_interval=0)
+        )
+
+        contents = {result.dataset_name: result.content for result in results}
+        self.assertEqual(results[0].dataset_name, "A.DS")
+        self.assertEqual({result.status for result in results}, {HsmStatus.COMPLETED})
+        self.assertEqual(contents["C.DS(MEM2)"], "content of C.DS(MEM2)")
+        self.assertEqual([result.recalled for result in results], [False, True, True, True])
+        self.assertEqual(sorted(name for event, name in self.events if event == "recall"), ["B.DS", "C.DS"])
+        self.assertEqual(next(name for event, name in self.events if event == "read"), "A.DS")
+
+    @mock.patch("requests.Session.send")
+    def test_retrieve_many_timeout(self, mock_send_request):
+        """Test data sets still migrated when the timeout expires are reported as timed out"""
+        mock_response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=200)
+        mock_response.json.return_value = {"items": [{"dsname": "A.DS", "migr": "YES"}]}
+        mock_send_request.return_value = mock_response
+
+        results = list(self.files.ds.retrieve_many(["A.DS"], poll_interval=0, timeout=0))
+
+        self.assertEqual(results[0].status, HsmStatus.TIMED_OUT)
+        self.assertTrue(results[0].recalled)
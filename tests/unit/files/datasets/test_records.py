@@ -0,0 +1,75 @@
+"""Unit tests for the Zowe Python SDK z/OS Files package."""
+
+from unittest import TestCase, mock
+
+import requests
+from zowe.zos_files_for_zowe_sdk import Files, RecordReader
+
+
+def prefixed(*records):
+    """Prefix each record with its 4 byte big endian length."""
+    return b"".join(len(record).to_bytes(4, "big") + record for record in records)
+
+
+def chunked(data, size):
+    """Split data into chunks of the given size."""
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestRecordReader(TestCase):
+    """RecordReader class unit tests."""
+
+    def setUp(self):
+        """Setup fixtures for RecordReader class."""
+        self.records = [b"A" * 10, b"", b"B" * 3, b"C" * 50, b"D"]
+        self.data = prefixed(*self.records)
+
+    def test_records_across_chunks(self):
+        """Records split across chunks should be reassembled."""
+        for chunk_size in [1, 3, 7, len(self.data)]:
+            records = [bytes(record) for record in RecordReader(chunked(self.data, chunk_size), buffer_size=16)]
+            self.assertEqual(records, self.records, chunk_size)
+
+    def test_records_are_views_of_the_buffer(self):
+        """Records should be memoryview slices, not copies."""
+        records = list(RecordReader([self.data]))
+        self.assertTrue(all(isinstance(record, memoryview) for record in records))
+        self.assertIs(records[0].obj, records[-1].obj)
+
+    def test_batches_stay_valid_until_next_batch(self):
+        """Each batch should hold all of its records even when the buffer is reused."""
+        reader = RecordReader(chunked(self.data, 5), buffer_size=16)
+        batches = [[bytes(record) for record in batch] for batch in reader.batches(2)]
+        self.assertEqual(batches, [self.records[0:2], self.records[2:4], self.records[4:]])
+
+    def test_batches_invalid_size(self):
+        """Batches of less than one record should be rejected."""
+        with self.assertRaises(ValueError):
+            next(RecordReader([self.data]).batches(0))
+
+    def test_truncated_stream(self):
+        """A stream ending inside a record should be reported."""
+        with self.assertRaises(ValueError):
+            list(RecordReader([self.data[:-1]]))
+
+    @mock.patch("requests.Session.send")
+    def test_iter_records(self, mock_send_request):
+        """Data set records should be requested with the record data type and closed when done."""
+        mock_response = mock.Mock(spec=requests.Response, headers={}, status_code=200)
+        mock_response.iter_content = mock.Mock(return_value=chunked(self.data, 8))
+        mock_send_request.return_value = mock_response
+
+        records = [bytes(record) for record in Files({"host": "mock-url.com", "port": 443}).ds.iter_records("HLQ.DS")]
+        self.assertEqual(records, self.records)
+        self.assertEqual(mock_send_request.call_args[0][0].headers["X-IBM-Data-Type"], "record")
+        mock_response.close.assert_called_once()
+
+    @mock.patch("requests.Session.send")
+    def test_iter_record_batches(self, mock_send_request):
+        """Data set records should be returned in batches."""
+        mock_response = mock.Mock(spec=requests.Response, headers={}, status_code=200)
+        mock_response.iter_content = mock.Mock(return_value=[self.data])
+        mock_send_request.return_value = mock_response
+
+        batches = list(Files({"host": "mock-url.com", "port": 443}).ds.iter_record_batches("HLQ.DS", batch_size=3))
+        self.assertEqual([len(batch) for batch in batches], [3, 2])
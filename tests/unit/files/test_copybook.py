@@ -0,0 +1,134 @@
+"""Unit tests for the Zowe Python SDK z/OS Files package."""
+
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+from zowe.zos_files_for_zowe_sdk import Copybook, CopybookDecoder, EbcdicCodec
+
+COPYBOOK = """
+      * Customer record
+       01  CUSTOMER-REC.
+           05  CUST-ID        PIC 9(6).
+           05  CUST-NAME      PIC X(10).
+           05  BALANCE        PIC S9(5)V99 COMP-3.
+           05  VISITS         PIC S9(4) COMP.
+           05  DELTA          PIC S9(3).
+           05  FILLER         PIC X(2).
+           05  ITEMS OCCURS 2 TIMES.
+               10  QTY        PIC 9(2).
+                   88  EMPTY  VALUE 0.
+           05  ITEM-TEXT REDEFINES ITEMS PIC X(4).
+           05  RATE           COMP-2.
+"""
+
+
+def customer(cust_id, name, balance, visits, delta, quantities, rate):
+    """Encode a customer record as it is stored on z/OS."""
+    codec = EbcdicCodec("IBM-037")
+    digits = f"{abs(balance):07d}"
+    nibbles = [int(digit) for digit in digits] + [0xD if balance < 0 else 0xC]
+    packed = bytes(nibbles[i] << 4 | nibbles[i + 1] for i in range(0, len(nibbles), 2))
+    zoned = bytearray(codec.encode(f"{abs(delta):03d}"))
+    zoned[-1] = (0xD0 if delta < 0 else 0xC0) | (zoned[-1] & 0x0F)
+    return (
+        codec.encode(f"{cust_id:06d}")
+        + codec.encode(name.ljust(10))
+        + packed
+        + visits.to_bytes(2, "big", signed=True)
+        + bytes(zoned)
+        + codec.encode("  ")
+        + codec.encode("".join(f"{quantity:02d}" for quantity in quantities))
+        + rate
+    )
+
+
+# 1.5 and -0.25 as IBM hexadecimal floating point numbers
+ONE_AND_A_HALF = bytes.fromhex("4118000000000000")
+MINUS_A_QUARTER = bytes.fromhex("C040000000000000")
+
+
+class TestCopybook(TestCase):
+    """Copybook class unit tests."""
+
+    def test_parse_layout(self):
+        """Fields should be placed at their offsets, with OCCURS numbered and REDEFINES overlaid."""
+        copybook = Copybook.parse(COPYBOOK)
+        layout = {field.name: (field.offset, field.length, field.kind) for field in copybook.fields}
+        self.assertEqual(
+            layout,
+            {
+                "CUST-ID": (0, 6, "zoned"),
+                "CUST-NAME": (6, 10, "text"),
+                "BALANCE": (16, 4, "packed"),
+                "VISITS": (20, 2, "binary"),
+                "DELTA": (22, 3, "zoned"),
+                "QTY_1": (27, 2, "zoned"),
+                "QTY_2": (29, 2, "zoned"),
+                "ITEM-TEXT": (27, 4, "text"),
+                "RATE": (31, 8, "float"),
+            },
+        )
+        self.assertEqual(copybook.record_length, 39)
+
+    def test_parse_free_format_and_usage_inheritance(self):
+        """Free format copybooks should parse and elementary items should inherit the usage of their group."""
+        copybook = Copybook.parse("01 REC. 05 TOTALS COMP-3. 10 A PIC S9(3). 10 B PIC S9(4)V9.")
+        self.assertEqual([(field.offset, field.length) for field in copybook.fields], [(0, 2), (2, 3)])
+        self.assertEqual(copybook.fields[1].scale, 1)
+
+    def test_parse_unsupported_clause(self):
+        """Variable length tables should be rejected."""
+        with self.assertRaises(ValueError):
+            Copybook.parse("01 REC. 05 N PIC 9. 05 T OCCURS 1 TO 5 DEPENDING ON N PIC X.")
+
+
+class TestCopybookDecoder(TestCase):
+    """CopybookDecoder class unit tests."""
+
+    def setUp(self):
+        """Build two customer records."""
+        self.decoder = CopybookDecoder(Copybook.parse(COPYBOOK))
+        self.data = customer(42, "ALICE", 1234567, 7, -123, [1, 2], ONE_AND_A_HALF) + customer(
+            7, "BOB", -50, -2, 9, [10, 20], MINUS_A_QUARTER
+        )
+
+    def test_decode(self):
+        """Every field type should be decoded for all records."""
+        columns = self.decoder.decode(self.data)
+        self.assertEqual(columns["CUST-ID"].tolist(), [42, 7])
+        self.assertEqual(columns["CUST-NAME"].tolist(), ["ALICE", "BOB"])
+        np.testing.assert_allclose(columns["BALANCE"], [12345.67, -0.5])
+        self.assertEqual(columns["VISITS"].tolist(), [7, -2])
+        self.assertEqual(columns["DELTA"].tolist(), [-123, 9])
+        self.assertEqual(columns["QTY_2"].tolist(), [2, 20])
+        self.assertEqual(columns["ITEM-TEXT"].tolist(), ["0102", "1020"])
+        self.assertEqual(columns["RATE"].tolist(), [1.5, -0.25])
+
+    def test_to_structured(self):
+        """Records should be decoded to a structured array."""
+        records = self.decoder.to_structured(self.data)
+        self.assertEqual(records["CUST-ID"].tolist(), [42, 7])
+        self.assertEqual(records[1]["CUST-NAME"], "BOB")
+
+    def test_decode_partial_record(self):
+        """Data that is not a whole number of records should be rejected."""
+        with self.assertRaises(ValueError):
+            self.decoder.decode(self.data[:-1])
+
+    def test_iter_decode(self):
+        """Records split across chunks should be decoded in batches."""
+        chunks = [self.data[i : i + 5] for i in range(0, len(self.data), 5)]
+        batches = list(self.decoder.iter_decode(chunks, records_per_batch=1))
+        self.assertEqual([batch["CUST-ID"].tolist() for batch in batches], [[42], [7]])
+
+    def test_decode_file(self):
+        """Downloaded binary files should be decoded through a memory map."""
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, "wb") as file:
+            file.write(self.data)
+        try:
+            self.assertEqual(self.decoder.decode_file(path)["VISITS"].tolist(), [7, -2])
+        finally:
+            os.remove(path)
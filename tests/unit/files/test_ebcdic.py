@@ -0,0 +1,159 @@
+"""Unit tests for the Zowe Python SDK z/OS Files package."""
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase, mock
+
+import requests
+from zowe.zos_files_for_zowe_sdk import EbcdicCodec, Files
+from zowe.zos_files_for_zowe_sdk.constants import ContentType
+
+
+def stream_response(chunks, status_code=200):
+    """Build a streamed response yielding the given chunks."""
+    response = mock.Mock(spec=requests.Response, headers={}, status_code=status_code)
+    response.iter_content = mock.Mock(return_value=chunks)
+    return response
+
+
+def records(codec, *lines):
+    """Encode lines as records prefixed with their length."""
+    data = b""
+    for line in lines:
+        record = codec.encode(line)
+        data += len(record).to_bytes(4, "big") + record
+    return data
+
+
+class TestEbcdicCodec(TestCase):
+    """EbcdicCodec class unit tests."""
+
+    def test_ibm1047_differs_from_ibm037(self):
+        """Brackets, caret and not sign should use their IBM-1047 code points."""
+        text = "[a]^¬"
+        self.assertEqual(EbcdicCodec("IBM-1047").encode(text), b"\xad\x81\xbd\x5f\xb0")
+        self.assertEqual(EbcdicCodec("IBM-037").encode(text), b"\xba\x81\xbb\xb0\x5f")
+        self.assertEqual(EbcdicCodec("IBM-1047").decode(b"\xad\x81\xbd\x5f\xb0"), text)
+
+    def test_new_line_mapping(self):
+        """The EBCDIC new line character should convert to and from a line feed."""
+        codec = EbcdicCodec("IBM-1047")
+        self.assertEqual(codec.encode("A\nB"), b"\xc1\x15\xc2")
+        self.assertEqual(codec.decode(b"\xc1\x15\xc2"), "A\nB")
+
+    def test_round_trip_all_bytes(self):
+        """Every byte should round trip through every supported code page."""
+        data = bytes(range(256))
+        for encoding in ["IBM-037", "IBM-273", "IBM-500", "IBM-1026", "IBM-1047", "IBM-1140"]:
+            codec = EbcdicCodec(encoding)
+            self.assertEqual(codec.encode(codec.decode(data)), data, encoding)
+
+    def test_non_latin1_code_page(self):
+        """Code pages with characters outside Latin-1 should convert them."""
+        codec = EbcdicCodec("IBM-1140")
+        self.assertEqual(codec.decode(b"\x9f"), "€")
+        self.assertEqual(codec.encode("€"), b"\x9f")
+
+    def test_encoding_names(self):
+        """Common spellings of code page names should be accepted and unsupported ones rejected."""
+        self.assertEqual(EbcdicCodec("ibm037").encoding, "IBM-037")
+        self.assertEqual(EbcdicCodec("cp1047").encoding, "IBM-1047")
+        self.assertIs(EbcdicCodec.for_encoding("IBM-1047"), EbcdicCodec.for_encoding("IBM-1047"))
+        self.assertFalse(EbcdicCodec.is_supported("UTF-8"))
+        with self.assertRaises(ValueError):
+            EbcdicCodec("ISO8859-1")
+
+    def test_unencodable_characters(self):
+        """Characters missing from the code page should follow the error handler."""
+        codec = EbcdicCodec("IBM-1047")
+        with self.assertRaises(UnicodeEncodeError):
+            codec.encode("€")
+        self.assertEqual(codec.encode("a€", errors="replace"), b"\x81\x6f")
+
+    def test_record_decoder_across_chunks(self):
+        """Records split across chunks should be converted to lines without trailing blanks."""
+        codec = EbcdicCodec("IBM-1047")
+        data = records(codec, "LINE ONE   ", "", "LINE TWO")
+        decoder = codec.record_decoder()
+        text = "".join(decoder.decode(data[i : i + 3]) for i in range(0, len(data), 3))
+        text += decoder.decode(b"", final=True)
+        self.assertEqual(text, "LINE ONE\n\nLINE TWO\n")
+        self.assertEqual(decoder.records, 3)
+
+    def test_record_decoder_truncated(self):
+        """A stream ending inside a record should be reported."""
+        decoder = EbcdicCodec("IBM-1047").record_decoder()
+        with self.assertRaises(ValueError):
+            decoder.decode(b"\x00\x00\x00\x05\xc1", final=True)
+
+
+class TestLocalConversion(TestCase):
+    """Local conversion unit tests."""
+
+    def setUp(self):
+        """Setup fixtures for local conversion."""
+        self.test_profile = {
+            "host": "mock-url.com",
+            "user": "Username",
+            "password": "Password",
+            "port": 443,
+            "rejectUnauthorized": True,
+        }
+        self.temp_dir = tempfile.mkdtemp()
+        self.local_file = os.path.join(self.temp_dir, "download")
+        self.codec = EbcdicCodec("IBM-1047")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def read_local_file(self):
+        with open(self.local_file, "r", encoding="utf-8") as f:
+            return f.read()
+
+    @mock.patch("requests.Session.send")
+    def test_dataset_download_converts_records(self, mock_send_request):
+        """Data sets converted locally should be requested as records."""
+        mock_send_request.return_value = stream_response([records(self.codec, "HELLO   ", "[WORLD]")])
+
+        Files(self.test_profile).ds.perform_download("HLQ.DS", self.local_file, convert_locally=True)
+        prepared_request = mock_send_request.call_args[0][0]
+        self.assertEqual(prepared_request.headers["X-IBM-Data-Type"], "record")
+        self.assertEqual(self.read_local_file(), "HELLO\n[WORLD]\n")
+
+    @mock.patch("requests.Session.send")
+    def test_dataset_resumable_download_converts_records(self, mock_send_request):
+        """Resumable downloads converted locally should count the received records."""
+        mock_send_request.return_value = stream_response([records(self.codec, "A", "B")])
+
+        Files(self.test_profile).ds.perform_download(
+            "HLQ.DS", self.local_file, resume=True, convert_locally=True, remote_encoding="IBM-037"
+        )
+        prepared_request = mock_send_request.call_args[0][0]
+        self.assertEqual(prepared_request.headers["X-IBM-Data-Type"], "record")
+        self.assertEqual(prepared_request.headers["X-IBM-Record-Range"], "0,100000")
+        self.assertEqual(self.read_local_file(), "A\nB\n")
+
+    @mock.patch("requests.Session.send")
+    def test_uss_download_converts_binary(self, mock_send_request):
+        """USS files converted locally should be requested as binary data."""
+        mock_send_request.return_value = stream_response([self.codec.encode("echo [ok]\n"), self.codec.encode("x\n")])
+
+        Files(self.test_profile).uss.perform_download("/a/b", self.local_file, convert_locally=True)
+        prepared_request = mock_send_request.call_args[0][0]
+        self.assertEqual(prepared_request.headers["X-IBM-Data-Type"], "binary")
+        self.assertEqual(self.read_local_file(), "echo [ok]\nx\n")
+
+    @mock.patch("requests.Session.send")
+    def test_uss_upload_converts_text(self, mock_send_request):
+        """USS uploads converted locally should send EBCDIC binary data."""
+        mock_send_request.return_value = mock.Mock(headers={"Content-Type": "application/json"}, status_code=201)
+        with open(self.local_file, "w", encoding="utf-8") as f:
+            f.write("echo [ok]\n")
+
+        Files(self.test_profile).uss.perform_upload(
+            self.local_file, "/a/b", upload_in_encoding="IBM-1047", convert_locally=True
+        )
+        prepared_request = mock_send_request.call_args[0][0]
+        self.assertEqual(prepared_request.headers["X-IBM-Data-Type"], "binary")
+        self.assertEqual(prepared_request.body, self.codec.encode("echo [ok]\n"))
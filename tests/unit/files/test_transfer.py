@@ -0,0 +1,387 @@
+"""Unit tests for the Zowe Python SDK z/OS Files package."""
+
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase, mock
+
+import requests
+from zowe.zos_files_for_zowe_sdk import Files
+from zowe.core_for_zowe_sdk.exceptions import RequestFailed
+from zowe.zos_files_for_zowe_sdk.constants import ContentType
+from zowe.zos_files_for_zowe_sdk.ebcdic import EbcdicCodec
+from zowe.zos_files_for_zowe_sdk.transfer import ResumableDownload, TransferCheckpoint
+
+
+def stream_response(chunks, status_code=200, headers=None, error=None):
+    """Build a streamed response yielding the given chunks, optionally failing after them."""
+
+    def iter_content(chunk_size=1, decode_unicode=False):
+        yield from chunks
+        if error is not None:
+            raise error
+
+    response = mock.Mock(spec=requests.Response, headers=headers or {}, status_code=status_code)
+    response.iter_content = mock.Mock(side_effect=iter_content)
+    return response
+
+
+def error_response(status_code, text=""):
+    """Build the response of a rejected request."""
+    return mock.Mock(ok=False, status_code=status_code, text=text, request=mock.Mock(url="", headers={}, body=None))
+
+
+def ebcdic_records(*records):
+    """Encode text records in IBM-1047, each prefixed with its 4 byte big endian length."""
+    codec = EbcdicCodec.for_encoding("IBM-1047")
+    return b"".join(len(record).to_bytes(4, "big") + codec.encode(record) for record in records)
+
+
+class TestResumableDownload(TestCase):
+    """Resumable download unit tests."""
+
+    def setUp(self):
+        """Setup fixtures for resumable downloads."""
+        self.test_profile = {
+            "host": "mock-url.com",
+            "user": "Username",
+            "password": "Password",
+            "port": 443,
+            "rejectUnauthorized": True,
+        }
+        self.temp_dir = tempfile.mkdtemp()
+        self.local_file = os.path.join(self.temp_dir, "download")
+        self.checkpoint_file = TransferCheckpoint.path_for(self.local_file)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def read_local_file(self):
+        with open(self.local_file, "rb") as f:
+            return f.read()
+
+    def write_checkpoint(self, content, remote, mode, position, etag=None):
+        with open(self.local_file, "wb") as f:
+            f.write(content)
+        checkpoint = TransferCheckpoint(remote, mode, position=position, size=len(content), etag=etag)
+        checkpoint.save(self.local_file)
+
+    @mock.patch("requests.Session.send")
+    def test_uss_binary_download_resumes_after_failure(self, mock_send_request):
+        """An interrupted binary download should continue from the last checkpoint with a byte range."""
+        uss = Files(self.test_profile).uss
+        mock_send_request.side_effect = [
+            stream_response([b"abcd", b"efgh", b"ij"], error=requests.ConnectionError("reset")),
+            stream_response([b"ijkl"], status_code=206),
+        ]
+        custom_args = uss._create_custom_request_arguments()
+        custom_args["url"] = "https://mock-url.com:443/zosmf/restfiles/fs/a/b"
+        download = ResumableDownload(uss.request_handler, custom_args, self.local_file, "/a/b", "binary")
+        with self.assertRaises(requests.ConnectionError):
+            download.by_bytes(checkpoint_bytes=4)
+        self.assertEqual(TransferCheckpoint.load(self.local_file, "/a/b", "binary").position, 8)
+        self.assertEqual(self.read_local_file(), b"abcdefgh")
+
+        download = ResumableDownload(uss.request_handler, custom_args, self.local_file, "/a/b", "binary")
+        download.by_bytes(checkpoint_bytes=4)
+        self.assertEqual(mock_send_request.call_args[0][0].headers["Range"], "bytes=8-")
+        self.assertEqual(self.read_local_file(), b"abcdefghijkl")
+        self.assertFalse(os.path.exists(self.checkpoint_file))
+
+    @mock.patch("requests.Session.send")
+    def test_uss_perform_download_resume(self, mock_send_request):
+        """Perform download with resume should request the remaining bytes of a binary USS file."""
+        self.write_checkpoint(b"hello", "/a/b", "binary", 5)
+        mock_send_request.return_value = stream_response([b" world"], status_code=206)
+
+        Files(self.test_profile).uss.perform_download(
+            "/a/b", self.local_file, content_type=ContentType.BINARY, resume=True
+        )
+        prepared_request = mock_send_request.call_args[0][0]
+        self.assertEqual(prepared_request.headers["Range"], "bytes=5-")
+        self.assertEqual(prepared_request.headers["X-IBM-Data-Type"], "binary")
+        self.assertEqual(self.read_local_file(), b"hello world")
+
+    @mock.patch("requests.Session.send")
+    def test_uss_download_restarts_without_range_support(self, mock_send_request):
+        """A full response to a range request should replace the partial local file."""
+        self.write_checkpoint(b"hello", "/a/b", "binary", 5)
+        mock_send_request.return_value = stream_response([b"hello world"], status_code=200)
+
+        Files(self.test_profile).uss.perform_download(
+            "/a/b", self.local_file, content_type=ContentType.BINARY, resume=True
+        )
+        self.assertEqual(self.read_local_file(), b"hello world")
+
+    @mock.patch("requests.Session.send")
+    def test_uss_text_download_resumes_by_bytes(self, mock_send_request):
+        """Text USS files should be resumed with a byte range of the remote file and converted on the client."""
+        self.write_checkpoint(b"line1\nline2\n", "/a/b", "text;IBM-1047;UTF-8;local", 12)
+        mock_send_request.return_value = stream_response(
+            [EbcdicCodec.for_encoding("IBM-1047").encode("line3\n")], status_code=206
+        )
+
+        Files(self.test_profile).uss.perform_download("/a/b", self.local_file, resume=True)
+        prepared_request = mock_send_request.call_args[0][0]
+        self.assertEqual(prepared_request.headers["Range"], "bytes=12-")
+        self.assertEqual(prepared_request.headers["X-IBM-Data-Type"], "binary")
+        self.assertEqual(self.read_local_file(), b"line1\nline2\nline3\n")
+
+    def test_uss_text_download_resume_requires_ebcdic(self):
+        """Text that cannot be converted on the client should not be resumed."""
+        with self.assertRaises(ValueError):
+            Files(self.test_profile).uss.perform_download(
+                "/a/b", self.local_file, remote_file_encoding="ISO8859-1", resume=True
+            )
+
+    @mock.patch("requests.Session.send")
+    def test_dataset_text_download_resumes(self, mock_send_request):
+        """Data set downloads should be resumed from the first record not yet received."""
+        self.write_checkpoint(b"REC1\nREC2\n", "HLQ.DS", "text;IBM-1047", 2)
+        mock_send_request.return_value = stream_response([ebcdic_records("REC3")])
+
+        Files(self.test_profile).ds.perform_download("HLQ.DS", self.local_file, resume=True)
+        mock_send_request.assert_called_once()
+        prepared_request = mock_send_request.call_args[0][0]
+        self.assertEqual(prepared_request.headers["X-IBM-Record-Range"], "2,100000")
+        self.assertEqual(prepared_request.headers["X-IBM-Data-Type"], "record")
+        self.assertEqual(prepared_request.headers["X-IBM-Return-Etag"], "true")
+        self.assertEqual(self.read_local_file(), b"REC1\nREC2\nREC3\n")
+        self.assertFalse(os.path.exists(self.checkpoint_file))
+
+    @mock.patch("requests.Session.send")
+    def test_dataset_binary_download_strips_record_prefixes(self, mock_send_request):
+        """Binary data set downloads should be received as records and written without the length prefixes."""
+        records = b"\x00\x00\x00\x03abc\x00\x00\x00\x02de"
+        mock_send_request.return_value = stream_response([records[:5], records[5:]])
+
+        Files(self.test_profile).ds.perform_download(
+            "HLQ.DS", self.local_file, content_type=ContentType.BINARY, resume=True
+        )
+        prepared_request = mock_send_request.call_args[0][0]
+        self.assertEqual(prepared_request.headers["X-IBM-Data-Type"], "record")
+        self.assertEqual(prepared_request.headers["X-IBM-Record-Range"], "0,100000")
+        self.assertEqual(self.read_local_file(), b"abcde")
+
+    @mock.patch("requests.Session.send")
+    def test_dataset_record_download_in_segments(self, mock_send_request):
+        """Record downloads should request consecutive ranges until a range is not full."""
+        ds = Files(self.test_profile).ds
+        mock_send_request.side_effect = [
+            stream_response([b"\x00\x00\x00\x01a\x00\x00\x00\x01b"]),
+            stream_response([b"\x00\x00\x00\x01c"]),
+        ]
+        custom_args = ds._create_custom_request_arguments()
+        custom_args["url"] = "https://mock-url.com:443/zosmf/restfiles/ds/HLQ.DS"
+        download = ResumableDownload(ds.request_handler, custom_args, self.local_file, "HLQ.DS", "record")
+        download.by_records(ContentType.RECORD, records_per_request=2)
+
+        ranges = [call[0][0].headers["X-IBM-Record-Range"] for call in mock_send_request.call_args_list]
+        self.assertEqual(ranges, ["0,2", "2,2"])
+        self.assertEqual(self.read_local_file(), b"\x00\x00\x00\x01a\x00\x00\x00\x01b\x00\x00\x00\x01c")
+
+    @mock.patch("requests.Session.send")
+    def test_dataset_text_download_counts_records_with_line_feeds(self, mock_send_request):
+        """A text record holding a line feed should be counted as one record."""
+        ds = Files(self.test_profile).ds
+        codec = EbcdicCodec.for_encoding("IBM-1047")
+        mock_send_request.side_effect = [
+            # The second record is "A", a line feed (X'25') and "B"
+            stream_response(
+                [ebcdic_records("REC1") + b"\x00\x00\x00\x03" + codec.encode("A") + b"\x25" + codec.encode("B")]
+            ),
+            stream_response([ebcdic_records("REC3")]),
+        ]
+        custom_args = ds._create_custom_request_arguments()
+        custom_args["url"] = "https://mock-url.com:443/zosmf/restfiles/ds/HLQ.DS"
+        download = ResumableDownload(ds.request_handler, custom_args, self.local_file, "HLQ.DS", "text;IBM-1047")
+        download.by_records(ContentType.TEXT, records_per_request=2, codec=codec)
+
+        ranges = [call[0][0].headers["X-IBM-Record-Range"] for call in mock_send_request.call_args_list]
+        self.assertEqual(ranges, ["0,2", "2,2"])
+        self.assertEqual(self.read_local_file().decode("utf-8"), "REC1\nA\x85B\nREC3\n")
+
+    def test_dataset_text_download_in_ranges_requires_codec(self):
+        """Text converted by z/OSMF should not be downloaded in ranges of records."""
+        ds = Files(self.test_profile).ds
+        download = ResumableDownload(ds.request_handler, {}, self.local_file, "HLQ.DS", "text")
+        with self.assertRaises(ValueError):
+            download.by_records(ContentType.TEXT)
+
+    @mock.patch("requests.Session.send")
+    def test_dataset_download_ends_on_out_of_range_error(self, mock_send_request):
+        """A range starting past the end of the data should end the download when z/OSMF rejects it."""
+        ds = Files(self.test_profile).ds
+        for rejection in [
+            error_response(416),
+            error_response(400, '{"message": "X-IBM-Record-Range starts after the last record"}'),
+        ]:
+            mock_send_request.reset_mock()
+            mock_send_request.side_effect = [stream_response([b"\x00\x00\x00\x01a\x00\x00\x00\x01b"]), rejection]
+            custom_args = ds._create_custom_request_arguments()
+            custom_args["url"] = "https://mock-url.com:443/zosmf/restfiles/ds/HLQ.DS"
+            download = ResumableDownload(ds.request_handler, custom_args, self.local_file, "HLQ.DS", "binary")
+            download.by_records(ContentType.BINARY, records_per_request=2)
+
+            self.assertEqual(mock_send_request.call_count, 2)
+            self.assertEqual(self.read_local_file(), b"ab")
+            self.assertFalse(os.path.exists(self.checkpoint_file))
+            os.remove(self.local_file)
+
+    @mock.patch("requests.Session.send")
+    def test_dataset_download_fails_on_other_bad_request(self, mock_send_request):
+        """A bad request that is not about the record range should fail the download instead of ending it."""
+        ds = Files(self.test_profile).ds
+        mock_send_request.side_effect = [
+            stream_response([b"\x00\x00\x00\x01a\x00\x00\x00\x01b"]),
+            error_response(400, '{"message": "Data set is in use"}'),
+        ]
+        custom_args = ds._create_custom_request_arguments()
+        custom_args["url"] = "https://mock-url.com:443/zosmf/restfiles/ds/HLQ.DS"
+        download = ResumableDownload(ds.request_handler, custom_args, self.local_file, "HLQ.DS", "binary")
+        with self.assertRaises(RequestFailed):
+            download.by_records(ContentType.BINARY, records_per_request=2)
+        self.assertEqual(TransferCheckpoint.load(self.local_file, "HLQ.DS", "binary").position, 2)
+
+    @mock.patch("requests.Session.send")
+    def test_download_restarts_when_remote_changed(self, mock_send_request):
+        """A different ETag than the one checkpointed should restart the download."""
+        self.write_checkpoint(b"OLD1\n", "HLQ.DS", "text;IBM-1047", 1, etag="1")
+        mock_send_request.side_effect = [
+            stream_response([ebcdic_records("NEW2")], headers={"ETag": "2"}),
+            stream_response([ebcdic_records("NEW1", "NEW2")], headers={"ETag": "2"}),
+        ]
+
+        Files(self.test_profile).ds.perform_download("HLQ.DS", self.local_file, resume=True)
+        ranges = [call[0][0].headers["X-IBM-Record-Range"] for call in mock_send_request.call_args_list]
+        self.assertEqual(ranges, ["1,100000", "0,100000"])
+        self.assertEqual(self.read_local_file(), b"NEW1\nNEW2\n")
+
+    @mock.patch("requests.Session.send")
+    def test_download_restarts_when_local_file_changed(self, mock_send_request):
+        """A local file that no longer matches the checkpoint should be downloaded again."""
+        self.write_checkpoint(b"REC1\n", "HLQ.DS", "text;IBM-1047", 1)
+        with open(self.local_file, "wb") as f:
+            f.write(b"XXXX\n")
+        mock_send_request.return_value = stream_response([ebcdic_records("REC1", "REC2")])
+
+        Files(self.test_profile).ds.perform_download("HLQ.DS", self.local_file, resume=True)
+        self.assertEqual(mock_send_request.call_args[0][0].headers["X-IBM-Record-Range"], "0,100000")
+        self.assertEqual(self.read_local_file(), b"REC1\nREC2\n")
+
+    def test_checkpoint_is_ignored_for_other_remote(self):
+        """A checkpoint recorded for another remote file should not be resumed."""
+        self.write_checkpoint(b"data", "HLQ.OTHER", "text", 1)
+        checkpoint = TransferCheckpoint.load(self.local_file, "HLQ.DS", "text")
+        self.assertEqual(checkpoint.position, 0)
+        self.assertEqual(self.read_local_file(), b"")
+        with open(self.checkpoint_file, "r", encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["remote"], "HLQ.OTHER")
+
+
+class TestSegmentedDownload(TestCase):
+    """Segmented download unit tests."""
+
+    def setUp(self):
+        """Setup fixtures for segmented downloads."""
+        self.test_profile = {
+            "host": "mock-url.com",
+            "user": "Username",
+            "password": "Password",
+            "port": 443,
+            "rejectUnauthorized": True,
+        }
+        self.temp_dir = tempfile.mkdtemp()
+        self.local_file = os.path.join(self.temp_dir, "download")
+        self.records = [ebcdic_records(f"REC{i}") for i in range(7)]
+        self.text = "".join(f"REC{i}\n" for i in range(7))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def send_range(self, prepared_request, **kwargs):
+        """Return the records of the requested range."""
+        start, count = map(int, prepared_request.headers["X-IBM-Record-Range"].split(","))
+        return stream_response(self.records[start : start + count])
+
+    @mock.patch("requests.Session.send")
+    def test_segmented_download_assembles_ranges_in_order(self, mock_send_request):
+        """Ranges downloaded concurrently should be written to the local file in order."""
+        mock_send_request.side_effect = self.send_range
+
+        Files(self.test_profile).ds.perform_segmented_download(
+            "HLQ.DS", self.local_file, max_workers=3, records_per_segment=2
+        )
+        with open(self.local_file, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), self.text)
+        self.assertEqual(mock_send_request.call_args[0][0].headers["X-IBM-Data-Type"], "record")
+        ranges = {call[0][0].headers["X-IBM-Record-Range"] for call in mock_send_request.call_args_list}
+        self.assertTrue({"0,2", "2,2", "4,2", "6,2"} <= ranges)
+        self.assertEqual(os.listdir(self.temp_dir), ["download"])
+
+    @mock.patch("requests.Session.send")
+    def test_segmented_download_binary(self, mock_send_request):
+        """Binary segmented downloads should request records and remove the length prefixes."""
+        self.records = [b"\x00\x00\x00\x02ab", b"\x00\x00\x00\x01c", b"\x00\x00\x00\x03def"]
+        mock_send_request.side_effect = self.send_range
+
+        Files(self.test_profile).ds.perform_segmented_download(
+            "HLQ.DS", self.local_file, content_type=ContentType.BINARY, max_workers=2, records_per_segment=1
+        )
+        self.assertEqual(mock_send_request.call_args[0][0].headers["X-IBM-Data-Type"], "record")
+        with open(self.local_file, "rb") as f:
+            self.assertEqual(f.read(), b"abcdef")
+
+    @mock.patch("requests.Session.send")
+    def test_segmented_download_stops_scheduling_after_last_range(self, mock_send_request):
+        """Ranges past a short range should not be requested."""
+        self.records = self.records[:3]
+        mock_send_request.side_effect = self.send_range
+
+        Files(self.test_profile).ds.perform_segmented_download(
+            "HLQ.DS", self.local_file, max_workers=1, records_per_segment=2
+        )
+        ranges = [call[0][0].headers["X-IBM-Record-Range"] for call in mock_send_request.call_args_list]
+        self.assertEqual(ranges, ["0,2", "2,2"])
+        with open(self.local_file, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), "REC0\nREC1\nREC2\n")
+
+    @mock.patch("requests.Session.send")
+    def test_segmented_download_ends_on_out_of_range_error(self, mock_send_request):
+        """A range rejected because it starts past the end of the data should end the download."""
+        self.records = self.records[:4]
+
+        def send_range(prepared_request, **kwargs):
+            if int(prepared_request.headers["X-IBM-Record-Range"].split(",")[0]) >= len(self.records):
+                return error_response(416)
+            return self.send_range(prepared_request)
+
+        mock_send_request.side_effect = send_range
+        Files(self.test_profile).ds.perform_segmented_download(
+            "HLQ.DS", self.local_file, max_workers=2, records_per_segment=2
+        )
+        with open(self.local_file, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), "REC0\nREC1\nREC2\nREC3\n")
+        self.assertEqual(os.listdir(self.temp_dir), ["download"])
+
+    @mock.patch("requests.Session.send")
+    def test_segmented_download_failure_removes_parts(self, mock_send_request):
+        """A failed range should fail the download without leaving part files behind."""
+
+        def send_range(prepared_request, **kwargs):
+            if prepared_request.headers["X-IBM-Record-Range"] == "2,2":
+                raise requests.ConnectionError("reset")
+            return self.send_range(prepared_request)
+
+        mock_send_request.side_effect = send_range
+        with self.assertRaises(requests.ConnectionError):
+            Files(self.test_profile).ds.perform_segmented_download(
+                "HLQ.DS", self.local_file, max_workers=2, records_per_segment=2
+            )
+        self.assertEqual(os.listdir(self.temp_dir), ["download"])
+
+    def test_segmented_download_invalid_arguments(self):
+        """Segment sizes and worker counts lower than 1 should be rejected."""
+        with self.assertRaises(ValueError):
+            Files(self.test_profile).ds.perform_segmented_download("HLQ.DS", self.local_file, max_workers=0)
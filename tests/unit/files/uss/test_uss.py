@@ -1,13 +1,15 @@
 """Unit tests for the Zowe Python SDK z/OS Files package."""
 
+import json
 from unittest import TestCase, mock
+from urllib.parse import parse_qsl, unquote, urlparse
 
 import pytest
 import requests
 from zowe.core_for_zowe_sdk.exceptions import FileNotFound
-from zowe.zos_files_for_zowe_sdk import Files
+from zowe.zos_files_for_zowe_sdk import Files, USSTagCache
 from zowe.zos_files_for_zowe_sdk.constants import ContentType
-from zowe.zos_files_for_zowe_sdk.response.uss import USSFileTagType
+from zowe.zos_files_for_zowe_sdk.response.uss import USSFileTag, USSFileTagType
 
 
 class TestUssClass(TestCase):
@@ -412,6 +414,183 @@ class TestUssClass(TestCase):
         mock_send_request.assert_called_once()
         prepared_request = mock_send_request.call_args[0][0]
         self.assertEqual(prepared_request.method, "PUT")
+        self.assertEqual(prepared_request.url, "https://mock-url.com:443/zosmf/restfiles/fs/some%2Ftest%2Fpath")
         self.assertEqual(result.charset, "ISO8859-1")
         self.assertEqual(result.is_conversion_enabled, False)
         self.assertEqual(result.tag_type, USSFileTagType.MIXED)
+
+    @mock.patch("requests.Session.send")
+    def test_list_uss_filters(self, mock_send_request):
+        """Test list USS files sends the filters to z/OSMF"""
+        mock_send_request.return_value = json_response({"items": []})
+
+        Files(self.test_profile).uss.list("/u/user", depth=2, name="*.c", file_type="f", mtime=-7, max_items=0)
+
+        prepared_request = mock_send_request.call_args[0][0]
+        self.assertEqual(
+            dict(parse_qsl(urlparse(prepared_request.url).query)),
+            {"path": "/u/user", "depth": "2", "name": "*.c", "type": "f", "mtime": "-7"},
+        )
+        self.assertEqual(prepared_request.headers["X-IBM-Max-Items"], "0")
+
+    @mock.patch("requests.Session.send")
+    def test_walk_lists_slices_of_levels(self, mock_send_request):
+        """Test walk lists several levels per request and continues from the directories at the last level"""
+        mock_send_request.side_effect = [
+            json_response(
+                {
+                    "items": [
+                        {"name": ".", "mode": "drwxr-xr-x"},
+                        {"name": "a.c", "mode": "-rw-r--r--"},
+                        {"name": "src", "mode": "drwxr-xr-x"},
+                        {"name": "src/lib", "mode": "drwxr-xr-x"},
+                    ]
+                }
+            ),
+            json_response({"items": [{"name": ".", "mode": "drwxr-xr-x"}, {"name": "b.c", "mode": "-rw-r--r--"}]}),
+        ]
+
+        paths = [path for path, _ in Files(self.test_profile).uss.walk("/u/user/", depth_per_request=2)]
+
+        self.assertEqual(paths, ["/u/user/a.c", "/u/user/src", "/u/user/src/lib", "/u/user/src/lib/b.c"])
+        second_request = mock_send_request.call_args_list[1][0][0]
+        self.assertEqual(dict(parse_qsl(urlparse(second_request.url).query))["path"], "/u/user/src/lib")
+
+    @mock.patch("requests.Session.send")
+    def test_walk_with_filters(self, mock_send_request):
+        """Test walk finds the directories to continue from with a separate request when entries are filtered"""
+        mock_send_request.side_effect = [
+            json_response({"items": [{"name": "a.c", "mode": "-rw-r--r--"}]}),
+            json_response({"items": [{"name": "src", "mode": "drwxr-xr-x"}]}),
+            json_response({"items": [{"name": "b.c", "mode": "-rw-r--r--"}]}),
+        ]
+
+        walk = Files(self.test_profile).uss.walk("/u", max_depth=2, depth_per_request=1, name="*.c")
+        paths = [path for path, _ in walk]
+
+        self.assertEqual(paths, ["/u/a.c", "/u/src/b.c"])
+        queries = [dict(parse_qsl(urlparse(call[0][0].url).query)) for call in mock_send_request.call_args_list]
+        self.assertEqual(queries[1]["type"], "d")
+        self.assertEqual(queries[2], {"path": "/u/src", "depth": "1", "name": "*.c", "symlinks": "report"})
+
+    @mock.patch("requests.Session.send")
+    def test_walk_follows_links_only_with_max_depth(self, mock_send_request):
+        """Test walk reports links by default and only follows them within a maximum depth"""
+        mock_send_request.return_value = json_response({"items": [{"name": "a.c", "mode": "-rw-r--r--"}]})
+        uss = Files(self.test_profile).uss
+
+        list(uss.walk("/u"))
+        query = dict(parse_qsl(urlparse(mock_send_request.call_args[0][0].url).query))
+        self.assertEqual(query["symlinks"], "report")
+        with self.assertRaises(ValueError):
+            next(uss.walk("/u", symlinks="follow"))
+        list(uss.walk("/u", max_depth=8, symlinks="follow"))
+        query = dict(parse_qsl(urlparse(mock_send_request.call_args[0][0].url).query))
+        self.assertEqual(query["symlinks"], "follow")
+
+    def test_walk_invalid_depth(self):
+        """Test walk rejects slices of less than one level"""
+        with self.assertRaises(ValueError):
+            next(Files(self.test_profile).uss.walk("/u", depth_per_request=0))
+
+    @mock.patch("requests.Session.send")
+    def test_get_file_tag_cached(self, mock_send_request):
+        """Test file tags are only read from the cache when asked, and until the file is written"""
+        mock_send_request.return_value = json_response({"stdout": ["t IBM-1047    T=on  /u/a.txt"]})
+        uss = Files(self.test_profile).uss
+
+        self.assertEqual(uss.get_file_tag("/u/a.txt").charset, "IBM-1047")
+        self.assertEqual(uss.get_file_tag("/u/a.txt").charset, "IBM-1047")
+        self.assertEqual(mock_send_request.call_count, 2)
+        self.assertEqual(uss.get_file_tag("/u/a.txt", use_cache=True).charset, "IBM-1047")
+        self.assertEqual(mock_send_request.call_count, 2)
+
+        mock_send_request.return_value = mock.Mock(headers={"Content-Type": "application/json"}, status_code=204)
+        uss.write("/u/a.txt", "data")
+        mock_send_request.return_value = json_response({"stdout": ["t IBM-1047    T=on  /u/a.txt"]})
+        uss.get_file_tag("/u/a.txt", use_cache=True)
+        self.assertEqual(mock_send_request.call_count, 4)
+
+    @mock.patch("requests.Session.send")
+    def test_get_file_tags_lists_directories(self, mock_send_request):
+        """Test file tags are listed once per directory holding enough files and once per other file"""
+        listings = {
+            "/u/a": [
+                "t IBM-1047    T=on  /u/a/x.c",
+                "t IBM-1047    T=on  /u/a/w.c",
+                "b binary      T=off /u/a/b/y.bin",
+                "- untagged    T=off /u/a/z",
+            ],
+            "/v/w.txt": ["t ISO8859-1   T=on  /v/w.txt"],
+            "/v/p/q/deep.txt": ["t ISO8859-1   T=on  /v/p/q/deep.txt"],
+        }
+
+        def send(request, **kwargs):
+            body = json.loads(request.body)
+            path = "/" + unquote(request.url.split("/fs/", 1)[1])
+            self.assertEqual(body["recursive"], path == "/u/a")
+            return json_response({"stdout": listings[path]})
+
+        mock_send_request.side_effect = send
+        uss = Files(self.test_profile).uss
+
+        tags = uss.get_file_tags(
+            ["/u/a/x.c", "/u/a/w.c", "/u/a/b/y.bin", "/v/w.txt", "/v/p/q/deep.txt"], min_files_per_listing=2
+        )
+
+        self.assertEqual(mock_send_request.call_count, 3)
+        self.assertEqual(tags["/u/a/x.c"].charset, "IBM-1047")
+        self.assertEqual(tags["/u/a/b/y.bin"].tag_type, USSFileTagType.BINARY)
+        self.assertEqual(tags["/v/w.txt"].charset, "ISO8859-1")
+        self.assertEqual(tags["/v/p/q/deep.txt"].charset, "ISO8859-1")
+        self.assertIsNone(uss.get_file_tag("/u/a/z", use_cache=True).tag_type)
+        self.assertEqual(mock_send_request.call_count, 3)
+
+    @mock.patch("requests.Session.send")
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    def test_perform_download_use_file_tag(self, mock_file, mock_send_request):
+        """Test download chooses the content type and encoding from the cached file tag"""
+        mock_response = mock.Mock(spec=requests.Response, headers={}, status_code=200)
+        mock_response.iter_content = mock.Mock(return_value=["text"])
+        mock_send_request.return_value = mock_response
+        uss = Files(self.test_profile).uss
+        uss.tag_cache.set("/u/a.txt", USSFileTag({"stdout": ["t IBM-037     T=on  /u/a.txt"]}))
+        uss.tag_cache.set("/u/b.bin", USSFileTag({"stdout": ["b binary      T=off /u/b.bin"]}))
+
+        uss.perform_download("/u/a.txt", "a.txt", use_file_tag=True)
+        uss.perform_download("/u/b.bin", "b.bin", use_file_tag=True)
+
+        text_request, binary_request = [call[0][0] for call in mock_send_request.call_args_list]
+        self.assertEqual(text_request.headers["X-IBM-Data-Type"], "text;fileEncoding=IBM-037")
+        self.assertEqual(binary_request.headers["X-IBM-Data-Type"], "binary")
+
+
+class TestUSSTagCache(TestCase):
+    """USSTagCache class unit tests."""
+
+    def setUp(self):
+        """Build a file tag."""
+        self.tag = USSFileTag({"stdout": ["t IBM-1047    T=on  /u/a.txt"]})
+
+    def test_expiry(self):
+        """Test tags expire after the TTL"""
+        cache = USSTagCache(ttl=0)
+        cache.set("/u/a.txt", self.tag)
+        self.assertIsNone(cache.get("/u/a.txt"))
+
+    def test_invalidate_recursive(self):
+        """Test invalidating a directory forgets the tags of the files below it"""
+        cache = USSTagCache()
+        for path in ["/u/a/x", "/u/a/b/y", "/u/ab"]:
+            cache.set(path, self.tag)
+        cache.invalidate("/u/a/", recursive=True)
+        self.assertIsNone(cache.get("/u/a/x"))
+        self.assertIsNone(cache.get("/u/a/b/y"))
+        self.assertIs(cache.get("/u/ab"), self.tag)
+
+
+def json_response(body):
+    """Build a JSON response."""
+    mock_response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=200)
+    mock_response.json.return_value = body
+    return mock_response
@@ -1,11 +1,21 @@
 """Unit tests for the Zowe Python SDK z/OS Jobs package."""
 
+import fnmatch
+import http.client
+import json
 import os
 import shutil
 import tempfile
+import time
+import threading
+import urllib.error
+import urllib.request
 from unittest import TestCase, mock
+from urllib.parse import parse_qs, unquote, urlparse
 
-from zowe.zos_jobs_for_zowe_sdk import Jobs
+from zowe.core_for_zowe_sdk.exceptions import RequestFailed
+from zowe.zos_jobs_for_zowe_sdk import JobEventType, JobNotificationReceiver, Jobs, JobWatcher, SpoolCache
+from zowe.zos_jobs_for_zowe_sdk.response import JobResponse
 
 
 class TestJobsClass(TestCase):
@@ -102,6 +112,228 @@ class TestJobsClass(TestCase):
         with self.assertRaises(ValueError):
             Jobs(self.test_profile).change_job_class("TESTJOB2", "JOB00084", "A", modify_version="3.0")
 
+    @mock.patch("requests.Session.send")
+    def test_iter_jobs_splits_full_pages(self, mock_send_request):
+        """Test job listings larger than a page are split by job name"""
+        jobs = ["JOBA", "JOBA1", "JOBB", "JOBB", "JOBC", "OTHER"]
+
+        def send(request, **kwargs):
+            params = {key: values[0] for key, values in parse_qs(urlparse(request.url).query).items()}
+            self.assertEqual((params["owner"], params["exec-data"]), ("IBMUSER", "Y"))
+            matching = [name for name in jobs if fnmatch.fnmatchcase(name, params["prefix"])]
+            mock_response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=200)
+            mock_response.json.return_value = [{"jobname": name} for name in matching[: int(params["max-jobs"])]]
+            return mock_response
+
+        mock_send_request.side_effect = send
+        listed = Jobs(self.test_profile).iter_jobs(owner="IBMUSER", prefix="JOB*", exec_data=True, page_size=2)
+
+        self.assertEqual([job.jobname for job in listed], ["JOBA", "JOBA1", "JOBB", "JOBB", "JOBC"])
+
+    @mock.patch("requests.Session.send")
+    def test_iter_jobs_splits_owner(self, mock_send_request):
+        """Test full pages of one job name are split by owner"""
+        jobs = [("JOBA", "IBMUSER"), ("JOBA", "IBMUSER"), ("JOBA", "OTHER"), ("JOBB", "IBMUSER")]
+
+        def send(request, **kwargs):
+            params = {key: values[0] for key, values in parse_qs(urlparse(request.url).query).items()}
+            matching = [
+                name
+                for name, owner in jobs
+                if fnmatch.fnmatchcase(name, params["prefix"]) and fnmatch.fnmatchcase(owner, params["owner"])
+            ]
+            mock_response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=200)
+            mock_response.json.return_value = [{"jobname": name} for name in matching[: int(params["max-jobs"])]]
+            return mock_response
+
+        mock_send_request.side_effect = send
+        listed = list(Jobs(self.test_profile).iter_jobs(owner="*", prefix="JOBA", page_size=2))
+
+        self.assertEqual([job.jobname for job in listed], ["JOBA", "JOBA", "JOBA"])
+
+    @mock.patch("requests.Session.send")
+    def test_iter_jobs_cannot_split_job_name(self, mock_send_request):
+        """Test an error is raised when a full page cannot be split by job name or owner"""
+        mock_response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=200)
+        mock_response.json.return_value = [{"jobname": "JOBA"}, {"jobname": "JOBA"}, {"jobname": "JOBA"}]
+        mock_send_request.return_value = mock_response
+
+        with self.assertRaises(ValueError):
+            list(Jobs(self.test_profile).iter_jobs(owner="IBMUSER", prefix="JOBA", page_size=2))
+        mock_send_request.assert_called_once()
+
+    @mock.patch("requests.Session.send")
+    def test_submit_batch_with_symbol_headers(self, mock_send_request):
+        """Test batch submission sends JCL symbols as headers and returns jobs in order"""
+
+        def send(request, **kwargs):
+            mock_response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=201)
+            mock_response.json.return_value = {"jobid": "JOB" + request.headers["X-IBM-JCL-Symbol-NUM"]}
+            return mock_response
+
+        mock_send_request.side_effect = send
+        jcl = "//TEST&NUM JOB\n//STEP EXEC PGM=&PGM..X"
+
+        jobs = Jobs(self.test_profile).submit_batch(jcl, [{"num": str(i), "PGM": "IEFBR14"} for i in range(20)], 4)
+
+        self.assertEqual([job.jobid for job in jobs], ["JOB{}".format(i) for i in range(20)])
+        request = mock_send_request.call_args[0][0]
+        self.assertEqual(request.body, jcl)
+        self.assertEqual(request.headers["X-IBM-JCL-Symbol-PGM"], "IEFBR14")
+
+    @mock.patch("requests.Session.send")
+    def test_submit_plaintext_substitutes_symbols_locally(self, mock_send_request):
+        """Test symbols whose name cannot be sent in a header are substituted in the JCL"""
+        mock_response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=201)
+        mock_response.json.return_value = {"jobid": "JOB00001"}
+        mock_send_request.return_value = mock_response
+
+        Jobs(self.test_profile).submit_plaintext("//A JOB\n// SET X=&LONGNAME1.,Y=&LONGNAME12", {"LONGNAME1": "V"})
+
+        request = mock_send_request.call_args[0][0]
+        self.assertEqual(request.body, "//A JOB\n// SET X=V,Y=&LONGNAME12")
+        self.assertNotIn("X-IBM-JCL-Symbol-LONGNAME1", request.headers)
+
+    @mock.patch("requests.Session.send")
+    def test_submit_plaintext_rejects_invalid_symbol_values(self, mock_send_request):
+        """Test symbol values that fit neither a header nor a JCL statement are rejected"""
+        jobs = Jobs(self.test_profile)
+
+        for value in ["x" * 256, "a\nb"]:
+            with self.assertRaises(ValueError):
+                jobs.submit_plaintext("//A JOB\n// SET X=&SYM", {"SYM": value})
+        mock_send_request.assert_not_called()
+
+    @mock.patch("requests.Session.send")
+    def test_submit_batch_return_exceptions(self, mock_send_request):
+        """Test jobs that cannot be submitted are returned as errors"""
+        submitted = mock.Mock(headers={"Content-Type": "application/json"}, status_code=201)
+        submitted.json.return_value = {"jobid": "JOB00001"}
+        mock_send_request.side_effect = [submitted, ConnectionError("connection refused")]
+
+        jobs = Jobs(self.test_profile).submit_batch("//A JOB", [{}, {}], max_workers=1, return_exceptions=True)
+
+        self.assertEqual(jobs[0].jobid, "JOB00001")
+        self.assertIsInstance(jobs[1], ConnectionError)
+
+    def spool_send(self, request, **kwargs):
+        """Simulate the spool of jobs JOB1 to JOB9, where JOB3 and JOB7 print the message IEF142I twice."""
+        parts = unquote(urlparse(request.url).path).split("/")
+        mock_response = mock.Mock(status_code=200, encoding=None)
+        if parts[-1] == "files":
+            jobid = parts[-2]
+            mock_response.headers = {"Content-Type": "application/json"}
+            mock_response.json.return_value = [
+                {"jobname": "TEST", "jobid": jobid, "ddname": ddname, "stepname": "STEP1", "id": index}
+                for index, ddname in enumerate(["JESMSGLG", "SYSPRINT"], 2)
+            ]
+            return mock_response
+        jobid, ddname = parts[-4], {"2": "JESMSGLG", "3": "SYSPRINT"}[parts[-2]]
+        lines = ["{} {}".format(jobid, ddname)]
+        if jobid in ("JOB3", "JOB7") and ddname == "SYSPRINT":
+            lines += ["IEF142I STEP1 - STEP WAS EXECUTED", "IEF142I STEP2 - STEP WAS EXECUTED"]
+        mock_response.headers = {"Content-Type": "text/plain"}
+        mock_response.iter_lines.return_value = iter(lines)
+        with self.lock:
+            self.streamed.append(mock_response)
+        return mock_response
+
+    @mock.patch("requests.Session.send")
+    def test_search_spool(self, mock_send_request):
+        """Test spool files are searched line by line and closed"""
+        self.lock, self.streamed = threading.Lock(), []
+        mock_send_request.side_effect = self.spool_send
+        jobs = [JobResponse({"jobname": "TEST", "jobid": "JOB{}".format(i)}) for i in range(1, 10)]
+
+        matches = list(Jobs(self.test_profile).search_spool(jobs, r"IEF142I", max_workers=3, max_matches_per_job=1))
+
+        found = sorted((match.jobid, match.ddname, match.line_number) for match in matches)
+        self.assertEqual(found, [("JOB3", "SYSPRINT", 2), ("JOB7", "SYSPRINT", 2)])
+        self.assertEqual(len(self.streamed), 18)
+        for response in self.streamed:
+            response.close.assert_called_once()
+
+    @mock.patch("requests.Session.send")
+    def test_search_spool_stops_at_max_matches(self, mock_send_request):
+        """Test no more jobs are searched once enough matches are found"""
+        self.lock, self.streamed = threading.Lock(), []
+        mock_send_request.side_effect = self.spool_send
+        jobs = [JobResponse({"jobname": "TEST", "jobid": "JOB{}".format(i)}) for i in range(1, 1000)]
+        consumed = []
+
+        def job_iterator():
+            for job in jobs:
+                consumed.append(job)
+                yield job
+
+        matches = list(
+            Jobs(self.test_profile).search_spool(job_iterator(), "IEF142I", ["sysprint"], max_matches=1, max_workers=1)
+        )
+
+        self.assertEqual([(match.jobid, match.line_number) for match in matches], [("JOB3", 2)])
+        self.assertLess(len(consumed), 10)
+        self.assertLessEqual(len(self.streamed), 4)
+
+    @mock.patch("requests.Session.send")
+    def test_delete_jobs(self, mock_send_request):
+        """Test jobs are purged concurrently with asynchronous requests and a result per job"""
+
+        def send(request, **kwargs):
+            job_url = unquote(urlparse(request.url).path).split("/jobs/")[1]
+            self.assertEqual((request.method, request.headers["X-IBM-Job-Modify-Version"]), ("DELETE", "1.0"))
+            if job_url == "TESTJOB/JOB00002":
+                raise ConnectionError("connection reset")
+            mock_response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=202)
+            mock_response.json.return_value = {"jobid": job_url.split("/")[1], "status": 0}
+            return mock_response
+
+        mock_send_request.side_effect = send
+        jobs = [JobResponse({"jobname": "TESTJOB", "jobid": "JOB0000{}".format(i)}) for i in range(1, 6)]
+
+        results = Jobs(self.test_profile).delete_jobs(jobs, max_workers=3)
+
+        self.assertEqual([result.jobid for result in results], ["JOB0000{}".format(i) for i in range(1, 6)])
+        self.assertEqual([result.ok for result in results], [True, False, True, True, True])
+        self.assertIn("connection reset", results[1].error)
+
+    @mock.patch("requests.Session.send")
+    def test_hold_jobs_string_status(self, mock_send_request):
+        """Test the status of asynchronous requests is read as a string"""
+
+        def send(request, **kwargs):
+            jobid = unquote(urlparse(request.url).path).split("/")[-1]
+            mock_response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=202)
+            mock_response.json.return_value = {"jobid": jobid, "status": "0" if jobid == "JOB00001" else "4"}
+            return mock_response
+
+        mock_send_request.side_effect = send
+        results = Jobs(self.test_profile).hold_jobs([("TESTJOB", "JOB00001"), ("TESTJOB", "JOB00002")])
+
+        self.assertEqual([result.ok for result in results], [True, False])
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.Session.send")
+    def test_change_jobs_class_rate_limit(self, mock_send_request, mock_sleep):
+        """Test requests are spaced to respect the maximum rate"""
+        mock_response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=200)
+        mock_response.json.return_value = {"status": 0}
+        mock_send_request.return_value = mock_response
+
+        jobs = [("TESTJOB", "JOB0000{}".format(i)) for i in range(1, 5)]
+        results = Jobs(self.test_profile).change_jobs_class(jobs, "B", "2.0", max_workers=1, max_rate=2)
+
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(json.loads(mock_send_request.call_args[0][0].body), {"class": "B", "version": "2.0"})
+        self.assertEqual(mock_sleep.call_count, 3)
+        # The clock does not advance while sleep is mocked, so each request waits for one more interval
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        self.assertEqual([round(delay, 1) for delay in delays], [0.5, 1.0, 1.5])
+
+    def test_bulk_modify_version_error(self):
+        """Test bulk operations reject invalid modify versions"""
+        with self.assertRaises(ValueError):
+            Jobs(self.test_profile).hold_jobs([("TESTJOB", "JOB00001")], modify_version="3.0")
+
     def test_cancel_job_modify_version_parameterized(self):
         """Test cancelling a job with different values sends the expected request"""
         test_values = [
@@ -195,3 +427,304 @@ class TestJobsClass(TestCase):
         with self.assertRaises(ValueError):
             jobs.get_job_output_as_files(status, out_dir)
         self.assertFalse(os.path.exists(abs_ddname))
+
+
+class TestJobNotificationReceiver(TestCase):
+    """JobNotificationReceiver class unit tests."""
+
+    def setUp(self):
+        """Start a receiver on the loopback interface."""
+        self.receiver = JobNotificationReceiver(callback_host="127.0.0.1", bind_address="127.0.0.1")
+        self.receiver.start()
+        self.addCleanup(self.receiver.stop)
+        self.jobs = Jobs({"host": "mock-url.com", "user": "Username", "password": "Password", "port": 443})
+
+    def post(self, url, body):
+        """Send a notification like z/OSMF."""
+        request = urllib.request.Request(url, data=json.dumps(body).encode("utf-8"), method="POST")
+        request.add_header("Content-Type", "application/json")
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status
+        except urllib.error.HTTPError as error:
+            return error.code
+
+    @mock.patch("requests.Session.send")
+    def test_submit_notified(self, mock_send_request):
+        """Test the future of a job resolves when z/OSMF sends its notification"""
+        mock_response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=201)
+        mock_response.json.return_value = {"jobname": "TESTJOB", "jobid": "JOB00001", "status": "INPUT"}
+        mock_send_request.return_value = mock_response
+
+        job, future = self.jobs.submit_notified(self.receiver, jcl="//TESTJOB JOB")
+
+        notification_url = mock_send_request.call_args[0][0].headers["X-IBM-Notification-URL"]
+        self.assertTrue(notification_url.startswith(self.receiver.url))
+        self.assertEqual(job.jobid, "JOB00001")
+        self.assertFalse(future.done())
+        status = {"jobname": "TESTJOB", "jobid": "JOB00001", "status": "OUTPUT", "retcode": "CC 0000"}
+        self.assertEqual(self.post(notification_url, status), 200)
+        self.assertEqual(future.result(timeout=5).retcode, "CC 0000")
+        self.assertEqual(self.post(notification_url, status), 404)
+
+    def post_headers(self, path, content_length):
+        """Send a notification without a body and return the status of the response."""
+        connection = http.client.HTTPConnection("127.0.0.1", self.receiver.port, timeout=5)
+        self.addCleanup(connection.close)
+        connection.putrequest("POST", path)
+        connection.putheader("Content-Length", content_length)
+        connection.endheaders()
+        return connection.getresponse().status
+
+    def test_unknown_notification(self):
+        """Test notifications with an unknown token are rejected"""
+        self.assertEqual(self.post(self.receiver.url + "unknown", {"jobid": "JOB00001"}), 404)
+        # Rejected without waiting for the body
+        self.assertEqual(self.post_headers("/unknown", "1000"), 404)
+
+    def test_invalid_notification_size(self):
+        """Test notifications with an invalid or too large body are rejected before reading it"""
+        notification_url, future = self.receiver.expect()
+        path = urlparse(notification_url).path
+        self.assertEqual(self.post_headers(path, "many"), 400)
+        self.assertEqual(self.post_headers(path, str(10**9)), 413)
+        self.assertFalse(future.done())
+
+    @mock.patch("requests.Session.send")
+    def test_submit_notified_failure(self, mock_send_request):
+        """Test the notification of a job that could not be submitted is discarded"""
+        mock_send_request.side_effect = ConnectionError("connection refused")
+
+        with self.assertRaises(ConnectionError):
+            self.jobs.submit_notified(self.receiver, jcl_path="HLQ.JCL(TEST)")
+
+        notification_url = mock_send_request.call_args[0][0].headers["X-IBM-Notification-URL"]
+        self.assertEqual(self.post(notification_url, {"jobid": "JOB00001"}), 404)
+
+    def test_notification_after_cancel(self):
+        """Test a notification is accepted after its future was cancelled by the caller"""
+        notification_url, future = self.receiver.expect()
+        future.cancel()
+        self.assertEqual(self.post(notification_url, {"jobid": "JOB00001"}), 200)
+
+    def test_stop_cancels_futures(self):
+        """Test stopping the receiver cancels the futures of the jobs that did not end"""
+        _, future = self.receiver.expect()
+        self.receiver.stop()
+        self.assertTrue(future.cancelled())
+
+    def test_submit_notified_requires_jcl(self):
+        """Test exactly one source of JCL must be given"""
+        with self.assertRaises(ValueError):
+            self.jobs.submit_notified(self.receiver)
+
+
+class TestSpoolCache(TestCase):
+    """SpoolCache class unit tests."""
+
+    def setUp(self):
+        """Create a temporary cache directory."""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.profile = {"host": "mock-url.com", "user": "Username", "password": "Password", "port": 443}
+
+    def send(self, status, job_correlator="J0001"):
+        """Simulate z/OSMF for a job with the given status."""
+
+        def send(request, **kwargs):
+            path = unquote(urlparse(request.url).path)
+            mock_response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=200)
+            if path.endswith("/files"):
+                mock_response.json.return_value = [{"ddname": "JESMSGLG", "id": 2}]
+            elif path.endswith("/records"):
+                mock_response.headers = {"Content-Type": "text/plain"}
+                mock_response.text = "records of {} in {}".format(path.split("/")[-2], job_correlator)
+            else:
+                mock_response.json.return_value = {
+                    "jobname": "TESTJOB",
+                    "status": status,
+                    "job-correlator": job_correlator,
+                }
+            return mock_response
+
+        return send
+
+    def test_compressed_entries(self):
+        """Entries should be readable whatever the compression setting they were stored with."""
+        SpoolCache(self.directory, compress=True).put("J0001", "spool-2", "IEF142I " * 100)
+        cache = SpoolCache(self.directory)
+        self.assertEqual(cache.get("J0001", "spool-2"), "IEF142I " * 100)
+        cache.put("J0001", "spool-2", "new")
+        self.assertEqual(cache.get("J0001", "spool-2"), "new")
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+    def test_evict_least_recently_used(self):
+        """The least recently used entries should be evicted when the cache is full."""
+        cache = SpoolCache(self.directory, max_size=10)
+        cache.put("J0001", "jcl", "1234")
+        cache.put("J0002", "jcl", "1234")
+        past = time.time() - 60
+        for name in os.listdir(self.directory):
+            os.utime(os.path.join(self.directory, name), (past, past))
+        cache.get("J0001", "jcl")
+        cache.put("J0003", "jcl", "1234")
+        self.assertIsNotNone(cache.get("J0001", "jcl"))
+        self.assertIsNone(cache.get("J0002", "jcl"))
+        self.assertIsNotNone(cache.get("J0003", "jcl"))
+
+    @mock.patch("requests.Session.send")
+    def test_completed_job_spool_is_cached(self, mock_send_request):
+        """The spool of a job in the OUTPUT status should only be retrieved once."""
+        mock_send_request.side_effect = self.send("OUTPUT")
+        jobs = Jobs(self.profile, spool_cache=SpoolCache(self.directory, compress=True))
+
+        for _ in range(2):
+            self.assertEqual(jobs.get_spool_files("J0001")[0].ddname, "JESMSGLG")
+            self.assertEqual(jobs.get_spool_file_contents("J0001", "2"), "records of 2 in J0001")
+            self.assertEqual(jobs.get_jcl_text("J0001"), "records of JCL in J0001")
+
+        self.assertEqual(mock_send_request.call_count, 4)
+
+    @mock.patch("requests.Session.send")
+    def test_spool_is_cached_by_unique_correlator(self, mock_send_request):
+        """The spool of a job identified by name and id should not be served for a later job with the same id."""
+        jobs = Jobs(self.profile, spool_cache=SpoolCache(self.directory))
+
+        mock_send_request.side_effect = self.send("OUTPUT", "J0001FIRST")
+        self.assertEqual(jobs.get_jcl_text("TESTJOB/JOB00001"), "records of JCL in J0001FIRST")
+        self.assertEqual(jobs.get_jcl_text("TESTJOB/JOB00001"), "records of JCL in J0001FIRST")
+        self.assertEqual(mock_send_request.call_count, 3)
+
+        mock_send_request.side_effect = self.send("OUTPUT", "J0001SECOND")
+        self.assertEqual(jobs.get_jcl_text("TESTJOB/JOB00001"), "records of JCL in J0001SECOND")
+        self.assertEqual(jobs.get_jcl_text("J0001FIRST"), "records of JCL in J0001FIRST")
+
+    @mock.patch("requests.Session.send")
+    def test_active_job_spool_is_not_cached(self, mock_send_request):
+        """The spool of a job that is still running should not be cached."""
+        mock_send_request.side_effect = self.send("ACTIVE")
+        jobs = Jobs(self.profile, spool_cache=SpoolCache(self.directory))
+
+        jobs.get_spool_file_contents("J0001", "2")
+        jobs.get_spool_file_contents("J0001", "2")
+
+        self.assertEqual(mock_send_request.call_count, 4)
+        self.assertEqual(os.listdir(self.directory), [])
+
+
+class TestJobWatcher(TestCase):
+    """JobWatcher class unit tests."""
+
+    def setUp(self):
+        """Setup fixtures for JobWatcher class."""
+        self.jobs = Jobs({"host": "mock-url.com", "user": "Username", "password": "Password", "port": 443})
+
+    @staticmethod
+    def snapshot(*jobs):
+        """Build a job list response."""
+        mock_response = mock.Mock(headers={"Content-Type": "application/json"}, status_code=200)
+        mock_response.json.return_value = [
+            {
+                "job-correlator": correlator,
+                "jobname": "TESTJOB",
+                "jobid": correlator,
+                "phase-name": phase,
+                "status": status,
+                "retcode": rc,
+            }
+            for correlator, phase, status, rc in jobs
+        ]
+        return mock_response
+
+    @mock.patch("requests.Session.send")
+    def test_poll_delivers_changes(self, mock_send_request):
+        """Test the changes between snapshots are delivered to the subscribers"""
+        mock_send_request.side_effect = [
+            self.snapshot(
+                ("J1", "Job is actively executing", "ACTIVE", None),
+                ("J2", "Job is on the hard copy queue", "OUTPUT", "CC 0000"),
+            ),
+            self.snapshot(
+                ("J1", "Job is on the hard copy queue", "OUTPUT", "CC 0004"),
+                ("J3", "Job is queued for execution", "INPUT", None),
+            ),
+            # The status of J2, which is no longer on the queue
+            mock.Mock(ok=False, status_code=400, text="", request=mock.Mock(url="", headers={}, body=None)),
+        ]
+        watcher = JobWatcher(self.jobs, owner="IBMUSER")
+        received, completed = [], []
+        watcher.subscribe(received.append)
+        watcher.subscribe(completed.append, [JobEventType.RETCODE_SET])
+        watcher.subscribe(mock.Mock(side_effect=RuntimeError("subscriber error")))
+
+        self.assertEqual(watcher.poll(), [])
+        events = watcher.poll()
+
+        self.assertEqual(
+            [(event.type, event.job.job_correlator) for event in events],
+            [
+                (JobEventType.PHASE_CHANGED, "J1"),
+                (JobEventType.RETCODE_SET, "J1"),
+                (JobEventType.NEW, "J3"),
+                (JobEventType.PURGED, "J2"),
+            ],
+        )
+        self.assertEqual(received, events)
+        self.assertEqual([event.job.retcode for event in completed], ["CC 0004"])
+        self.assertEqual(events[1].previous.status, "ACTIVE")
+        self.assertEqual(parse_qs(urlparse(mock_send_request.call_args_list[1][0][0].url).query)["owner"], ["IBMUSER"])
+        self.assertTrue(mock_send_request.call_args[0][0].url.endswith("/TESTJOB%2FJ2"))
+
+    @mock.patch("requests.Session.send")
+    def test_poll_reports_jobs_leaving_filters(self, mock_send_request):
+        """Test a job that no longer matches the filters is not reported as purged"""
+        status = mock.Mock(headers={"Content-Type": "application/json"}, status_code=200)
+        status.json.return_value = {"job-correlator": "J1", "jobname": "TESTJOB", "jobid": "J1", "status": "OUTPUT"}
+        mock_send_request.side_effect = [
+            self.snapshot(("J1", "Job is actively executing", "ACTIVE", None)),
+            self.snapshot(),
+            status,
+        ]
+        watcher = JobWatcher(self.jobs, status="ACTIVE")
+
+        watcher.poll()
+        events = watcher.poll()
+
+        self.assertEqual([event.type for event in events], [JobEventType.LEFT_FILTER])
+        self.assertEqual(events[0].job.status, "OUTPUT")
+        self.assertEqual(events[0].previous.status, "ACTIVE")
+
+    @mock.patch("requests.Session.send")
+    def test_poll_keeps_snapshot_on_failure(self, mock_send_request):
+        """Test a job whose status cannot be retrieved is checked again by the next poll"""
+        mock_send_request.side_effect = [
+            self.snapshot(("J1", "Job is actively executing", "ACTIVE", None)),
+            self.snapshot(),
+            mock.Mock(ok=False, status_code=500, text="", request=mock.Mock(url="", headers={}, body=None)),
+            self.snapshot(),
+            mock.Mock(ok=False, status_code=404, text="", request=mock.Mock(url="", headers={}, body=None)),
+        ]
+        watcher = JobWatcher(self.jobs)
+
+        watcher.poll()
+        with self.assertRaises(RequestFailed):
+            watcher.poll()
+        self.assertEqual([event.type for event in watcher.poll()], [JobEventType.PURGED])
+
+    @mock.patch("requests.Session.send")
+    def test_background_polling(self, mock_send_request):
+        """Test the watcher polls in the background until stopped"""
+        mock_send_request.return_value = self.snapshot()
+        polled = threading.Event()
+
+        def count(*args, **kwargs):
+            if mock_send_request.call_count >= 3:
+                polled.set()
+            return mock_send_request.return_value
+
+        mock_send_request.side_effect = count
+        with JobWatcher(self.jobs, interval=0.01):
+            self.assertTrue(polled.wait(5))
+        calls = mock_send_request.call_count
+        time.sleep(0.05)
+        self.assertEqual(mock_send_request.call_count, calls)
@@ -1,6 +1,7 @@
 """Unit tests for the Zowe Python SDK z/OS TSO package."""
 
 from unittest import TestCase, mock
+from urllib.parse import parse_qs, urlparse
 
 from zowe.zos_tso_for_zowe_sdk import Tso
 
@@ -72,3 +73,127 @@ class TestTsoClass(TestCase):
         result = Tso(self.test_profile).issue_command("TIME").tso_messages
         self.assertEqual(result, expected)
         self.assertEqual(mock_send_request.call_count, len(fake_responses))
+
+
+class TestTsoSession(TestCase):
+    """TsoSession class unit tests."""
+
+    def setUp(self):
+        """Setup fixtures for TsoSession class."""
+        self.test_profile = {
+            "host": "mock-url.com",
+            "user": "Username",
+            "password": "Password",
+            "port": 443,
+            "rejectUnauthorized": True,
+        }
+
+    @staticmethod
+    def response(body):
+        """Return a mock z/OSMF response with a JSON body."""
+        return mock.Mock(headers={"Content-Type": "application/json"}, status_code=200, json=lambda: body)
+
+    @staticmethod
+    def messages(*lines, prompt=False):
+        """Return the tsoData of a response with the given messages."""
+        data = [{"TSO MESSAGE": {"DATA": line}} for line in lines]
+        return data + [{"TSO PROMPT": {"VERSION": "0100", "HIDDEN": "FALSE"}}] if prompt else data
+
+    @mock.patch("requests.Session.send")
+    def test_run_all_uses_one_address_space(self, mock_send_request):
+        """Commands run in the same session should be started and ended once, with their output kept apart."""
+        mock_send_request.side_effect = [
+            self.response({"servletKey": "KEY-1", "tsoData": self.messages("LOGON")}),
+            self.response({"servletKey": "KEY-1", "tsoData": self.messages("READY", prompt=True)}),
+            self.response({"servletKey": "KEY-1"}),
+            self.response({"servletKey": "KEY-1", "tsoData": self.messages("TIME-1")}),
+            self.response({"servletKey": "KEY-1", "tsoData": self.messages("READY", prompt=True)}),
+            self.response({"servletKey": "KEY-1"}),
+            self.response({"servletKey": "KEY-1", "tsoData": self.messages("USER", "READY", prompt=True)}),
+            self.response({"servletKey": "KEY-1"}),
+        ]
+
+        result = Tso(self.test_profile).issue_commands(["TIME", "LISTUSER"], proc="MYPROC", acct="ACCT1")
+
+        self.assertEqual(result, [["TIME-1", "READY"], ["USER", "READY"]])
+        start_params = parse_qs(urlparse(mock_send_request.call_args_list[0][0][0].url).query)
+        self.assertEqual((start_params["proc"], start_params["acct"]), (["MYPROC"], ["ACCT1"]))
+        methods = [call[0][0].method for call in mock_send_request.call_args_list]
+        self.assertEqual(methods, ["POST", "GET", "PUT", "GET", "GET", "PUT", "GET", "DELETE"])
+        self.assertTrue(mock_send_request.call_args_list[-1][0][0].url.endswith("/KEY-1"))
+
+    @mock.patch("requests.Session.send")
+    def test_stream_discards_unread_output_of_previous_command(self, mock_send_request):
+        """Sending a command should first read the rest of the output of the previous one."""
+        mock_send_request.side_effect = [
+            self.response({"servletKey": "KEY-1", "tsoData": self.messages("READY", prompt=True)}),
+            self.response({"servletKey": "KEY-1"}),
+            self.response({"servletKey": "KEY-1", "tsoData": self.messages("FIRST-1")}),
+            self.response({"servletKey": "KEY-1", "tsoData": self.messages("FIRST-2", prompt=True)}),
+            self.response({"servletKey": "KEY-1"}),
+            self.response({"servletKey": "KEY-1", "tsoData": self.messages("SECOND", prompt=True)}),
+            self.response({"servletKey": "KEY-1"}),
+        ]
+
+        with Tso(self.test_profile).tso_session() as session:
+            self.assertEqual(next(session.stream("FIRST")), "FIRST-1")
+            self.assertEqual(session.run("SECOND"), ["SECOND"])
+
+        self.assertEqual(mock_send_request.call_count, 7)
+        self.assertIsNone(session.session_key)
+
+    @mock.patch("requests.Session.send")
+    def test_stream_times_out(self, mock_send_request):
+        """A command that does not complete in time should raise TimeoutError and the session should still end."""
+        mock_send_request.side_effect = [
+            self.response({"servletKey": "KEY-1", "tsoData": self.messages("READY", prompt=True)}),
+            self.response({"servletKey": "KEY-1"}),
+            self.response({"servletKey": "KEY-1"}),
+        ]
+
+        with self.assertRaises(TimeoutError):
+            with Tso(self.test_profile).tso_session(command_timeout=-1) as session:
+                session.run("WAIT")
+
+        self.assertEqual(mock_send_request.call_args_list[-1][0][0].method, "DELETE")
+
+    def test_stream_requires_open_session(self):
+        """Sending a command before opening the session should raise ValueError."""
+        with self.assertRaises(ValueError):
+            Tso(self.test_profile).tso_session().run("TIME")
+
+    @mock.patch("requests.Session.send")
+    def test_stream_command_yields_each_poll(self, mock_send_request):
+        """Streaming a command should yield the messages of a poll before sending the next one."""
+        mock_send_request.side_effect = [
+            self.response({"servletKey": "KEY-1", "tsoData": self.messages("READY", prompt=True)}),
+            self.response({"servletKey": "KEY-1"}),
+            self.response({"servletKey": "KEY-1", "tsoData": self.messages("LINE-1", "LINE-2")}),
+            self.response({"servletKey": "KEY-1", "tsoData": self.messages("LINE-3", prompt=True)}),
+            self.response({"servletKey": "KEY-1"}),
+        ]
+
+        stream = Tso(self.test_profile).stream_command("LISTCAT")
+        self.assertEqual(mock_send_request.call_count, 0)
+        self.assertEqual(next(stream), "LINE-1")
+        self.assertEqual(mock_send_request.call_count, 3)
+        self.assertEqual(list(stream), ["LINE-2", "LINE-3"])
+        self.assertEqual(mock_send_request.call_count, 5)
+        self.assertEqual(mock_send_request.call_args_list[-1][0][0].method, "DELETE")
+
+    @mock.patch("requests.Session.send")
+    def test_stream_command_ends_session_when_closed(self, mock_send_request):
+        """Closing the stream before the command completes should end the session."""
+        mock_send_request.side_effect = [
+            self.response({"servletKey": "KEY-1", "tsoData": self.messages("READY", prompt=True)}),
+            self.response({"servletKey": "KEY-1"}),
+            self.response({"servletKey": "KEY-1", "tsoData": self.messages("LINE-1")}),
+            self.response({"servletKey": "KEY-1"}),
+        ]
+
+        stream = Tso(self.test_profile).stream_command("LISTCAT")
+        self.assertEqual(next(stream), "LINE-1")
+        stream.close()
+
+        self.assertEqual(mock_send_request.call_count, 4)
+        self.assertEqual(mock_send_request.call_args_list[-1][0][0].method, "DELETE")